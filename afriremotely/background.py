@@ -0,0 +1,24 @@
+# afriremotely/background.py
+import threading
+
+from django.conf import settings
+from django.db import connections
+
+
+def run_in_background(func, *args):
+    """Run ``func(*args)`` on a daemon thread so the calling request does not wait for it.
+
+    The thread closes its own database connections when done. With
+    ``BACKGROUND_TASKS_EAGER`` set (as in tests) the call runs inline instead.
+    """
+    if getattr(settings, 'BACKGROUND_TASKS_EAGER', False):
+        func(*args)
+        return
+
+    def run():
+        try:
+            func(*args)
+        finally:
+            connections.close_all()
+
+    threading.Thread(target=run, daemon=True).start()
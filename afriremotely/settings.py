@@ -66,6 +66,27 @@ REST_FRAMEWORK = {
     'PAGE_SIZE': 10
 }
 
+# Per-process LRU of jobs-for-me rankings (see matching/cache.py)
+MATCH_CACHE_MAX_ENTRIES = 10000
+# Ranked matches cached per seeker; deeper cursors are scored on demand
+MATCH_CACHE_MAX_RANKED = 1000
+
+# Seconds an anonymous job listing/detail response stays cached (see jobs/cache.py)
+JOB_RESPONSE_CACHE_TIMEOUT = 300
+
+# Seconds facet counts stay cached per filter combination; 0 disables caching
+JOB_FACETS_CACHE_TIMEOUT = 300
+
+# Values kept per autocomplete field, and seconds before a full rebuild (see jobs/autocomplete.py)
+AUTOCOMPLETE_MAX_ENTRIES = 5000
+AUTOCOMPLETE_MAX_AGE = 300
+
+# Run per-process refreshes (idf weights, autocomplete) inline instead of on a thread
+BACKGROUND_TASKS_EAGER = False
+
+# Seconds a successful apply is replayed for a repeated Idempotency-Key header
+IDEMPOTENCY_KEY_TIMEOUT = 60 * 60
+
 SIMPLE_JWT = {
     'ACCESS_TOKEN_LIFETIME': timedelta(days=1),
     'REFRESH_TOKEN_LIFETIME': timedelta(days=7),
@@ -0,0 +1,37 @@
+# afriremotely/streaming.py
+import csv
+import json
+
+STREAM_FORMATS = ('csv', 'jsonl')
+CONTENT_TYPES = {'csv': 'text/csv', 'jsonl': 'application/x-ndjson'}
+
+
+class _Echo:
+    """File-like object whose ``write`` hands the line back for streaming."""
+
+    def write(self, value):
+        return value
+
+
+def stream_rows(file_type, fields, rows):
+    """Yield ``rows`` (dicts keyed by ``fields``) as CSV lines or JSON Lines, one at a time.
+
+    Lists and dicts become JSON in CSV cells, and datetimes become ISO 8601.
+    """
+    if file_type == 'csv':
+        writer = csv.writer(_Echo())
+        yield writer.writerow(fields)
+        for row in rows:
+            yield writer.writerow(
+                json.dumps(value) if isinstance(value, (list, dict))
+                else value.isoformat() if hasattr(value, 'isoformat')
+                else value
+                for value in (row[field] for field in fields)
+            )
+        return
+
+    for row in rows:
+        yield json.dumps(
+            {field: row[field].isoformat() if hasattr(row[field], 'isoformat') else row[field]
+             for field in fields}
+        ) + '\n'
@@ -0,0 +1,90 @@
+# afriremotely/testing.py
+import re
+from contextlib import contextmanager
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+# "SCAN jobs_job" reads every row; "SCAN jobs_job USING INDEX ..." walks a whole index;
+# only "SEARCH ..." steps seek into an index
+_SCAN = re.compile(r'\bSCAN (\w+)(?: AS \w+)?(.*)$')
+
+
+class QueryPlanAssertionsMixin:
+    """TestCase mixin that checks SQLite query plans of the queries a block issues."""
+
+    # Tables that must never be read with a full table scan
+    watched_tables = ('jobs_job',)
+
+    def explain(self, sql):
+        with connection.cursor() as cursor:
+            cursor.execute(f'EXPLAIN QUERY PLAN {sql}')
+            return [row[-1] for row in cursor.fetchall()]
+
+    def full_scans(self, plan, sql=''):
+        """Steps that read a watched table without searching an index.
+
+        ``SCAN ... USING INDEX`` still walks the whole index and is only accepted
+        for an unfiltered ``ORDER BY ... LIMIT``, which stops after the page.
+        """
+        sql = sql.upper()
+        bounded_walk = ' WHERE ' not in sql and ' LIMIT ' in sql
+        scans = []
+        for step in plan:
+            match = _SCAN.search(step)
+            if not match or match.group(1) not in self.watched_tables:
+                continue
+            if bounded_walk and 'INDEX' in match.group(2):
+                continue
+            scans.append(step)
+        return scans
+
+    @contextmanager
+    def assertNoFullTableScan(self, exempt=()):
+        """Fail if any SELECT run inside the block scans a watched table instead of searching an index.
+
+        ``exempt`` lists SQL fragments naming the queries whose scans are known
+        exceptions, such as an ``icontains`` filter (``LIKE '%...%'``) that no
+        B-tree index can serve. Every fragment must match a query that does
+        scan, so an exemption cannot outlive the query it was written for.
+        """
+        if connection.vendor != 'sqlite':
+            self.skipTest('EXPLAIN QUERY PLAN checks are SQLite-specific')
+
+        with CaptureQueriesContext(connection) as queries:
+            yield queries
+
+        failures = []
+        unused = list(exempt)
+        for query in queries.captured_queries:
+            sql = query['sql']
+            if not sql.lstrip().upper().startswith('SELECT'):
+                continue
+            plan = self.explain(sql)
+            if not self.full_scans(plan, sql):
+                continue
+            matched = [fragment for fragment in exempt if fragment in sql]
+            if matched:
+                unused = [fragment for fragment in unused if fragment not in matched]
+            else:
+                failures.append(f'{sql}\n    ' + '\n    '.join(plan))
+        if unused:
+            failures.append('Exempted queries that ran without a full scan: ' + ', '.join(map(repr, unused)))
+        if failures:
+            self.fail('Full table scan in:\n' + '\n'.join(failures))
+
+
+class QueryCountAssertionsMixin:
+    """APITestCase mixin that locks in how many queries a single request issues."""
+
+    def assertRequestQueries(self, expected, url, method='get', **kwargs):
+        """Issue one request through ``self.client`` and fail unless it runs ``expected`` queries."""
+        with CaptureQueriesContext(connection) as queries:
+            response = getattr(self.client, method)(url, **kwargs)
+
+        if len(queries) != expected:
+            executed = '\n'.join(
+                f'{index}. {query["sql"]}' for index, query in enumerate(queries.captured_queries, start=1)
+            )
+            self.fail(f'{method.upper()} {url} ran {len(queries)} queries, expected {expected}:\n{executed}')
+        return response
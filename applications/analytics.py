@@ -0,0 +1,162 @@
+# applications/analytics.py
+from collections import defaultdict
+from datetime import datetime, time, timedelta
+
+from django.db import transaction
+from django.db.models import Count, DurationField, ExpressionWrapper, F, Max, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from .models import Application, ApplicationDailyRollup, ApplicationStatusEvent
+
+STATUSES = [value for value, _ in Application.STATUS_CHOICES]
+# Statuses whose entries, over applications received, are reported as conversion rates
+CONVERSION_STATUSES = ('shortlisted', 'hired')
+
+_TIME_TO_STATUS = ExpressionWrapper(
+    F('created_at') - F('application__applied_at'), output_field=DurationField()
+)
+
+
+def day_start(day):
+    """Aware datetime at midnight opening ``day`` in the current time zone."""
+    return timezone.make_aware(datetime.combine(day, time.min))
+
+
+def _seconds(value):
+    if value is None:
+        return 0
+    if isinstance(value, timedelta):
+        return int(value.total_seconds())
+    # Some backends hand back the raw microsecond sum
+    return int(value) // 1_000_000
+
+
+def rollup_days(start, end, batch_size=1000):
+    """Recompute the rollup rows for status changes made on days ``start``..``end`` inclusive.
+
+    Rows come from the append-only status events, so a complete day never
+    changes once rolled up. One grouped query per call; the old rows for the
+    range are replaced in the same transaction so readers never see a
+    half-written day.
+    """
+    rows = (
+        ApplicationStatusEvent.objects.order_by()
+        .filter(created_at__gte=day_start(start), created_at__lt=day_start(end + timedelta(days=1)))
+        .annotate(day=TruncDate('created_at'))
+        .values('job_id', 'recruiter_id', 'day', 'to_status')
+        .annotate(applications=Count('id'), time_to_status=Sum(_TIME_TO_STATUS))
+    )
+    rollups = [
+        ApplicationDailyRollup(
+            recruiter_id=row['recruiter_id'],
+            job_id=row['job_id'],
+            day=row['day'],
+            status=row['to_status'],
+            applications=row['applications'],
+            seconds_to_status=_seconds(row['time_to_status']),
+        )
+        for row in rows
+    ]
+    with transaction.atomic():
+        ApplicationDailyRollup.objects.filter(day__range=(start, end)).delete()
+        ApplicationDailyRollup.objects.bulk_create(rollups, batch_size=batch_size)
+    return len(rollups)
+
+
+def _grouped(rows, to_seconds=_seconds):
+    """Fold ``(job_id, status, n, seconds)`` rows into ``{job_id: {status: [count, seconds]}}``."""
+    grouped = defaultdict(lambda: defaultdict(lambda: [0, 0]))
+    for row in rows:
+        bucket = grouped[row['job_id']][row['status']]
+        bucket[0] += row['n'] or 0
+        bucket[1] += to_seconds(row['seconds'])
+    return grouped
+
+
+def pipeline(recruiter, start=None, end=None, jobs_limit=50):
+    """Pipeline activity across a recruiter's jobs between ``start`` and ``end``.
+
+    Counts the applications that entered each status during the range (a
+    submission enters 'submitted'), from the status events. Complete days come
+    from the daily rollup; days after the newest rolled-up day are aggregated
+    live from the events. Both are grouped SQL aggregates, so the cost tracks
+    the number of jobs and days, not applications.
+    """
+    today = timezone.localdate()
+    end = min(end or today, today)
+
+    rollups = ApplicationDailyRollup.objects.filter(recruiter=recruiter)
+    if start:
+        rollups = rollups.filter(day__gte=start)
+    rolled_through = rollups.filter(day__lte=end).aggregate(last=Max('day'))['last']
+
+    grouped = defaultdict(lambda: defaultdict(lambda: [0, 0]))
+    if rolled_through is not None:
+        grouped.update(_grouped(
+            rollups.filter(day__lte=rolled_through).values('job_id', 'status').annotate(
+                n=Sum('applications'), seconds=Sum('seconds_to_status')
+            ),
+            to_seconds=lambda value: value or 0,
+        ))
+
+    live_start = rolled_through + timedelta(days=1) if rolled_through else start
+    live = ApplicationStatusEvent.objects.order_by().filter(
+        recruiter=recruiter, created_at__lt=day_start(end + timedelta(days=1))
+    )
+    if live_start:
+        live = live.filter(created_at__gte=day_start(live_start))
+    for job_id, statuses in _grouped(
+        live.values('job_id', status=F('to_status')).annotate(n=Count('id'), seconds=Sum(_TIME_TO_STATUS))
+    ).items():
+        for status, (count, seconds) in statuses.items():
+            bucket = grouped[job_id][status]
+            bucket[0] += count
+            bucket[1] += seconds
+
+    return _summarize(grouped, start, end, jobs_limit)
+
+
+def _summarize(grouped, start, end, jobs_limit):
+    from jobs.models import Job
+
+    status_totals = dict.fromkeys(STATUSES, 0)
+    status_seconds = dict.fromkeys(STATUSES, 0)
+    per_job = []
+    for job_id, statuses in grouped.items():
+        counts = {status: statuses[status][0] if status in statuses else 0 for status in STATUSES}
+        if not any(counts.values()):
+            continue
+        for status in STATUSES:
+            status_totals[status] += counts[status]
+            status_seconds[status] += statuses[status][1] if status in statuses else 0
+        received = counts['submitted']
+        per_job.append({
+            'job_id': job_id,
+            'applications': received,
+            'by_status': counts,
+            'conversion': {
+                name: round(counts[name] / received, 4) if received else 0.0
+                for name in CONVERSION_STATUSES
+            },
+        })
+
+    per_job.sort(key=lambda job: (-job['applications'], -sum(job['by_status'].values()), job['job_id']))
+    per_job = per_job[:jobs_limit]
+    titles = dict(Job.objects.filter(id__in=[job['job_id'] for job in per_job]).values_list('id', 'title'))
+    for job in per_job:
+        job['title'] = titles.get(job['job_id'], '')
+
+    return {
+        'start': start.isoformat() if start else None,
+        'end': end.isoformat(),
+        'total_applications': status_totals['submitted'],
+        'by_status': [{'status': status, 'count': status_totals[status]} for status in STATUSES],
+        # Mean days from applying to entering each status, over the changes in the range
+        'avg_days_to_status': {
+            status: round(status_seconds[status] / status_totals[status] / 86400, 2)
+            for status in STATUSES
+            if status != 'submitted' and status_totals[status]
+        },
+        'jobs': per_job,
+    }
@@ -0,0 +1,86 @@
+# applications/counters.py
+from collections import Counter, defaultdict
+
+from django.db.models import Count, F
+
+from .models import Application, JobApplicationStats
+
+STATUS_FIELDS = [value for value, _ in Application.STATUS_CHOICES]
+COUNTER_FIELDS = ['total'] + STATUS_FIELDS
+
+
+def apply_count_changes(job_id, changes, create=True):
+    """Add ``{counter: delta}`` to one job's counters, creating its row on first use.
+
+    Pass ``create=False`` when the job may be mid-delete, so no row is
+    recreated for it.
+    """
+    updates = {field: F(field) + delta for field, delta in changes.items() if delta}
+    if not updates:
+        return
+    if not JobApplicationStats.objects.filter(job_id=job_id).update(**updates) and create:
+        JobApplicationStats.objects.bulk_create([JobApplicationStats(job_id=job_id)], ignore_conflicts=True)
+        JobApplicationStats.objects.filter(job_id=job_id).update(**updates)
+
+
+def application_added(job_id, status):
+    apply_count_changes(job_id, {'total': 1, status: 1})
+
+
+def application_removed(job_id, status):
+    # Deleting a job cascades to its applications and its counter row alike
+    apply_count_changes(job_id, {'total': -1, status: -1}, create=False)
+
+
+def status_changed(job_id, old_status, new_status):
+    if old_status != new_status:
+        apply_count_changes(job_id, {old_status: -1, new_status: 1})
+
+
+def statuses_changed(moves, new_status):
+    """Apply many status moves, ``[(job_id, old_status), ...]``, with one UPDATE per job."""
+    per_job = defaultdict(Counter)
+    for job_id, old_status in moves:
+        if old_status != new_status:
+            per_job[job_id][old_status] -= 1
+            per_job[job_id][new_status] += 1
+    for job_id, changes in per_job.items():
+        apply_count_changes(job_id, changes)
+
+
+def expected_counts(job_ids=None):
+    """Recompute ``{job_id: {counter: n}}`` from the applications table in one grouped query."""
+    applications = Application.objects.order_by()
+    if job_ids is not None:
+        applications = applications.filter(job_id__in=job_ids)
+    counts = defaultdict(lambda: dict.fromkeys(COUNTER_FIELDS, 0))
+    for job_id, status, n in applications.values_list('job_id', 'status').annotate(n=Count('id')):
+        counts[job_id][status] = n
+        counts[job_id]['total'] += n
+    return counts
+
+
+def reconcile_counts(dry_run=False, batch_size=1000):
+    """Rewrite every drifted counter row; returns the ids of the jobs that were repaired."""
+    expected = expected_counts()
+    stored = {
+        row['job_id']: row
+        for row in JobApplicationStats.objects.values('job_id', *COUNTER_FIELDS).iterator()
+    }
+
+    drifted = []
+    for job_id in set(expected) | set(stored):
+        want = expected.get(job_id, dict.fromkeys(COUNTER_FIELDS, 0))
+        have = stored.get(job_id)
+        if have is None or any(have[field] != want[field] for field in COUNTER_FIELDS):
+            drifted.append(JobApplicationStats(job_id=job_id, **want))
+
+    if drifted and not dry_run:
+        JobApplicationStats.objects.bulk_create(
+            drifted,
+            batch_size=batch_size,
+            update_conflicts=True,
+            unique_fields=['job'],
+            update_fields=COUNTER_FIELDS,
+        )
+    return sorted(stats.job_id for stats in drifted)
@@ -0,0 +1,29 @@
+# applications/history.py
+from .models import ApplicationStatusEvent
+
+EVENT_BATCH_SIZE = 1000
+
+
+def status_event(application_id, job_id, recruiter_id, from_status, to_status, changed_by=None, at=None):
+    """Build (not save) the event for one status change; ``from_status`` is '' on submission."""
+    event = ApplicationStatusEvent(
+        application_id=application_id,
+        job_id=job_id,
+        recruiter_id=recruiter_id,
+        changed_by=changed_by,
+        from_status=from_status or '',
+        to_status=to_status,
+    )
+    if at is not None:
+        event.created_at = at
+    return event
+
+
+def record_events(events, batch_size=EVENT_BATCH_SIZE):
+    """Append events with one multi-row INSERT per ``batch_size`` rows.
+
+    Call inside the transaction that makes the change, so the history and the
+    status can never disagree.
+    """
+    if events:
+        ApplicationStatusEvent.objects.bulk_create(events, batch_size=batch_size)
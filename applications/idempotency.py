@@ -0,0 +1,46 @@
+# applications/idempotency.py
+import hashlib
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework import status
+from rest_framework.response import Response
+
+IDEMPOTENCY_HEADER = 'Idempotency-Key'
+MAX_KEY_LENGTH = 255
+
+
+def idempotent(view_method):
+    """Replay the stored response when a request repeats its ``Idempotency-Key``.
+
+    Successful responses are kept for ``IDEMPOTENCY_KEY_TIMEOUT`` seconds, keyed
+    by user, path and key, so a retried request gets the original result
+    instead of an "already applied" error. Requests without the header are
+    not affected.
+    """
+    @wraps(view_method)
+    def wrapper(self, request, *args, **kwargs):
+        key = request.headers.get(IDEMPOTENCY_HEADER)
+        if not key:
+            return view_method(self, request, *args, **kwargs)
+        if len(key) > MAX_KEY_LENGTH:
+            return Response(
+                {'error': f'{IDEMPOTENCY_HEADER} must be at most {MAX_KEY_LENGTH} characters'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        digest = hashlib.sha1(f'{request.path}:{key}'.encode(), usedforsecurity=False).hexdigest()
+        cache_key = f'applications:idempotency:{request.user.pk}:{digest}'
+        stored = cache.get(cache_key)
+        if stored is not None:
+            status_code, data = stored
+            response = Response(data, status=status_code)
+            response['Idempotent-Replayed'] = 'true'
+            return response
+
+        response = view_method(self, request, *args, **kwargs)
+        if status.is_success(response.status_code):
+            cache.set(cache_key, (response.status_code, response.data), timeout=settings.IDEMPOTENCY_KEY_TIMEOUT)
+        return response
+    return wrapper
@@ -0,0 +1,19 @@
+# applications/management/commands/reconcile_application_counts.py
+from django.core.management.base import BaseCommand
+
+from applications.counters import reconcile_counts
+
+
+class Command(BaseCommand):
+    help = 'Recompute per-job application counters from the applications table and repair drift'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dry-run', action='store_true', help='Report drifted jobs without writing')
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        repaired = reconcile_counts(dry_run=options['dry_run'], batch_size=options['batch_size'])
+        verb = 'Found' if options['dry_run'] else 'Repaired'
+        self.stdout.write(self.style.SUCCESS(f'{verb} drifted counters for {len(repaired)} jobs'))
+        if repaired and options['verbosity'] > 1:
+            self.stdout.write('Job ids: ' + ', '.join(map(str, repaired)))
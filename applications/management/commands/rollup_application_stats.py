@@ -0,0 +1,42 @@
+# applications/management/commands/rollup_application_stats.py
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db.models import Max, Min
+from django.utils import timezone
+
+from applications.analytics import rollup_days
+from applications.models import ApplicationDailyRollup, ApplicationStatusEvent
+
+
+class Command(BaseCommand):
+    help = 'Roll up application status changes into the daily table used by the pipeline analytics endpoint'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int,
+                            help='Recompute this many complete days before today instead of only new days')
+        parser.add_argument('--all', action='store_true', help='Recompute every day since the first status change')
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        # Today is still filling up, so it is always aggregated live instead
+        end = timezone.localdate() - timedelta(days=1)
+        if options['days']:
+            start = end - timedelta(days=max(options['days'], 1) - 1)
+        else:
+            # Status events are append-only, so rolled-up days never need redoing
+            last = None if options['all'] else ApplicationDailyRollup.objects.aggregate(last=Max('day'))['last']
+            if last is not None:
+                start = last + timedelta(days=1)
+            else:
+                first = ApplicationStatusEvent.objects.aggregate(first=Min('created_at'))['first']
+                if first is None:
+                    self.stdout.write('No status changes to roll up')
+                    return
+                start = timezone.localdate(first)
+
+        if start > end:
+            self.stdout.write('Nothing to roll up yet')
+            return
+        rows = rollup_days(start, end, batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'Wrote {rows} rollup rows for {start} to {end}'))
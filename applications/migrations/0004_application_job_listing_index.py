@@ -0,0 +1,24 @@
+# Generated by Django 5.2.8 on 2026-10-18 15:18
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0003_alter_application_id'),
+        ('jobs', '0007_job_listing_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='application',
+            options={'ordering': ['-applied_at', '-id']},
+        ),
+        migrations.AddIndex(
+            model_name='application',
+            index=models.Index(fields=['job', 'applied_at', 'id'], name='application_job_id_11becc_idx'),
+        ),
+    ]
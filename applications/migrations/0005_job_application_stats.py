@@ -0,0 +1,42 @@
+# Generated by Django 5.2.8 on 2026-10-18 15:21
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def backfill_application_stats(apps, schema_editor):
+    Application = apps.get_model('applications', 'Application')
+    JobApplicationStats = apps.get_model('applications', 'JobApplicationStats')
+
+    stats = {}
+    rows = Application.objects.order_by().values_list('job_id', 'status').annotate(n=Count('id'))
+    for job_id, status, n in rows:
+        row = stats.setdefault(job_id, JobApplicationStats(job_id=job_id))
+        setattr(row, status, getattr(row, status) + n)
+        row.total += n
+    JobApplicationStats.objects.bulk_create(stats.values(), batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0004_application_job_listing_index'),
+        ('jobs', '0007_job_listing_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JobApplicationStats',
+            fields=[
+                ('job', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='application_stats', serialize=False, to='jobs.job')),
+                ('total', models.IntegerField(default=0)),
+                ('submitted', models.IntegerField(default=0)),
+                ('viewed', models.IntegerField(default=0)),
+                ('shortlisted', models.IntegerField(default=0)),
+                ('rejected', models.IntegerField(default=0)),
+                ('hired', models.IntegerField(default=0)),
+            ],
+        ),
+        migrations.RunPython(backfill_application_stats, migrations.RunPython.noop),
+    ]
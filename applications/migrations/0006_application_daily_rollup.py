@@ -0,0 +1,33 @@
+# Generated by Django 5.2.8 on 2026-10-18 15:24
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0005_job_application_stats'),
+        ('jobs', '0007_job_listing_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ApplicationDailyRollup',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('status', models.CharField(choices=[('submitted', 'Submitted'), ('viewed', 'Viewed'), ('shortlisted', 'Shortlisted'), ('rejected', 'Rejected'), ('hired', 'Hired')], max_length=20)),
+                ('applications', models.IntegerField(default=0)),
+                ('seconds_to_status', models.BigIntegerField(default=0)),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='application_rollups', to='jobs.job')),
+                ('recruiter', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='application_rollups', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['recruiter', 'day'], name='application_recruit_360a6c_idx'), models.Index(fields=['day'], name='application_day_ffb195_idx')],
+                'constraints': [models.UniqueConstraint(fields=('job', 'day', 'status'), name='unique_application_rollup')],
+            },
+        ),
+    ]
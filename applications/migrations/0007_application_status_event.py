@@ -0,0 +1,62 @@
+# Generated by Django 5.2.8 on 2026-10-18 15:27
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+def backfill_status_events(apps, schema_editor):
+    """Seed each existing application's history with its submission and, if it moved on, its current status."""
+    Application = apps.get_model('applications', 'Application')
+    ApplicationStatusEvent = apps.get_model('applications', 'ApplicationStatusEvent')
+
+    events = []
+    rows = Application.objects.order_by('id').values_list(
+        'id', 'job_id', 'job__created_by_id', 'job_seeker_id', 'status', 'applied_at', 'updated_at'
+    )
+    for application_id, job_id, recruiter_id, seeker_id, status, applied_at, updated_at in rows.iterator(chunk_size=2000):
+        events.append(ApplicationStatusEvent(
+            application_id=application_id, job_id=job_id, recruiter_id=recruiter_id,
+            changed_by_id=seeker_id, from_status='', to_status='submitted', created_at=applied_at,
+        ))
+        if status != 'submitted':
+            # Intermediate steps were never recorded; only the latest one is known
+            events.append(ApplicationStatusEvent(
+                application_id=application_id, job_id=job_id, recruiter_id=recruiter_id,
+                from_status='submitted', to_status=status, created_at=updated_at,
+            ))
+        if len(events) >= 1000:
+            ApplicationStatusEvent.objects.bulk_create(events)
+            events = []
+    ApplicationStatusEvent.objects.bulk_create(events)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0006_application_daily_rollup'),
+        ('jobs', '0007_job_listing_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ApplicationStatusEvent',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('from_status', models.CharField(blank=True, choices=[('submitted', 'Submitted'), ('viewed', 'Viewed'), ('shortlisted', 'Shortlisted'), ('rejected', 'Rejected'), ('hired', 'Hired')], max_length=20)),
+                ('to_status', models.CharField(choices=[('submitted', 'Submitted'), ('viewed', 'Viewed'), ('shortlisted', 'Shortlisted'), ('rejected', 'Rejected'), ('hired', 'Hired')], max_length=20)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('application', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='status_events', to='applications.application')),
+                ('changed_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL)),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='jobs.job')),
+                ('recruiter', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='application_events', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['-created_at', '-id'],
+                'indexes': [models.Index(fields=['recruiter', '-created_at', '-id'], name='app_event_recruiter_latest'), models.Index(fields=['application', 'created_at', 'id'], name='app_event_history')],
+            },
+        ),
+        migrations.RunPython(backfill_status_events, migrations.RunPython.noop),
+    ]
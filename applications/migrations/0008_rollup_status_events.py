@@ -0,0 +1,20 @@
+# Generated by Django 5.2.8 on 2026-10-18 17:05
+
+from django.db import migrations
+
+
+def clear_rollups(apps, schema_editor):
+    """Rows grouped by applied day and current status; rollup_application_stats rebuilds them from the events."""
+    ApplicationDailyRollup = apps.get_model('applications', 'ApplicationDailyRollup')
+    ApplicationDailyRollup.objects.all().delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0007_application_status_event'),
+    ]
+
+    operations = [
+        migrations.RunPython(clear_rollups, migrations.RunPython.noop),
+    ]
@@ -1,5 +1,6 @@
 # applications/models.py
 from django.db import models
+from django.utils import timezone
 
 class Application(models.Model):
     STATUS_CHOICES = [
@@ -21,7 +22,100 @@ class Application(models.Model):
     
     class Meta:
         unique_together = ['job_seeker', 'job']
-        ordering = ['-applied_at']
+        ordering = ['-applied_at', '-id']
+        indexes = [
+            # Per-job applicant listings and exports, newest first
+            models.Index(fields=['job', 'applied_at', 'id']),
+        ]
+    
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remember the stored status so a later save() can move the job's counters
+        instance._loaded_status = instance.__dict__.get('status')
+        return instance
+    
+    def __str__(self):
+        return f"{self.job_seeker.full_name} → {self.job.title} ({self.status})"
+
+
+class JobApplicationStats(models.Model):
+    """Denormalized per-job application counters: a total plus one column per status.
+
+    Maintained in the same transaction as every application insert, status
+    change and delete (see applications/counters.py); the
+    reconcile_application_counts command repairs any drift.
+    """
+    job = models.OneToOneField(
+        'jobs.Job', on_delete=models.CASCADE, primary_key=True, related_name='application_stats'
+    )
+    total = models.IntegerField(default=0)
+    submitted = models.IntegerField(default=0)
+    viewed = models.IntegerField(default=0)
+    shortlisted = models.IntegerField(default=0)
+    rejected = models.IntegerField(default=0)
+    hired = models.IntegerField(default=0)
+    
+    def __str__(self):
+        return f"{self.job_id}: {self.total} applications"
+
+
+class ApplicationDailyRollup(models.Model):
+    """Applications that entered each status per job and day, rolled up from the status events.
+
+    Written by the rollup_application_stats command for complete days; the
+    pipeline analytics read these rows and aggregate only newer events live.
+    ``seconds_to_status`` sums the time from applying to entering the status.
+    """
+    recruiter = models.ForeignKey('users.User', on_delete=models.CASCADE, related_name='application_rollups')
+    job = models.ForeignKey('jobs.Job', on_delete=models.CASCADE, related_name='application_rollups')
+    day = models.DateField()
+    status = models.CharField(max_length=20, choices=Application.STATUS_CHOICES)
+    applications = models.IntegerField(default=0)
+    seconds_to_status = models.BigIntegerField(default=0)
+    
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['job', 'day', 'status'], name='unique_application_rollup'),
+        ]
+        indexes = [
+            models.Index(fields=['recruiter', 'day']),
+            models.Index(fields=['day']),
+        ]
+    
+    def __str__(self):
+        return f"{self.job_id} {self.day} {self.status}: {self.applications}"
+
+
+class ApplicationStatusEvent(models.Model):
+    """One row per status an application enters, starting with its submission.
+
+    Append-only: rows are inserted in the same transaction as the change they
+    record (see applications/history.py) and never updated. ``job`` and
+    ``recruiter`` are copied from the application so the recruiter activity
+    feed is read from a single index.
+    """
+    application = models.ForeignKey(Application, on_delete=models.CASCADE, related_name='status_events')
+    job = models.ForeignKey('jobs.Job', on_delete=models.CASCADE, related_name='+')
+    recruiter = models.ForeignKey('users.User', on_delete=models.CASCADE, related_name='application_events')
+    changed_by = models.ForeignKey('users.User', on_delete=models.SET_NULL, null=True, blank=True, related_name='+')
+    from_status = models.CharField(max_length=20, choices=Application.STATUS_CHOICES, blank=True)
+    to_status = models.CharField(max_length=20, choices=Application.STATUS_CHOICES)
+    created_at = models.DateTimeField(default=timezone.now)
+    
+    class Meta:
+        ordering = ['-created_at', '-id']
+        indexes = [
+            # Latest events across a recruiter's jobs
+            models.Index(fields=['recruiter', '-created_at', '-id'], name='app_event_recruiter_latest'),
+            # One application's history in order
+            models.Index(fields=['application', 'created_at', 'id'], name='app_event_history'),
+        ]
+    
+    def save(self, *args, **kwargs):
+        if not self._state.adding:
+            raise ValueError('Application status events are append-only')
+        super().save(*args, **kwargs)
     
     def __str__(self):
-        return f"{self.job_seeker.full_name} → {self.job.title} ({self.status})"
\ No newline at end of file
+        return f"{self.application_id}: {self.from_status or '-'} → {self.to_status}"
@@ -0,0 +1,62 @@
+# applications/pagination.py
+from django.db.models import Count, Window
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+
+
+class WindowCountPagination(PageNumberPagination):
+    """Page-number pagination whose total comes from the page query itself.
+
+    ``COUNT(*) OVER ()`` is evaluated alongside the LIMIT/OFFSET page, so a page
+    and its total cost one query instead of a page query plus a ``COUNT(*)``.
+    """
+    page_size = 50
+    page_size_query_param = 'page_size'
+    max_page_size = 200
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        page_size = self.get_page_size(request)
+        try:
+            self.number = int(request.query_params.get(self.page_query_param, 1))
+        except ValueError:
+            self.number = 0
+        if self.number < 1:
+            raise NotFound('Invalid page.')
+
+        offset = (self.number - 1) * page_size
+        page = list(
+            queryset.annotate(window_total=Window(Count('id')))[offset:offset + page_size]
+        )
+        if page:
+            self.count = page[0].window_total
+        elif self.number == 1:
+            self.count = 0
+        else:
+            raise NotFound('Invalid page.')
+
+        self.page_size = page_size
+        return page
+
+    def get_next_link(self):
+        if self.number * self.page_size >= self.count:
+            return None
+        return self._link(self.number + 1)
+
+    def get_previous_link(self):
+        if self.number == 1:
+            return None
+        return self._link(self.number - 1)
+
+    def _link(self, number):
+        return replace_query_param(self.request.build_absolute_uri(), self.page_query_param, number)
+
+    def get_paginated_response(self, data):
+        return Response({
+            'count': self.count,
+            'next': self.get_next_link(),
+            'previous': self.get_previous_link(),
+            'results': data,
+        })
@@ -1,6 +1,6 @@
 # applications/serializers.py
 from rest_framework import serializers
-from .models import Application
+from .models import Application, ApplicationStatusEvent
 
 class SimpleUserSerializer(serializers.Serializer):
     id = serializers.IntegerField(read_only=True)
@@ -29,4 +29,11 @@ class ApplicationSerializer(serializers.ModelSerializer):
             'status', 'cover_letter', 'resume_url',
             'applied_at', 'updated_at'
         ]
-        read_only_fields = ['job_seeker', 'applied_at', 'updated_at']
\ No newline at end of file
+        read_only_fields = ['job_seeker', 'applied_at', 'updated_at']
+
+
+class ApplicationStatusEventSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = ApplicationStatusEvent
+        fields = ['id', 'application', 'job', 'changed_by', 'from_status', 'to_status', 'created_at']
+        read_only_fields = fields
@@ -0,0 +1,44 @@
+# applications/signals.py
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .counters import application_added, application_removed, status_changed
+from .history import record_events, status_event
+from .models import Application
+from jobs.models import Job
+
+
+@receiver(post_save, sender=Application)
+def count_application_save(sender, instance, created=False, raw=False, **kwargs):
+    """Keep the job's counters and status history in step with inserts and single-row status changes.
+
+    Views set ``_changed_by`` on the instance to attribute a status change;
+    a submission is attributed to the seeker.
+    """
+    if raw:
+        return
+    loaded = None if created else getattr(instance, '_loaded_status', None)
+    if created:
+        application_added(instance.job_id, instance.status)
+    elif loaded is not None:
+        status_changed(instance.job_id, loaded, instance.status)
+
+    if created or (loaded is not None and loaded != instance.status):
+        record_events([status_event(
+            instance.id, instance.job_id, recruiter_id(instance), loaded, instance.status,
+            changed_by=getattr(instance, '_changed_by', None) or (instance.job_seeker if created else None),
+            at=instance.applied_at if created else instance.updated_at,
+        )])
+    instance._loaded_status = instance.status
+
+
+def recruiter_id(instance):
+    """The application's recruiter: free when the views' join cached the job, else one narrow lookup."""
+    if Application.job.is_cached(instance):
+        return instance.job.created_by_id
+    return Job.objects.filter(pk=instance.job_id).values_list('created_by_id', flat=True).first()
+
+
+@receiver(post_delete, sender=Application)
+def count_application_delete(sender, instance, **kwargs):
+    application_removed(instance.job_id, getattr(instance, '_loaded_status', None) or instance.status)
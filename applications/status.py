@@ -0,0 +1,55 @@
+# applications/status.py
+from django.db import transaction
+from django.utils import timezone
+
+from .counters import statuses_changed
+from .history import record_events, status_event
+from .models import Application
+
+MAX_BULK_STATUS_IDS = 1000
+
+
+def bulk_set_status(user, application_ids, new_status):
+    """Move many applications to ``new_status`` with one ownership query and one UPDATE.
+
+    Recruiters may only change applications to their own jobs; admins may
+    change any. The counters and the status history are written in the same
+    transaction. Returns ``{application_id: result}`` where result is one of
+    ``updated``, ``unchanged``, ``not_found`` or ``forbidden``.
+    """
+    results = {}
+    with transaction.atomic():
+        # Lock the rows so a concurrent change can't slip between the check and the write
+        rows = (
+            Application.objects.select_for_update(of=('self',))
+            .filter(id__in=application_ids)
+            .order_by()
+            .values_list('id', 'status', 'job_id', 'job__created_by_id')
+        )
+        to_update = []
+        moves = []
+        now = timezone.now()
+        events = []
+        for application_id, current_status, job_id, owner_id in rows:
+            if owner_id != user.id and user.role != 'admin':
+                results[application_id] = 'forbidden'
+            elif current_status == new_status:
+                results[application_id] = 'unchanged'
+            else:
+                results[application_id] = 'updated'
+                to_update.append(application_id)
+                moves.append((job_id, current_status))
+                events.append(status_event(
+                    application_id, job_id, owner_id, current_status, new_status, changed_by=user, at=now
+                ))
+
+        if to_update:
+            Application.objects.filter(id__in=to_update).update(
+                status=new_status, updated_at=now
+            )
+            statuses_changed(moves, new_status)
+            record_events(events)
+
+    for application_id in application_ids:
+        results.setdefault(application_id, 'not_found')
+    return results
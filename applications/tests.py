@@ -1,6 +1,527 @@
-# tests.py in each app
-from django.test import TestCase
-from rest_framework.test import APITestCase
-from rest_framework import status
-from django.urls import reverse
-from .models import YourModel
\ No newline at end of file
+# applications/tests.py
+import csv
+import io
+import json
+from datetime import timedelta
+from unittest import mock
+
+from django.core.management import call_command
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from afriremotely.testing import QueryCountAssertionsMixin, QueryPlanAssertionsMixin
+from jobs.tests import JobTestCase
+from users.models import User
+from . import analytics
+from .counters import COUNTER_FIELDS
+from .history import record_events, status_event
+from .models import Application, ApplicationDailyRollup, ApplicationStatusEvent, JobApplicationStats
+
+
+class ApplicationQueryCountTests(QueryCountAssertionsMixin, JobTestCase):
+    """Applications, their jobs, recruiters and seekers load in one query per page."""
+
+    def setUp(self):
+        super().setUp()
+        self.job = self.jobs[0]
+        self.seekers = []
+        for index in range(10):
+            seeker = User.objects.create_user(
+                email=f'seeker{index}@example.com', password=None,
+                full_name=f'Seeker {index}', role='job_seeker'
+            )
+            self.seekers.append(seeker)
+            for job in self.jobs:
+                Application.objects.create(job_seeker=seeker, job=job)
+
+    def test_recruiter_list(self):
+        self.client.force_authenticate(self.recruiter)
+        # COUNT(*) for the page number paginator, then the page itself
+        response = self.assertRequestQueries(2, '/api/applications/applications/')
+        self.assertEqual(response.data['count'], 30)
+
+    def test_seeker_list(self):
+        self.client.force_authenticate(self.seekers[0])
+        response = self.assertRequestQueries(2, '/api/applications/applications/my_applications/')
+        self.assertEqual(response.data['count'], 3)
+
+    def test_job_applications(self):
+        self.client.force_authenticate(self.recruiter)
+        # The job and its recruiter, then every application with its seeker
+        response = self.assertRequestQueries(2, f'/api/applications/jobs/{self.job.id}/applications/')
+        self.assertEqual(response.data['total_applications'], 10)
+
+
+class JobApplicantListingTests(QueryCountAssertionsMixin, JobTestCase):
+    def setUp(self):
+        super().setUp()
+        self.job = self.jobs[0]
+        for index in range(7):
+            seeker = User.objects.create_user(
+                email=f'seeker{index}@example.com', password=None,
+                full_name=f'Seeker {index}', role='job_seeker'
+            )
+            Application.objects.create(job_seeker=seeker, job=self.job, cover_letter=f'Letter, {index}')
+        self.url = f'/api/applications/jobs/{self.job.id}/applications/'
+        self.client.force_authenticate(self.recruiter)
+
+    def test_pages_carry_total_from_one_query(self):
+        response = self.assertRequestQueries(2, self.url + '?page_size=3')
+        self.assertEqual(response.data['total_applications'], 7)
+        self.assertEqual(len(response.data['applications']), 3)
+        self.assertIsNone(response.data['previous'])
+
+        seen = [application['id'] for application in response.data['applications']]
+        url = response.data['next']
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.data['total_applications'], 7)
+            seen += [application['id'] for application in response.data['applications']]
+            url = response.data['next']
+        self.assertEqual(len(set(seen)), 7)
+
+    def test_page_past_the_end(self):
+        self.assertEqual(self.client.get(self.url + '?page=9').status_code, 404)
+
+    def test_streaming_csv_export(self):
+        response = self.assertRequestQueries(1, self.url + 'export/')
+        self.assertTrue(response.streaming)
+        with self.assertNumQueries(1):
+            rows = list(csv.DictReader(io.StringIO(b''.join(response.streaming_content).decode())))
+        self.assertEqual(len(rows), 7)
+        self.assertEqual(rows[0]['job_seeker__email'], 'seeker0@example.com')
+        self.assertEqual(rows[0]['cover_letter'], 'Letter, 0')
+
+    def test_streaming_jsonl_export(self):
+        response = self.client.get(self.url + 'export/?file_type=jsonl')
+        lines = b''.join(response.streaming_content).decode().splitlines()
+        self.assertEqual(json.loads(lines[-1])['job_seeker__full_name'], 'Seeker 6')
+
+    def test_export_requires_job_owner(self):
+        other = User.objects.create_user(email='other@example.com', password=None,
+                                         full_name='Other', role='recruiter')
+        self.client.force_authenticate(other)
+        self.assertEqual(self.client.get(self.url + 'export/').status_code, 403)
+
+
+class BulkStatusUpdateTests(QueryCountAssertionsMixin, JobTestCase):
+    url = '/api/applications/applications/bulk_update_status/'
+
+    def setUp(self):
+        super().setUp()
+        self.other_recruiter = User.objects.create_user(
+            email='other@example.com', password=None, full_name='Other', role='recruiter'
+        )
+        self.other_job = self.create_job(created_by=self.other_recruiter)
+        self.applications = []
+        for index in range(5):
+            seeker = User.objects.create_user(
+                email=f'seeker{index}@example.com', password=None,
+                full_name=f'Seeker {index}', role='job_seeker'
+            )
+            self.applications.append(Application.objects.create(job_seeker=seeker, job=self.jobs[0]))
+        self.foreign = Application.objects.create(job_seeker=seeker, job=self.other_job)
+        self.client.force_authenticate(self.recruiter)
+
+    def test_one_read_and_one_write(self):
+        ids = [application.id for application in self.applications]
+        # SAVEPOINT/RELEASE around the ownership SELECT, the single UPDATE, the job counter
+        # UPDATE and one multi-row history INSERT
+        response = self.assertRequestQueries(6, self.url, method='post',
+                                             data={'ids': ids, 'status': 'shortlisted'}, format='json')
+        self.assertEqual(response.data['updated'], 5)
+        self.assertEqual(
+            set(Application.objects.filter(id__in=ids).values_list('status', flat=True)),
+            {'shortlisted'}
+        )
+
+    def test_per_id_results(self):
+        Application.objects.filter(id=self.applications[0].id).update(status='viewed')
+        ids = [self.applications[0].id, self.applications[1].id, self.foreign.id, 999999]
+        response = self.client.post(self.url, {'ids': ids, 'status': 'viewed'}, format='json')
+        self.assertEqual(response.data['results'], [
+            {'id': ids[0], 'result': 'unchanged'},
+            {'id': ids[1], 'result': 'updated'},
+            {'id': ids[2], 'result': 'forbidden'},
+            {'id': ids[3], 'result': 'not_found'},
+        ])
+        self.foreign.refresh_from_db()
+        self.assertEqual(self.foreign.status, 'submitted')
+
+    def test_validation(self):
+        self.assertEqual(self.client.post(self.url, {'ids': [1], 'status': 'maybe'}, format='json').status_code, 400)
+        self.assertEqual(self.client.post(self.url, {'ids': 'all', 'status': 'viewed'}, format='json').status_code, 400)
+        self.client.force_authenticate(User.objects.get(email='seeker0@example.com'))
+        response = self.client.post(self.url, {'ids': [self.applications[0].id], 'status': 'hired'}, format='json')
+        self.assertEqual(response.status_code, 403)
+
+
+class ApplyTests(JobTestCase):
+    def setUp(self):
+        super().setUp()
+        self.seeker = User.objects.create_user(
+            email='seeker@example.com', password=None, full_name='Seeker', role='job_seeker'
+        )
+        self.client.force_authenticate(self.seeker)
+        self.url = f'/api/applications/applications/{self.jobs[0].id}/apply/'
+
+    def test_duplicate_apply_is_one_insert_attempt(self):
+        self.assertEqual(self.client.post(self.url).status_code, 201)
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.post(self.url)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data, {'error': 'You have already applied for this job'})
+        self.assertFalse(any(
+            query['sql'].startswith('SELECT') and 'applications_application' in query['sql']
+            for query in queries.captured_queries
+        ))
+        self.assertEqual(Application.objects.count(), 1)
+
+    def test_duplicate_create_is_rejected(self):
+        url = '/api/applications/applications/'
+        self.assertEqual(self.client.post(url, {'job_id': self.jobs[1].id}, format='json').status_code, 201)
+        response = self.client.post(url, {'job_id': self.jobs[1].id}, format='json')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data, ['You have already applied for this job'])
+
+    def test_idempotency_key_replays_the_first_result(self):
+        first = self.client.post(self.url, {'cover_letter': 'Hi'}, HTTP_IDEMPOTENCY_KEY='retry-1')
+        retry = self.client.post(self.url, {'cover_letter': 'Hi'}, HTTP_IDEMPOTENCY_KEY='retry-1')
+        self.assertEqual(retry.status_code, 201)
+        self.assertEqual(retry.data, first.data)
+        self.assertEqual(retry['Idempotent-Replayed'], 'true')
+
+        # A fresh key is a new request, which is now a duplicate
+        self.assertEqual(self.client.post(self.url, HTTP_IDEMPOTENCY_KEY='retry-2').status_code, 400)
+
+    def test_idempotency_keys_are_per_user(self):
+        self.client.post(self.url, HTTP_IDEMPOTENCY_KEY='shared')
+        other = User.objects.create_user(
+            email='other@example.com', password=None, full_name='Other', role='job_seeker'
+        )
+        self.client.force_authenticate(other)
+        response = self.client.post(self.url, HTTP_IDEMPOTENCY_KEY='shared')
+        self.assertEqual(response.status_code, 201)
+        self.assertNotIn('Idempotent-Replayed', response)
+        self.assertEqual(Application.objects.count(), 2)
+
+
+class ApplicationCounterTests(JobTestCase):
+    def setUp(self):
+        super().setUp()
+        self.job = self.jobs[0]
+        self.seekers = [
+            User.objects.create_user(email=f'seeker{index}@example.com', password=None,
+                                     full_name=f'Seeker {index}', role='job_seeker')
+            for index in range(4)
+        ]
+
+    def counts(self, job=None):
+        return JobApplicationStats.objects.filter(job=job or self.job).values(*COUNTER_FIELDS).get()
+
+    def apply(self, seeker, job=None):
+        self.client.force_authenticate(seeker)
+        return self.client.post(f'/api/applications/applications/{(job or self.job).id}/apply/')
+
+    def test_apply_status_change_and_delete(self):
+        for seeker in self.seekers:
+            self.apply(seeker)
+        self.apply(self.seekers[0])  # duplicate, rejected
+        self.assertEqual(self.counts()['total'], 4)
+        self.assertEqual(self.counts()['submitted'], 4)
+
+        applications = list(Application.objects.filter(job=self.job).order_by('id'))
+        self.client.force_authenticate(self.recruiter)
+        self.client.patch(f'/api/applications/applications/{applications[0].id}/update_status/',
+                          {'status': 'shortlisted'}, format='json')
+        self.client.post('/api/applications/applications/bulk_update_status/',
+                         {'ids': [a.id for a in applications[:3]], 'status': 'rejected'}, format='json')
+        self.assertEqual(self.counts(), {'total': 4, 'submitted': 1, 'viewed': 0,
+                                         'shortlisted': 0, 'rejected': 3, 'hired': 0})
+
+        self.client.force_authenticate(self.seekers[3])
+        self.client.delete(f'/api/applications/applications/{applications[3].id}/')
+        self.assertEqual(self.counts()['total'], 3)
+        self.assertEqual(self.counts()['submitted'], 0)
+
+        # Deleting a seeker cascades to their applications
+        self.seekers[0].delete()
+        self.assertEqual(self.counts()['total'], 2)
+        self.assertEqual(self.counts()['rejected'], 2)
+
+    def test_generic_update_and_delete_are_atomic(self):
+        self.apply(self.seekers[0])
+        application = Application.objects.get(job=self.job)
+        url = f'/api/applications/applications/{application.id}/'
+
+        with mock.patch('applications.signals.record_events', side_effect=RuntimeError):
+            with self.assertRaises(RuntimeError):
+                self.client.patch(url, {'status': 'hired'}, format='json')
+        application.refresh_from_db()
+        self.assertEqual(application.status, 'submitted')
+        self.assertEqual(self.counts()['hired'], 0)
+
+        with mock.patch('applications.signals.application_removed', side_effect=RuntimeError):
+            with self.assertRaises(RuntimeError):
+                self.client.delete(url)
+        self.assertTrue(Application.objects.filter(pk=application.pk).exists())
+        self.assertEqual(self.counts()['total'], 1)
+
+    def test_deleting_the_job_drops_its_counters(self):
+        self.apply(self.seekers[0])
+        self.job.delete()
+        self.assertFalse(JobApplicationStats.objects.exists())
+
+    def test_counts_in_job_serializer(self):
+        self.apply(self.seekers[0])
+        self.apply(self.seekers[1])
+        self.client.force_authenticate(self.recruiter)
+        response = self.client.get('/api/jobs/jobs/my_jobs/')
+        by_title = {job['title']: job['application_counts'] for job in response.data['results']}
+        self.assertEqual(by_title['Backend Engineer']['total'], 2)
+        self.assertEqual(by_title['Backend Engineer']['submitted'], 2)
+        self.assertEqual(by_title['Data Analyst']['total'], 0)
+
+    def test_counts_are_private_to_the_owner_and_admins(self):
+        self.apply(self.seekers[0])
+        url = f'/api/jobs/jobs/{self.job.id}/'
+        self.client.force_authenticate(None)
+        self.assertNotIn('application_counts', self.client.get(url).data)
+        self.assertNotIn('application_counts', self.client.get('/api/jobs/jobs/').data['results'][0])
+        self.client.force_authenticate(self.seekers[1])
+        self.assertNotIn('application_counts', self.client.get(url).data)
+
+        other = User.objects.create_user(email='other@example.com', password=None,
+                                         full_name='Other', role='recruiter')
+        admin = User.objects.create_user(email='admin@example.com', password=None,
+                                         full_name='Admin', role='admin')
+        for user, visible in ((other, False), (self.recruiter, True), (admin, True)):
+            self.client.force_authenticate(user)
+            self.assertEqual('application_counts' in self.client.get(url).data, visible)
+
+    def test_cached_anonymous_responses_never_carry_counts(self):
+        url = f'/api/jobs/jobs/{self.job.id}/'
+        self.client.force_authenticate(None)
+        first = self.client.get(url)
+        # Applying does not bump the catalogue version, so the cached entry and ETag stay valid
+        self.apply(self.seekers[0])
+        self.client.force_authenticate(None)
+        again = self.client.get(url)
+        self.assertEqual(again.data, first.data)
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=first['ETag']).status_code, 304)
+        self.client.force_authenticate(self.recruiter)
+        self.assertEqual(self.client.get(url).data['application_counts']['total'], 1)
+
+    def test_job_matches_carry_no_counts(self):
+        self.seekers[0].skills = ['Django']
+        self.seekers[0].save()
+        self.apply(self.seekers[1])
+        self.client.force_authenticate(self.seekers[0])
+        response = self.client.get('/api/match/jobs-for-me/')
+        self.assertEqual([job['title'] for job in response.data['suggested_jobs']], ['Backend Engineer'])
+        self.assertNotIn('application_counts', response.data['suggested_jobs'][0])
+
+    def test_reconcile_repairs_drift(self):
+        for seeker in self.seekers[:3]:
+            self.apply(seeker)
+        self.apply(self.seekers[3], job=self.jobs[1])
+        JobApplicationStats.objects.filter(job=self.job).update(total=10, hired=2)
+        JobApplicationStats.objects.filter(job=self.jobs[1]).delete()
+
+        out = io.StringIO()
+        call_command('reconcile_application_counts', '--dry-run', stdout=out)
+        self.assertIn('Found drifted counters for 2 jobs', out.getvalue())
+        self.assertEqual(self.counts()['total'], 10)
+
+        call_command('reconcile_application_counts', stdout=io.StringIO())
+        self.assertEqual(self.counts(), {'total': 3, 'submitted': 3, 'viewed': 0,
+                                         'shortlisted': 0, 'rejected': 0, 'hired': 0})
+        self.assertEqual(self.counts(self.jobs[1])['total'], 1)
+
+
+class PipelineAnalyticsTests(QueryCountAssertionsMixin, JobTestCase):
+    url = '/api/applications/analytics/pipeline/'
+
+    def setUp(self):
+        super().setUp()
+        self.today = timezone.localdate()
+        seekers = [
+            User.objects.create_user(email=f'seeker{index}@example.com', password=None,
+                                     full_name=f'Seeker {index}', role='job_seeker')
+            for index in range(4)
+        ]
+        # (job, seeker, days ago, [(status entered, days after applying)])
+        self.applications = []
+        for job, seeker, days_ago, changes in [
+            (self.jobs[0], seekers[0], 10, [('shortlisted', 2), ('hired', 4)]),
+            (self.jobs[0], seekers[1], 10, [('rejected', 2)]),
+            (self.jobs[0], seekers[2], 3, [('shortlisted', 1)]),
+            (self.jobs[0], seekers[3], 0, []),
+            (self.jobs[1], seekers[0], 3, [('rejected', 2)]),
+        ]:
+            applied_at = analytics.day_start(self.today - timedelta(days=days_ago)) + timedelta(hours=9)
+            application = Application.objects.create(
+                job=job, job_seeker=seeker, status=changes[-1][0] if changes else 'submitted'
+            )
+            Application.objects.filter(pk=application.pk).update(applied_at=applied_at)
+            ApplicationStatusEvent.objects.filter(application=application).delete()
+            record_events([
+                status_event(application.id, job.id, self.recruiter.id, previous, entered,
+                             at=applied_at + timedelta(days=took))
+                for (previous, _), (entered, took) in zip([('', 0), *changes], [('submitted', 0), *changes])
+            ])
+            self.applications.append(application)
+        self.client.force_authenticate(self.recruiter)
+
+    def by_status(self, response):
+        return {row['status']: row['count'] for row in response.data['by_status']}
+
+    def assertFunnel(self, response):
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['total_applications'], 5)
+        self.assertEqual(self.by_status(response), {'submitted': 5, 'viewed': 0, 'shortlisted': 2,
+                                                    'rejected': 2, 'hired': 1})
+        self.assertEqual(response.data['avg_days_to_status'], {'shortlisted': 1.5, 'rejected': 2.0, 'hired': 4.0})
+        first = response.data['jobs'][0]
+        self.assertEqual((first['job_id'], first['applications']), (self.jobs[0].id, 4))
+        self.assertEqual(first['conversion'], {'shortlisted': 0.5, 'hired': 0.25})
+
+    def test_live_aggregates_without_a_rollup(self):
+        self.assertFunnel(self.client.get(self.url))
+
+    def test_rollup_and_live_days_give_the_same_answer(self):
+        call_command('rollup_application_stats', stdout=io.StringIO())
+        self.assertFalse(ApplicationDailyRollup.objects.filter(day=self.today).exists())
+        # One row per job, day and status entered before today
+        self.assertEqual(ApplicationDailyRollup.objects.filter(recruiter=self.recruiter).count(), 8)
+        self.assertFunnel(self.client.get(self.url))
+
+    def test_status_changes_after_the_rollup_are_counted(self):
+        call_command('rollup_application_stats', stdout=io.StringIO())
+        rolled = list(ApplicationDailyRollup.objects.order_by('id').values_list('day', 'status', 'applications'))
+
+        # An application from ten days ago is hired today
+        response = self.client.patch(
+            f'/api/applications/applications/{self.applications[1].id}/update_status/',
+            {'status': 'hired'}, format='json'
+        )
+        self.assertEqual(response.status_code, 200)
+
+        response = self.client.get(self.url)
+        self.assertEqual(self.by_status(response)['hired'], 2)
+        self.assertEqual(self.by_status(response)['rejected'], 2)
+        self.assertGreater(response.data['avg_days_to_status']['hired'], 4.0)
+        # Rolled-up days are history and stay as they were
+        call_command('rollup_application_stats', stdout=io.StringIO())
+        self.assertEqual(list(ApplicationDailyRollup.objects.order_by('id').values_list(
+            'day', 'status', 'applications')), rolled)
+
+    def test_query_count_is_independent_of_volume(self):
+        call_command('rollup_application_stats', '--all', stdout=io.StringIO())
+        # watermark, rollup aggregate, live aggregate, job titles
+        self.assertRequestQueries(4, self.url)
+
+    def test_date_range(self):
+        call_command('rollup_application_stats', '--days', '5', stdout=io.StringIO())
+        start = (self.today - timedelta(days=5)).isoformat()
+        response = self.client.get(self.url, {'start': start})
+        self.assertEqual(response.data['total_applications'], 3)
+
+        end = (self.today - timedelta(days=1)).isoformat()
+        response = self.client.get(self.url, {'start': start, 'end': end})
+        self.assertEqual(self.by_status(response)['shortlisted'], 1)
+        self.assertEqual(self.by_status(response)['rejected'], 1)
+        self.assertEqual(response.data['total_applications'], 2)
+
+    def test_validation_and_permissions(self):
+        self.assertEqual(self.client.get(self.url, {'start': '2024-13-01'}).status_code, 400)
+        self.assertEqual(self.client.get(self.url, {'end': 'yesterday'}).status_code, 400)
+        self.assertEqual(self.client.get(self.url, {'start': '2024-02-01', 'end': '2024-01-01'}).status_code, 400)
+
+        seeker = User.objects.get(email='seeker0@example.com')
+        self.client.force_authenticate(seeker)
+        self.assertEqual(self.client.get(self.url).status_code, 403)
+
+
+class StatusHistoryTests(QueryPlanAssertionsMixin, JobTestCase):
+    watched_tables = ('applications_applicationstatusevent',)
+
+    def setUp(self):
+        super().setUp()
+        self.seeker = User.objects.create_user(email='seeker@example.com', password=None,
+                                               full_name='Seeker', role='job_seeker')
+        self.client.force_authenticate(self.seeker)
+        response = self.client.post(f'/api/applications/applications/{self.jobs[0].id}/apply/')
+        self.application = Application.objects.get(pk=response.data['application']['id'])
+        self.client.force_authenticate(self.recruiter)
+
+    def transitions(self):
+        return list(ApplicationStatusEvent.objects.filter(application=self.application)
+                    .order_by('created_at', 'id').values_list('from_status', 'to_status', 'changed_by'))
+
+    def test_single_and_bulk_changes_are_recorded(self):
+        url = f'/api/applications/applications/{self.application.id}/'
+        self.client.patch(url + 'update_status/', {'status': 'viewed'}, format='json')
+        self.client.patch(url + 'update_status/', {'status': 'viewed'}, format='json')  # no change
+        self.client.post('/api/applications/applications/bulk_update_status/',
+                         {'ids': [self.application.id], 'status': 'hired'}, format='json')
+        self.assertEqual(self.transitions(), [
+            ('', 'submitted', self.seeker.id),
+            ('submitted', 'viewed', self.recruiter.id),
+            ('viewed', 'hired', self.recruiter.id),
+        ])
+
+        response = self.client.get(url + 'history/')
+        self.assertEqual([event['to_status'] for event in response.data], ['submitted', 'viewed', 'hired'])
+
+        self.client.force_authenticate(self.seeker)
+        self.assertEqual(self.client.get(url + 'history/').status_code, 200)
+
+    def test_generic_update_is_attributed(self):
+        self.client.force_authenticate(self.seeker)
+        with CaptureQueriesContext(connection) as queries:
+            self.client.patch(f'/api/applications/applications/{self.application.id}/',
+                              {'status': 'viewed'}, format='json')
+        self.assertEqual(self.transitions()[-1], ('submitted', 'viewed', self.seeker.id))
+        # The recruiter comes from the join that loaded the application, not a lookup of the job
+        self.assertFalse([query for query in queries if query['sql'].startswith('SELECT "jobs_job"')])
+
+        self.application.refresh_from_db()
+        self.application.status = 'hired'
+        with self.assertNumQueries(4):
+            # The row, the job's counters, the job's recruiter id and the event
+            self.application.save()
+        self.assertEqual(ApplicationStatusEvent.objects.latest('id').recruiter_id, self.recruiter.id)
+
+    def test_recruiter_feed(self):
+        other = self.create_job(title='Other Role')
+        self.client.force_authenticate(self.seeker)
+        self.client.post(f'/api/applications/applications/{other.id}/apply/')
+        self.client.force_authenticate(self.recruiter)
+        self.client.patch(f'/api/applications/applications/{self.application.id}/update_status/',
+                          {'status': 'rejected'}, format='json')
+
+        response = self.client.get('/api/applications/applications/events/', {'page_size': 2})
+        self.assertEqual([event['to_status'] for event in response.data['results']], ['rejected', 'submitted'])
+        self.assertIsNotNone(response.data['next'])
+        response = self.client.get(response.data['next'])
+        self.assertEqual(len(response.data['results']), 1)
+        self.assertIsNone(response.data['next'])
+
+        response = self.client.get('/api/applications/applications/events/', {'job_id': other.id})
+        self.assertEqual(len(response.data['results']), 1)
+
+        self.client.force_authenticate(self.seeker)
+        self.assertEqual(self.client.get('/api/applications/applications/events/').status_code, 403)
+
+    def test_reads_use_the_indexes(self):
+        with self.assertNoFullTableScan():
+            list(ApplicationStatusEvent.objects.filter(recruiter=self.recruiter).order_by('-created_at', '-id')[:20])
+            list(ApplicationStatusEvent.objects.filter(application=self.application).order_by('created_at', 'id'))
+
+    def test_events_are_append_only(self):
+        event = ApplicationStatusEvent.objects.get(application=self.application)
+        event.to_status = 'hired'
+        with self.assertRaises(ValueError):
+            event.save()
@@ -20,4 +20,14 @@ urlpatterns = [
         ApplicationViewSet.as_view({'get': 'job_applications_detail'}),
         name='job-applications'
     ),
+    path(
+        'jobs/<int:job_id>/applications/export/',
+        ApplicationViewSet.as_view({'get': 'export_job_applications'}),
+        name='job-applications-export'
+    ),
+    path(
+        'analytics/pipeline/',
+        ApplicationViewSet.as_view({'get': 'pipeline_analytics'}),
+        name='pipeline-analytics'
+    ),
 ]
@@ -2,12 +2,27 @@ from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
+from django.db import IntegrityError, transaction
+from django.http import StreamingHttpResponse
 from django.shortcuts import get_object_or_404
+from django.utils.dateparse import parse_date
 from rest_framework import serializers
 
-from .models import Application
-from .serializers import ApplicationSerializer
+from .analytics import pipeline
+from .idempotency import idempotent
+from .models import Application, ApplicationStatusEvent
+from .pagination import WindowCountPagination
+from .serializers import ApplicationSerializer, ApplicationStatusEventSerializer
+from .status import MAX_BULK_STATUS_IDS, bulk_set_status
+from afriremotely.streaming import CONTENT_TYPES, STREAM_FORMATS, stream_rows
 from jobs.models import Job
+from jobs.pagination import KeysetPagination
+
+APPLICANT_EXPORT_FIELDS = [
+    'id', 'status', 'applied_at', 'updated_at', 'cover_letter', 'resume_url',
+    'job_seeker_id', 'job_seeker__full_name', 'job_seeker__email',
+]
+EXPORT_CHUNK_SIZE = 2000
 
 
 class ApplicationViewSet(viewsets.ModelViewSet):
@@ -16,30 +31,49 @@ class ApplicationViewSet(viewsets.ModelViewSet):
 
     def get_queryset(self):
         user = self.request.user
+        applications = self.with_related(Application.objects.all())
 
         if user.role == 'job_seeker':
-            return Application.objects.filter(job_seeker=user)
+            return applications.filter(job_seeker=user)
         elif user.role in ['recruiter', 'admin']:
-            return Application.objects.filter(job__created_by=user)
+            return applications.filter(job__created_by=user)
 
         return Application.objects.none()
 
+    @staticmethod
+    def with_related(queryset):
+        # ApplicationSerializer nests the seeker, the job and the job's recruiter
+        return queryset.select_related('job_seeker', 'job__created_by')
+
+    @idempotent
+    def create(self, request, *args, **kwargs):
+        return super().create(request, *args, **kwargs)
+
     def perform_create(self, serializer):
         job_id = self.request.data.get('job_id')
         job = get_object_or_404(Job, id=job_id, is_active=True)
 
-        if Application.objects.filter(
-            job_seeker=self.request.user,
-            job=job
-        ).exists():
+        # The unique (job_seeker, job) constraint decides duplicates in the same INSERT
+        try:
+            with transaction.atomic():
+                serializer.save(
+                    job_seeker=self.request.user,
+                    job=job
+                )
+        except IntegrityError:
             raise serializers.ValidationError(
                 "You have already applied for this job"
             )
 
-        serializer.save(
-            job_seeker=self.request.user,
-            job=job
-        )
+    def perform_update(self, serializer):
+        # PUT/PATCH can change status too; the row, the job's counters and the history commit together
+        serializer.instance._changed_by = self.request.user
+        with transaction.atomic():
+            serializer.save()
+
+    def perform_destroy(self, instance):
+        with transaction.atomic():
+            instance.delete()
 
     @action(detail=True, methods=['patch'])
     def update_status(self, request, pk=None):
@@ -61,12 +95,93 @@ class ApplicationViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_403_FORBIDDEN
             )
 
-        application.status = new_status
-        application.save()
+        # The job's application counters and status history move in the same transaction
+        with transaction.atomic():
+            application.status = new_status
+            application._changed_by = request.user
+            application.save()
 
         serializer = self.get_serializer(application)
         return Response(serializer.data)
 
+    @action(detail=True, methods=['get'])
+    def history(self, request, pk=None):
+        """GET /applications/{id}/history/ - Every status the application has been in, oldest first"""
+        application = self.get_object()
+        events = ApplicationStatusEvent.objects.filter(application=application).order_by('created_at', 'id')
+        serializer = ApplicationStatusEventSerializer(events, many=True)
+        return Response(serializer.data)
+
+    @action(detail=False, methods=['get'], url_path='events')
+    def status_events(self, request):
+        """GET /applications/events/ - Latest status changes across the recruiter's jobs"""
+        if request.user.role not in ['recruiter', 'admin']:
+            return Response(
+                {'error': 'Only recruiters can view application events'},
+                status=status.HTTP_403_FORBIDDEN
+            )
+
+        events = ApplicationStatusEvent.objects.filter(recruiter=request.user)
+        job_id = request.query_params.get('job_id')
+        if job_id:
+            if not job_id.isdigit():
+                return Response(
+                    {'error': 'job_id must be an integer'},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            events = events.filter(job_id=job_id)
+
+        paginator = KeysetPagination()
+        page = paginator.paginate_queryset(events.order_by('-created_at', '-id'), request, view=self)
+        serializer = ApplicationStatusEventSerializer(page, many=True)
+        return paginator.get_paginated_response(serializer.data)
+
+    @action(detail=False, methods=['post'])
+    def bulk_update_status(self, request):
+        """POST /applications/bulk_update_status/ - {"ids": [...], "status": "..."}"""
+        new_status = request.data.get('status')
+        application_ids = request.data.get('ids')
+
+        if new_status not in dict(Application.STATUS_CHOICES):
+            return Response(
+                {'error': 'Invalid status'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        if (
+            not isinstance(application_ids, list)
+            or not application_ids
+            or not all(isinstance(i, int) and not isinstance(i, bool) for i in application_ids)
+        ):
+            return Response(
+                {'error': 'ids must be a non-empty list of application ids'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        if len(application_ids) > MAX_BULK_STATUS_IDS:
+            return Response(
+                {'error': f'At most {MAX_BULK_STATUS_IDS} applications can be updated at once'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        if request.user.role not in ['recruiter', 'admin']:
+            return Response(
+                {'error': 'Permission denied'},
+                status=status.HTTP_403_FORBIDDEN
+            )
+
+        application_ids = list(dict.fromkeys(application_ids))
+        results = bulk_set_status(request.user, application_ids, new_status)
+
+        return Response({
+            'status': new_status,
+            'updated': sum(1 for result in results.values() if result == 'updated'),
+            'results': [
+                {'id': application_id, 'result': results[application_id]}
+                for application_id in application_ids
+            ]
+        })
+
     @action(detail=False, methods=['get'])
     def my_applications(self, request):
         """GET /applications/my/"""
@@ -99,7 +214,7 @@ class ApplicationViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        job = get_object_or_404(Job, id=job_id)
+        job = get_object_or_404(Job.objects.select_related('created_by'), id=job_id)
 
         if (
             request.user != job.created_by
@@ -110,18 +225,92 @@ class ApplicationViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_403_FORBIDDEN
             )
 
-        applications = Application.objects.filter(job=job)
-        serializer = self.get_serializer(applications, many=True)
+        # One query returns the page together with its total (COUNT(*) OVER ())
+        applications = self.with_related(Application.objects.filter(job=job))
+        paginator = WindowCountPagination()
+        page = paginator.paginate_queryset(applications, request, view=self)
+        serializer = self.get_serializer(page, many=True)
 
         return Response({
             'job_title': job.title,
-            'total_applications': applications.count(),
+            'total_applications': paginator.count,
+            'next': paginator.get_next_link(),
+            'previous': paginator.get_previous_link(),
             'applications': serializer.data
         })
 
+    @action(detail=False, methods=['get'])
+    def export_job_applications(self, request, job_id=None):
+        """GET /jobs/{job_id}/applications/export/?file_type=csv|jsonl"""
+        file_type = request.query_params.get('file_type', 'csv')
+        if file_type not in STREAM_FORMATS:
+            return Response(
+                {'error': f'Invalid file_type. Must be one of: {", ".join(STREAM_FORMATS)}'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        job = get_object_or_404(Job.objects.select_related('created_by'), id=job_id)
+
+        if (
+            request.user != job.created_by
+            and request.user.role != 'admin'
+        ):
+            return Response(
+                {'error': 'Permission denied'},
+                status=status.HTTP_403_FORBIDDEN
+            )
+
+        # values() + iterator() streams rows from a server-side cursor in fixed-size chunks
+        rows = (
+            Application.objects.filter(job=job)
+            .order_by('applied_at', 'id')
+            .values(*APPLICANT_EXPORT_FIELDS)
+            .iterator(chunk_size=EXPORT_CHUNK_SIZE)
+        )
+        response = StreamingHttpResponse(
+            stream_rows(file_type, APPLICANT_EXPORT_FIELDS, rows),
+            content_type=CONTENT_TYPES[file_type]
+        )
+        response['Content-Disposition'] = f'attachment; filename="job-{job.id}-applicants.{file_type}"'
+        return response
+
+    @action(detail=False, methods=['get'])
+    def pipeline_analytics(self, request):
+        """GET /analytics/pipeline/?start=YYYY-MM-DD&end=YYYY-MM-DD - Funnel across the recruiter's jobs"""
+        if request.user.role not in ['recruiter', 'admin']:
+            return Response(
+                {'error': 'Only recruiters can view pipeline analytics'},
+                status=status.HTTP_403_FORBIDDEN
+            )
+
+        dates = {}
+        for param in ('start', 'end'):
+            value = request.query_params.get(param)
+            if not value:
+                dates[param] = None
+                continue
+            try:
+                dates[param] = parse_date(value)
+            except ValueError:
+                dates[param] = None
+            if dates[param] is None:
+                return Response(
+                    {'error': f'{param} must be a date in YYYY-MM-DD format'},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+
+        if dates['start'] and dates['end'] and dates['start'] > dates['end']:
+            return Response(
+                {'error': 'start must not be after end'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        return Response(pipeline(request.user, dates['start'], dates['end']))
+
     @action(detail=True, methods=['post'], url_path='apply')
+    @idempotent
     def apply_for_job(self, request, pk=None):
-        """POST /applications/{job_id}/apply/"""
+        """POST /applications/{job_id}/apply/ - Honours an optional Idempotency-Key header"""
 
         if request.user.role != 'job_seeker':
             return Response(
@@ -129,24 +318,23 @@ class ApplicationViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_403_FORBIDDEN
             )
 
-        job = get_object_or_404(Job, id=pk, is_active=True)
-
-        if Application.objects.filter(
-            job_seeker=request.user,
-            job=job
-        ).exists():
+        job = get_object_or_404(Job.objects.select_related('created_by'), id=pk, is_active=True)
+
+        # A single INSERT; concurrent double-submits lose on the unique (job_seeker, job) constraint
+        try:
+            with transaction.atomic():
+                application = Application.objects.create(
+                    job_seeker=request.user,
+                    job=job,
+                    cover_letter=request.data.get('cover_letter', ''),
+                    resume_url=request.data.get('resume_url', '')
+                )
+        except IntegrityError:
             return Response(
                 {'error': 'You have already applied for this job'},
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        application = Application.objects.create(
-            job_seeker=request.user,
-            job=job,
-            cover_letter=request.data.get('cover_letter', ''),
-            resume_url=request.data.get('resume_url', '')
-        )
-
         serializer = ApplicationSerializer(application)
 
         return Response(
@@ -0,0 +1,185 @@
+# jobs/autocomplete.py
+import heapq
+import threading
+import time
+from bisect import bisect_left, insort
+from collections import Counter
+
+from django.conf import settings
+from django.db.models import Count, F, Q
+
+from afriremotely.background import run_in_background
+from matching.skills import clean_skill, normalize_skill
+
+FIELDS = ('skills', 'categories', 'locations')
+
+
+class PrefixIndex:
+    """Popularity-ranked prefix lookup over a sorted array of normalized keys.
+
+    A prefix query is one ``bisect`` plus a walk over the keys sharing the
+    prefix. Holds at most ``max_entries`` values; when full, the least popular
+    value makes room for a new one.
+    """
+
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self._keys = []
+        self._entries = {}  # key -> [display value, popularity]
+
+    def __len__(self):
+        return len(self._keys)
+
+    def adjust(self, value, delta):
+        key = normalize_skill(value)
+        if not key:
+            return
+        entry = self._entries.get(key)
+        if entry is not None:
+            entry[1] += delta
+            if entry[1] <= 0:
+                self._discard(key)
+            return
+        if delta <= 0:
+            return
+        if len(self._keys) >= self.max_entries:
+            least = min(self._entries, key=lambda k: self._entries[k][1])
+            if self._entries[least][1] > delta:
+                return
+            self._discard(least)
+        self._entries[key] = [clean_skill(value), delta]
+        insort(self._keys, key)
+
+    def suggest(self, prefix, limit):
+        prefix = normalize_skill(prefix)
+        start = bisect_left(self._keys, prefix)
+        end = bisect_left(self._keys, prefix + '\U0010ffff', lo=start)
+        best = heapq.nsmallest(
+            limit, self._keys[start:end], key=lambda key: (-self._entries[key][1], key)
+        )
+        return [{'value': self._entries[key][0], 'count': self._entries[key][1]} for key in best]
+
+    def _discard(self, key):
+        del self._entries[key]
+        del self._keys[bisect_left(self._keys, key)]
+
+
+def job_terms(values):
+    """Autocomplete terms one job contributes: ``{field: [values]}``, empty when inactive."""
+    if not values or not values['is_active']:
+        return {}
+    return {
+        'skills': values['required_skills'] or [],
+        'categories': [values['category']],
+        'locations': [values['location']],
+    }
+
+
+def user_terms(values):
+    if not values or values['role'] != 'job_seeker' or not values['is_active']:
+        return {}
+    return {'skills': values['skills'] or []}
+
+
+class Autocomplete:
+    """Per-process prefix indexes over skills, job categories and job locations.
+
+    Built lazily from the database, then adjusted in place as jobs and seekers
+    change. Every ``max_age`` seconds one background rebuild folds in writes
+    made by other processes; lookups keep using the old indexes until it is
+    swapped in, and writes made meanwhile are replayed onto the new ones.
+    """
+
+    def __init__(self, max_entries, max_age):
+        self.max_entries = max_entries
+        self.max_age = max_age
+        self._indexes = None
+        self._built_at = 0
+        self._pending = None
+        self._lock = threading.Lock()
+        self._rebuilding = threading.Lock()
+
+    @property
+    def is_built(self):
+        return self._indexes is not None
+
+    def clear(self):
+        with self._lock:
+            self._indexes = None
+
+    def suggest(self, field, prefix, limit):
+        if self._indexes is None:
+            # Nothing to serve yet: the first caller builds, concurrent ones wait for it
+            with self._rebuilding:
+                if self._indexes is None:
+                    self.rebuild()
+        elif time.monotonic() - self._built_at > self.max_age and self._rebuilding.acquire(blocking=False):
+            run_in_background(self._rebuild_once)
+        with self._lock:
+            return self._indexes[field].suggest(prefix, limit)
+
+    def _rebuild_once(self):
+        try:
+            self.rebuild()
+        finally:
+            self._rebuilding.release()
+
+    def rebuild(self):
+        # Writes made while the database is read are replayed onto the new indexes
+        with self._lock:
+            self._pending = []
+        try:
+            indexes = self._build()
+        except Exception:
+            with self._lock:
+                self._pending = None
+            raise
+
+        with self._lock:
+            for old_terms, new_terms in self._pending:
+                self._apply(indexes, old_terms, new_terms)
+            self._pending = None
+            self._indexes = indexes
+            self._built_at = time.monotonic()
+
+    def _build(self):
+        from jobs.models import Job
+        from matching.models import Skill
+
+        indexes = {field: PrefixIndex(self.max_entries) for field in FIELDS}
+        active_jobs = Job.objects.filter(is_active=True).order_by()
+        for field, column in (('categories', 'category'), ('locations', 'location')):
+            rows = active_jobs.values(column).annotate(popularity=Count('id')).order_by('-popularity', column)
+            for row in rows[:self.max_entries]:
+                indexes[field].adjust(row[column], row['popularity'])
+
+        # A skill is as popular as the active jobs requiring it plus the seekers listing it
+        skills = Skill.objects.annotate(
+            popularity=F('active_job_count') + Count('user_index', filter=Q(user_index__is_seeker=True))
+        ).filter(popularity__gt=0).order_by('-popularity', 'key').values_list('name', 'popularity')
+        for name, popularity in skills[:self.max_entries]:
+            indexes['skills'].adjust(name, popularity)
+        return indexes
+
+    def replace(self, old_terms, new_terms):
+        """Move popularity from ``old_terms`` to ``new_terms`` (see ``job_terms``)."""
+        with self._lock:
+            if self._pending is not None:
+                self._pending.append((old_terms, new_terms))
+            if self._indexes is not None:
+                self._apply(self._indexes, old_terms, new_terms)
+
+    @staticmethod
+    def _apply(indexes, old_terms, new_terms):
+        for field in FIELDS:
+            delta = Counter(new_terms.get(field, []))
+            delta.subtract(old_terms.get(field, []))
+            for value, change in delta.items():
+                if change:
+                    indexes[field].adjust(value, change)
+
+
+autocomplete = Autocomplete(
+    max_entries=settings.AUTOCOMPLETE_MAX_ENTRIES,
+    max_age=settings.AUTOCOMPLETE_MAX_AGE,
+)
@@ -0,0 +1,192 @@
+# jobs/bulk.py
+import csv
+import io
+import json
+from collections import Counter
+
+from django.db import transaction
+
+from afriremotely.streaming import STREAM_FORMATS, stream_rows
+from matching.index import rebuild_index
+from matching.skills import canonicalize
+from matching.stats import add_active_counts, adjust_active_total, record_jobs_posted
+from users.models import User
+from .autocomplete import autocomplete, job_terms
+from .cache import bump_catalogue_version
+from .models import Job
+from .salary import parse_salary_range
+from .search import index_new_jobs_text
+
+FILE_TYPES = STREAM_FORMATS
+EXPORT_FIELDS = [
+    'id', 'title', 'description', 'category', 'required_skills', 'salary_range',
+    'location', 'job_type', 'is_active', 'created_by_id', 'created_at',
+]
+IMPORT_BATCH_SIZE = 500
+MAX_REPORTED_ERRORS = 1000
+
+
+def file_type_for(name, default='csv'):
+    """Guess ``csv``/``jsonl`` from a file name."""
+    if name and name.lower().endswith(('.jsonl', '.ndjson')):
+        return 'jsonl'
+    if name and name.lower().endswith('.csv'):
+        return 'csv'
+    return default
+
+
+def read_rows(stream, file_type):
+    """Yield ``(line_number, row, error)`` from a text stream of CSV or JSON Lines.
+
+    Rows are read one at a time, so the whole file is never held in memory.
+    """
+    if file_type == 'csv':
+        reader = csv.DictReader(stream)
+        for row in reader:
+            skills = (row.get('required_skills') or '').strip()
+            if skills.startswith('['):
+                try:
+                    row['required_skills'] = json.loads(skills)
+                except ValueError:
+                    yield reader.line_num, None, {'required_skills': ['Not a valid JSON list.']}
+                    continue
+            else:
+                row['required_skills'] = [skill for skill in skills.split(',') if skill.strip()]
+            # Blank cells mean "not given", so model defaults apply
+            yield reader.line_num, {key: value for key, value in row.items() if value != ''}, None
+        return
+
+    for line_number, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except ValueError:
+            yield line_number, None, {'non_field_errors': ['Invalid JSON.']}
+            continue
+        if not isinstance(row, dict):
+            yield line_number, None, {'non_field_errors': ['Each line must be a JSON object.']}
+            continue
+        yield line_number, row, None
+
+
+class JobImporter:
+    """Validate and insert job rows in batches, collecting per-row errors.
+
+    Each batch is validated with ``JobSerializer`` and the valid rows are
+    written with one ``bulk_create`` inside a transaction. Skills are
+    canonicalized only for the valid rows, in that transaction, so a rejected
+    row or a failed batch adds nothing to the vocabulary. ``bulk_create``
+    skips the Job signals, so the skill index, skill stats, search index and
+    caches are updated here for the whole batch.
+    """
+
+    def __init__(self, created_by, batch_size=IMPORT_BATCH_SIZE):
+        self.created_by = created_by
+        self.batch_size = batch_size
+        self.created = 0
+        self.failed = 0
+        self.errors = []
+
+    def run(self, rows):
+        batch = []
+        for item in rows:
+            batch.append(item)
+            if len(batch) >= self.batch_size:
+                self.import_batch(batch)
+                batch = []
+        if batch:
+            self.import_batch(batch)
+        return self.report()
+
+    def report(self):
+        return {'created': self.created, 'failed': self.failed, 'errors': self.errors}
+
+    def import_batch(self, batch):
+        from .serializers import JobSerializer
+
+        # Resolve every author referenced by the batch in one query
+        author_ids = set()
+        for _, row, _ in batch:
+            if row and row.get('created_by_id') not in (None, ''):
+                try:
+                    author_ids.add(int(row['created_by_id']))
+                except (TypeError, ValueError):
+                    pass
+        authors = User.objects.in_bulk(author_ids)
+
+        jobs = []
+        for line_number, row, error in batch:
+            if error is None:
+                serializer = JobSerializer(data=row, context={'canonicalize_skills': False})
+                if serializer.is_valid():
+                    job, error = self.build_job(serializer.validated_data, authors)
+                else:
+                    error = serializer.errors
+            if error is not None:
+                self.add_error(line_number, error)
+            else:
+                jobs.append(job)
+
+        if not jobs:
+            return
+        with transaction.atomic():
+            for job in jobs:
+                job.required_skills, job.skill_ids = canonicalize(job.required_skills)
+            Job.objects.bulk_create(jobs)
+            self.index(jobs)
+        self.created += len(jobs)
+
+    def build_job(self, data, authors):
+        author_id = data.pop('created_by_id', None)
+        if author_id is None:
+            author = self.created_by
+        else:
+            author = authors.get(author_id)
+            if author is None:
+                return None, {'created_by_id': ['User not found.']}
+
+        job = Job(created_by=author, **data)
+        job.salary_min, job.salary_max, job.salary_currency = parse_salary_range(job.salary_range)
+        return job, None
+
+    def add_error(self, line_number, error):
+        self.failed += 1
+        if len(self.errors) < MAX_REPORTED_ERRORS:
+            self.errors.append({'row': line_number, 'errors': error})
+
+    def index(self, jobs):
+        rebuild_index(jobs, batch_size=self.batch_size)
+        add_active_counts(Counter(
+            skill_id for job in jobs if job.is_active for skill_id in set(job.skill_ids)
+        ))
+        adjust_active_total(sum(1 for job in jobs if job.is_active and job.skill_ids))
+        record_jobs_posted(jobs)
+        index_new_jobs_text(jobs)
+
+        terms = [job_terms({'is_active': job.is_active, 'required_skills': job.required_skills,
+                            'category': job.category, 'location': job.location}) for job in jobs]
+
+        def after_commit():
+            bump_catalogue_version()
+            for new_terms in terms:
+                autocomplete.replace({}, new_terms)
+        transaction.on_commit(after_commit)
+
+
+def import_jobs(stream, file_type, created_by, batch_size=IMPORT_BATCH_SIZE):
+    """Import jobs from a text stream; returns ``{'created', 'failed', 'errors'}``."""
+    return JobImporter(created_by, batch_size).run(read_rows(stream, file_type))
+
+
+def export_rows(file_type, queryset=None, chunk_size=2000):
+    """Yield the job catalogue as CSV or JSON Lines, one row at a time."""
+    if queryset is None:
+        queryset = Job.objects.order_by('id')
+    rows = queryset.values(*EXPORT_FIELDS).iterator(chunk_size=chunk_size)
+    return stream_rows(file_type, EXPORT_FIELDS, rows)
+
+
+def text_stream(binary):
+    """Wrap an uploaded (binary) file so rows can be read lazily as text."""
+    return io.TextIOWrapper(binary, encoding='utf-8-sig', newline='')
@@ -0,0 +1,54 @@
+# jobs/cache.py
+import hashlib
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.core.cache import cache
+
+CATALOGUE_VERSION_KEY = 'jobs:catalogue-version'
+
+
+def catalogue_version():
+    """Return the current job-catalogue version; it changes on every Job write."""
+    version = cache.get(CATALOGUE_VERSION_KEY)
+    if version is None:
+        cache.add(CATALOGUE_VERSION_KEY, 1, timeout=None)
+        version = cache.get(CATALOGUE_VERSION_KEY, 1)
+    return version
+
+
+def bump_catalogue_version():
+    try:
+        return cache.incr(CATALOGUE_VERSION_KEY)
+    except ValueError:
+        cache.add(CATALOGUE_VERSION_KEY, 1, timeout=None)
+        return cache.incr(CATALOGUE_VERSION_KEY)
+
+
+def response_cache_key(request, version):
+    """Cache key for an anonymous GET; equivalent query strings share one entry."""
+    params = sorted(
+        (name, value)
+        for name, values in request.query_params.lists()
+        for value in values
+        if value != ''
+    )
+    raw = f'{request.get_host()}{request.path}?{urlencode(params)}'
+    digest = hashlib.sha1(raw.encode(), usedforsecurity=False).hexdigest()
+    return f'jobs:response:{version}:{digest}'
+
+
+def response_etag(cache_key):
+    # The key embeds the catalogue version, so the tag changes on every Job write
+    return '"%s"' % hashlib.sha1(cache_key.encode(), usedforsecurity=False).hexdigest()
+
+
+def get_cached_response(cache_key):
+    """Return ``(data, last_modified)`` stored for ``cache_key``, or None."""
+    return cache.get(cache_key)
+
+
+def set_cached_response(cache_key, data, last_modified=None, timeout=None):
+    if timeout is None:
+        timeout = settings.JOB_RESPONSE_CACHE_TIMEOUT
+    cache.set(cache_key, (data, last_modified), timeout=timeout)
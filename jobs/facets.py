@@ -0,0 +1,30 @@
+# jobs/facets.py
+from collections import Counter
+
+from django.db.models import Count
+
+FACET_FIELDS = ('job_type', 'category', 'location')
+
+
+def facet_counts(queryset):
+    """Count jobs per ``job_type``, ``category`` and ``location`` in one grouped query.
+
+    The database groups by all three columns at once and the per-facet totals are
+    folded from those rows, so adding a facet never adds a query.
+    """
+    rows = queryset.order_by().values(*FACET_FIELDS).annotate(count=Count('id'))
+
+    counters = {field: Counter() for field in FACET_FIELDS}
+    total = 0
+    for row in rows:
+        total += row['count']
+        for field in FACET_FIELDS:
+            counters[field][row[field]] += row['count']
+
+    facets = {'total': total}
+    for field, counter in counters.items():
+        facets[field] = [
+            {'value': value, 'count': count}
+            for value, count in sorted(counter.items(), key=lambda item: (-item[1], item[0]))
+        ]
+    return facets
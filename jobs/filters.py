@@ -1,13 +1,83 @@
 import django_filters
+from rest_framework import filters
+from matching.models import JobSkill
+from matching.skills import registry
 from .models import Job
+from .salary import MAX_SALARY
+
+SKILL_MATCH_MODES = ('any', 'all')
+
+
+def filter_by_skills(queryset, names, match='any'):
+    """Restrict ``queryset`` to jobs requiring any (or all) of the given skills.
+
+    Names are resolved through the canonical vocabulary, so aliases match and
+    "Java" never matches "JavaScript". Filtering joins the indexed JobSkill
+    relation instead of scanning the ``required_skills`` JSON.
+    """
+    resolved = [registry.resolve([name], create=False) for name in names if name.strip()]
+    skill_ids = list(dict.fromkeys(skill_id for found in resolved for skill_id, _ in found))
+    # An unknown skill can never be satisfied when every skill is required
+    if not skill_ids or (match == 'all' and not all(resolved)):
+        return queryset.none()
+
+    if match == 'all':
+        # One join per skill, each served by the unique (job, skill) index
+        for skill_id in skill_ids:
+            queryset = queryset.filter(skill_index__skill_id=skill_id)
+        return queryset
+    return queryset.filter(
+        id__in=JobSkill.objects.filter(skill_id__in=skill_ids).values('job_id')
+    )
+
 
 class JobFilter(django_filters.FilterSet):
-    min_salary = django_filters.CharFilter(field_name='salary_range', lookup_expr='gte')
-    max_salary = django_filters.CharFilter(field_name='salary_range', lookup_expr='lte')
+    min_salary = django_filters.NumberFilter(
+        field_name='salary_min', method='filter_salary', min_value=0, max_value=MAX_SALARY
+    )
+    max_salary = django_filters.NumberFilter(
+        field_name='salary_max', method='filter_salary', min_value=0, max_value=MAX_SALARY
+    )
     location = django_filters.CharFilter(field_name='location', lookup_expr='icontains')
     category = django_filters.CharFilter(field_name='category', lookup_expr='icontains')
     job_type = django_filters.CharFilter(field_name='job_type')
+    skills = django_filters.CharFilter(method='filter_skills')
+    skills_match = django_filters.ChoiceFilter(
+        choices=[(mode, mode) for mode in SKILL_MATCH_MODES], method='ignore'
+    )
     
     class Meta:
         model = Job
-        fields = ['location', 'category', 'job_type', 'min_salary', 'max_salary']
\ No newline at end of file
+        fields = ['location', 'category', 'job_type', 'min_salary', 'max_salary', 'skills', 'skills_match']
+    
+    def filter_salary(self, queryset, name, value):
+        """``?min_salary=`` / ``?max_salary=`` as a range closed on both ends.
+
+        A one-sided bound makes SQLite walk the created_at index to avoid the
+        sort; a closed range is planned as a search of the salary index.
+        """
+        bounds = (value, MAX_SALARY) if name == 'salary_min' else (0, value)
+        return queryset.filter(**{f'{name}__range': bounds})
+    
+    def filter_skills(self, queryset, name, value):
+        """``?skills=python,django`` with ``?skills_match=all`` to require every skill."""
+        match = self.form.cleaned_data.get('skills_match') or 'any'
+        return filter_by_skills(queryset, value.split(','), match)
+    
+    def ignore(self, queryset, name, value):
+        # skills_match only modifies how filter_skills combines skills
+        return queryset
+
+
+class JobOrderingFilter(filters.OrderingFilter):
+    """OrderingFilter that sorts ``salary_range`` by the parsed numeric salary."""
+    aliases = {'salary_range': 'salary_min'}
+
+    def get_ordering(self, request, queryset, view):
+        ordering = super().get_ordering(request, queryset, view)
+        if not ordering:
+            return ordering
+        return [
+            ('-' if term.startswith('-') else '') + self.aliases.get(term.lstrip('-'), term.lstrip('-'))
+            for term in ordering
+        ]
@@ -0,0 +1,40 @@
+# jobs/management/commands/backfill_salaries.py
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from jobs.models import Job
+from jobs.salary import parse_salary_range
+
+
+class Command(BaseCommand):
+    help = 'Parse Job.salary_range into the numeric salary_min/salary_max/salary_currency columns'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        fields = ['salary_min', 'salary_max', 'salary_currency']
+        queryset = Job.objects.only('id', 'salary_range', *fields)
+
+        updated = 0
+        unparsed = 0
+        batch = []
+        for job in queryset.iterator(chunk_size=batch_size):
+            job.salary_min, job.salary_max, job.salary_currency = parse_salary_range(job.salary_range)
+            if job.salary_min is None:
+                unparsed += 1
+            batch.append(job)
+            if len(batch) >= batch_size:
+                with transaction.atomic():
+                    Job.objects.bulk_update(batch, fields)
+                updated += len(batch)
+                batch = []
+        if batch:
+            with transaction.atomic():
+                Job.objects.bulk_update(batch, fields)
+            updated += len(batch)
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Backfilled salaries for {updated} jobs ({unparsed} without a numeric salary)'
+        ))
@@ -0,0 +1,24 @@
+# jobs/management/commands/export_jobs.py
+from django.core.management.base import BaseCommand
+
+from jobs.bulk import FILE_TYPES, export_rows, file_type_for
+
+
+class Command(BaseCommand):
+    help = 'Stream the job catalogue to a CSV or JSON Lines file (stdout by default)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', nargs='?', default='-')
+        parser.add_argument('--file-type', choices=FILE_TYPES)
+
+    def handle(self, *args, **options):
+        path = options['path']
+        file_type = options['file_type'] or file_type_for(path)
+        if path == '-':
+            for chunk in export_rows(file_type):
+                self.stdout.write(chunk, ending='')
+            return
+
+        with open(path, 'w', encoding='utf-8', newline='') as stream:
+            stream.writelines(export_rows(file_type))
+        self.stderr.write(self.style.SUCCESS(f'Exported jobs to {path}'))
@@ -0,0 +1,38 @@
+# jobs/management/commands/import_jobs.py
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from jobs.bulk import FILE_TYPES, IMPORT_BATCH_SIZE, file_type_for, import_jobs
+from users.models import User
+
+
+class Command(BaseCommand):
+    help = 'Bulk-import jobs from a CSV or JSON Lines file ("-" reads stdin)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path')
+        parser.add_argument('--created-by', required=True,
+                            help='Email of the user owning rows without a created_by_id')
+        parser.add_argument('--file-type', choices=FILE_TYPES)
+        parser.add_argument('--batch-size', type=int, default=IMPORT_BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        try:
+            created_by = User.objects.get(email=options['created_by'])
+        except User.DoesNotExist:
+            raise CommandError(f"User {options['created_by']} not found")
+
+        path = options['path']
+        file_type = options['file_type'] or file_type_for(path)
+        if path == '-':
+            report = import_jobs(sys.stdin, file_type, created_by, options['batch_size'])
+        else:
+            with open(path, encoding='utf-8-sig', newline='') as stream:
+                report = import_jobs(stream, file_type, created_by, options['batch_size'])
+
+        for error in report['errors']:
+            self.stderr.write(f"Row {error['row']}: {error['errors']}")
+        self.stdout.write(self.style.SUCCESS(
+            f"Imported {report['created']} jobs ({report['failed']} rows rejected)"
+        ))
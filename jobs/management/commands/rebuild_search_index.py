@@ -0,0 +1,12 @@
+# jobs/management/commands/rebuild_search_index.py
+from django.core.management.base import BaseCommand
+
+from jobs.search import rebuild_search_index
+
+
+class Command(BaseCommand):
+    help = 'Repopulate the job full-text search index (SQLite FTS5; PostgreSQL indexes itself)'
+
+    def handle(self, *args, **options):
+        rebuild_search_index()
+        self.stdout.write(self.style.SUCCESS('Rebuilt the job search index'))
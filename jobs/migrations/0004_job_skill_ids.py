@@ -0,0 +1,18 @@
+# Generated by Django 5.2.8 on 2026-10-18 14:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0003_alter_job_id'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='job',
+            name='skill_ids',
+            field=models.JSONField(blank=True, default=list, editable=False),
+        ),
+    ]
@@ -0,0 +1,42 @@
+from django.db import migrations
+
+
+def create_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'sqlite':
+        schema_editor.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS jobs_job_fts USING fts5("
+            "title, description, category, location, tokenize = 'unicode61 remove_diacritics 2')"
+        )
+        schema_editor.execute(
+            "INSERT INTO jobs_job_fts (rowid, title, description, category, location) "
+            "SELECT id, title, description, category, location FROM jobs_job"
+        )
+    elif vendor == 'postgresql':
+        # Must match the expression SearchVector(*SEARCH_FIELDS, config='english') emits; text
+        # columns are not cast, so a ::text here would keep the planner off the index
+        schema_editor.execute(
+            "CREATE INDEX IF NOT EXISTS jobs_job_search_gin ON jobs_job USING GIN ("
+            "to_tsvector('english'::regconfig, "
+            "COALESCE(title, '') || ' ' || COALESCE(description, '') || ' ' || "
+            "COALESCE(category, '') || ' ' || COALESCE(location, '')))"
+        )
+
+
+def drop_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    if vendor == 'sqlite':
+        schema_editor.execute("DROP TABLE IF EXISTS jobs_job_fts")
+    elif vendor == 'postgresql':
+        schema_editor.execute("DROP INDEX IF EXISTS jobs_job_search_gin")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0004_job_skill_ids'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
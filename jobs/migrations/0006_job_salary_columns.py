@@ -0,0 +1,28 @@
+# Generated by Django 5.2.8 on 2026-10-18 15:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0005_job_search_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='job',
+            name='salary_currency',
+            field=models.CharField(blank=True, default='', editable=False, max_length=3),
+        ),
+        migrations.AddField(
+            model_name='job',
+            name='salary_max',
+            field=models.PositiveBigIntegerField(blank=True, db_index=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='job',
+            name='salary_min',
+            field=models.PositiveBigIntegerField(blank=True, db_index=True, editable=False, null=True),
+        ),
+    ]
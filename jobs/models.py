@@ -1,6 +1,8 @@
 # jobs/models.py
 from django.db import models
 
+from .salary import parse_salary_range
+
 class Job(models.Model):
     JOB_TYPES = [
         ("full-time", "Full Time"),
@@ -16,12 +18,35 @@ class Job(models.Model):
     description = models.TextField()
     category = models.CharField(max_length=255)
     required_skills = models.JSONField(null=True, blank=True)
+    skill_ids = models.JSONField(default=list, blank=True, editable=False)
     salary_range = models.CharField(max_length=255)
+    # Parsed from salary_range on save so filters and ordering can use indexes
+    salary_min = models.PositiveBigIntegerField(null=True, blank=True, db_index=True, editable=False)
+    salary_max = models.PositiveBigIntegerField(null=True, blank=True, db_index=True, editable=False)
+    salary_currency = models.CharField(max_length=3, blank=True, default='', editable=False)
     location = models.CharField(max_length=255)
     job_type = models.CharField(max_length=20, choices=JOB_TYPES)
     is_active = models.BooleanField(default=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        # Shaped after the JobViewSet / JobFilter / matching query patterns:
+        # equality filter first, then the created_at sort key
+        indexes = [
+            models.Index(fields=['created_at', 'id']),
+            models.Index(fields=['is_active', 'created_at']),
+            models.Index(fields=['job_type', 'created_at']),
+            models.Index(fields=['created_by', 'created_at']),
+        ]
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or 'salary_range' in update_fields:
+            self.salary_min, self.salary_max, self.salary_currency = parse_salary_range(self.salary_range)
+            if update_fields is not None:
+                kwargs['update_fields'] = {*update_fields, 'salary_min', 'salary_max', 'salary_currency'}
+        super().save(*args, **kwargs)
+
     def __str__(self):
         return self.title
\ No newline at end of file
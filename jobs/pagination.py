@@ -0,0 +1,140 @@
+# jobs/pagination.py
+import base64
+import json
+from datetime import datetime
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError as DjangoValidationError
+from django.db import connections
+from django.db.models import Q
+from rest_framework.exceptions import ValidationError
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import replace_query_param
+
+DEFAULT_ORDERING = ('-created_at', '-id')
+
+
+def encode_cursor(value, object_id):
+    """Opaque cursor pointing just past ``(value, object_id)`` in listing order."""
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    raw = json.dumps([value, object_id], separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def decode_cursor(value):
+    """Inverse of ``encode_cursor``; raises ValueError for anything but a ``[scalar, int]`` pair."""
+    try:
+        position, object_id = json.loads(base64.urlsafe_b64decode(value.encode()))
+    except (UnicodeError, ValueError, TypeError) as exc:
+        raise ValueError('Invalid cursor') from exc
+    if isinstance(position, (list, dict)) or type(object_id) is not int:
+        raise ValueError('Invalid cursor')
+    return position, object_id
+
+
+class KeysetPagination(BasePagination):
+    """Cursor pagination that seeks past the last row instead of counting and offsetting.
+
+    The queryset is ordered by its first ordering term plus ``id`` as a tie-break,
+    and each page is ``WHERE (key, id) > cursor LIMIT page_size + 1``, so page 500
+    costs the same as page one. No ``COUNT(*)`` is run; responses carry
+    ``next`` and ``results`` only.
+    """
+    page_size = api_settings.PAGE_SIZE or 10
+    page_size_query_param = 'page_size'
+    max_page_size = 50
+    cursor_query_param = 'cursor'
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        self.field, self.descending = self.get_ordering(queryset)
+        id_order = '-id' if self.descending else 'id'
+        queryset = queryset.order_by(self.ordering_term(), id_order)
+
+        cursor = request.query_params.get(self.cursor_query_param)
+        if cursor:
+            try:
+                position, object_id = decode_cursor(cursor)
+                position = self.to_python(queryset.model, position)
+            except (ValueError, TypeError, DjangoValidationError):
+                raise ValidationError({'error': 'Invalid cursor'})
+            queryset = queryset.filter(self.after(queryset, position, object_id))
+
+        rows = list(queryset[:self.page_size + 1])
+        self.has_next = len(rows) > self.page_size
+        self.page = rows[:self.page_size]
+        return self.page
+
+    def get_paginated_response(self, data):
+        return Response({
+            'next': self.get_next_link(),
+            'results': data,
+        })
+
+    def get_page_size(self, request):
+        try:
+            size = int(request.query_params.get(self.page_size_query_param, self.page_size))
+        except ValueError:
+            return self.page_size
+        return max(1, min(size, self.max_page_size))
+
+    def get_ordering(self, queryset):
+        """``(field, descending)`` for the first plain field the queryset is ordered by."""
+        ordering = [term for term in queryset.query.order_by if isinstance(term, str)]
+        term = ordering[0] if ordering else DEFAULT_ORDERING[0]
+        field = term.lstrip('-')
+        if field == 'pk':
+            field = 'id'
+        return field, term.startswith('-')
+
+    def ordering_term(self):
+        return f"-{self.field}" if self.descending else self.field
+
+    def to_python(self, model, value):
+        if value is None:
+            return None
+        try:
+            return model._meta.get_field(self.field).to_python(value)
+        except FieldDoesNotExist:
+            # Annotations such as the full-text search_rank
+            return value
+
+    def nullable(self, model):
+        try:
+            return model._meta.get_field(self.field).null
+        except FieldDoesNotExist:
+            return True
+
+    def after(self, queryset, position, object_id):
+        """Rows strictly after ``(position, object_id)`` in the current ordering."""
+        op = 'lt' if self.descending else 'gt'
+        after_id = Q(**{f'id__{op}': object_id})
+        if self.field == 'id':
+            return after_id
+
+        condition = Q(**{f'{self.field}__{op}': position}) | (Q(**{self.field: position}) & after_id)
+        if not self.nullable(queryset.model):
+            # Without an "OR key IS NULL" branch the condition is an index seek
+            return condition
+
+        # NULL keys sort as the largest value on some backends, the smallest on others
+        nulls_largest = connections[queryset.db].features.nulls_order_largest
+        nulls_last = nulls_largest != self.descending
+        is_null = Q(**{f'{self.field}__isnull': True})
+
+        if position is None:
+            condition = is_null & after_id
+            return condition if nulls_last else condition | ~is_null
+
+        return condition | is_null if nulls_last else condition
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        last = self.page[-1]
+        position = last.id if self.field == 'id' else getattr(last, self.field)
+        cursor = encode_cursor(position, last.id)
+        return replace_query_param(self.request.build_absolute_uri(), self.cursor_query_param, cursor)
@@ -0,0 +1,59 @@
+# jobs/salary.py
+import re
+from decimal import Decimal, InvalidOperation
+
+CURRENCY_SYMBOLS = [
+    ('GH₵', 'GHS'), ('KSh', 'KES'), ('US$', 'USD'),
+    ('₦', 'NGN'), ('$', 'USD'), ('€', 'EUR'), ('£', 'GBP'), ('₵', 'GHS'), ('₹', 'INR'),
+]
+CURRENCY_CODES = {
+    'USD', 'EUR', 'GBP', 'NGN', 'KES', 'GHS', 'ZAR', 'EGP', 'MAD', 'RWF',
+    'UGX', 'TZS', 'ETB', 'XOF', 'XAF', 'CAD', 'AUD', 'INR', 'CHF',
+}
+MULTIPLIERS = {'k': 1000, 'm': 1000000}
+# Largest value Job.salary_min/salary_max (PositiveBigIntegerField) can store
+MAX_SALARY = 9223372036854775807
+
+_AMOUNT = re.compile(r'(\d[\d,]*(?:\.\d+)?)\s*([kKmM](?![a-zA-Z]))?')
+_CODE = re.compile(r'\b([A-Za-z]{3})\b')
+
+
+def parse_salary_range(text):
+    """Parse free-text salary into ``(salary_min, salary_max, currency)``.
+
+    Handles forms like "$1,000 - $2,000", "50k-70k USD", "₦500000" and
+    "100000". Unparseable input ("Negotiable") yields ``(None, None, '')``;
+    amounts above ``MAX_SALARY`` are ignored rather than overflowing the column.
+    """
+    text = text or ''
+
+    amounts = []
+    for number, suffix in _AMOUNT.findall(text):
+        try:
+            value = Decimal(number.replace(',', ''))
+        except InvalidOperation:
+            continue
+        if suffix:
+            value *= MULTIPLIERS[suffix.lower()]
+        if value > MAX_SALARY:
+            continue
+        amounts.append(int(value))
+        if len(amounts) == 2:
+            break
+
+    if not amounts:
+        return None, None, _currency(text)
+    low, high = amounts[0], amounts[-1]
+    if low > high:
+        low, high = high, low
+    return low, high, _currency(text)
+
+
+def _currency(text):
+    for symbol, code in CURRENCY_SYMBOLS:
+        if symbol in text:
+            return code
+    for candidate in _CODE.findall(text):
+        if candidate.upper() in CURRENCY_CODES:
+            return candidate.upper()
+    return ''
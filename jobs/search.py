@@ -0,0 +1,117 @@
+# jobs/search.py
+import re
+
+from django.db import connections
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
+
+SEARCH_FIELDS = ('title', 'description', 'category', 'location')
+FTS_TABLE = 'jobs_job_fts'
+
+_TERMS = re.compile(r'\w+', re.UNICODE)
+
+
+def search_terms(query):
+    """Split a free-text query into words; punctuation is ignored."""
+    return _TERMS.findall(query or '')
+
+
+def search_jobs(queryset, query):
+    """Restrict ``queryset`` to jobs matching every word of ``query``, best match first.
+
+    SQLite uses the FTS5 table kept in sync by jobs.signals, PostgreSQL uses the
+    GIN-indexed tsvector from migration 0005; other backends fall back to
+    ``icontains`` lookups.
+    """
+    terms = search_terms(query)
+    if not terms:
+        return queryset.none()
+
+    vendor = connections[queryset.db].vendor
+    if vendor == 'sqlite':
+        return _search_sqlite(queryset, terms)
+    if vendor == 'postgresql':
+        return _search_postgresql(queryset, terms)
+    return _search_fallback(queryset, terms)
+
+
+def _search_sqlite(queryset, terms):
+    # Quote every term so user input cannot inject FTS5 query syntax; words are ANDed
+    match = ' '.join('"%s"' % term.replace('"', '""') for term in terms)
+    table = queryset.model._meta.db_table
+    return queryset.filter(
+        id__in=RawSQL(f'SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s', (match,))
+    ).annotate(
+        # bm25() is lower-is-better; negate so every backend sorts rank descending
+        search_rank=RawSQL(
+            f'SELECT -bm25({FTS_TABLE}) FROM {FTS_TABLE} '
+            f'WHERE {FTS_TABLE} MATCH %s AND rowid = "{table}"."id"',
+            (match,)
+        )
+    ).order_by('-search_rank', '-created_at')
+
+
+def _search_postgresql(queryset, terms):
+    from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+
+    vector = SearchVector(*SEARCH_FIELDS, config='english')
+    search_query = SearchQuery(' '.join(terms), config='english', search_type='plain')
+    return queryset.annotate(
+        search_document=vector,
+        search_rank=SearchRank(vector, search_query),
+    ).filter(search_document=search_query).order_by('-search_rank', '-created_at')
+
+
+def _search_fallback(queryset, terms):
+    for term in terms:
+        matches_term = Q()
+        for field in SEARCH_FIELDS:
+            matches_term |= Q(**{f'{field}__icontains': term})
+        queryset = queryset.filter(matches_term)
+    return queryset.order_by('-created_at')
+
+
+def index_job_text(job, using='default'):
+    """Upsert one job's searchable text into the SQLite FTS table."""
+    connection = connections[using]
+    if connection.vendor != 'sqlite':
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(f'DELETE FROM {FTS_TABLE} WHERE rowid = %s', [job.pk])
+        cursor.execute(
+            f'INSERT INTO {FTS_TABLE} (rowid, {", ".join(SEARCH_FIELDS)}) VALUES (%s, %s, %s, %s, %s)',
+            [job.pk] + [getattr(job, field) for field in SEARCH_FIELDS]
+        )
+
+
+def index_new_jobs_text(jobs, using='default'):
+    """Insert the searchable text of freshly bulk-created jobs in one round trip."""
+    connection = connections[using]
+    if connection.vendor != 'sqlite' or not jobs:
+        return
+    with connection.cursor() as cursor:
+        cursor.executemany(
+            f'INSERT INTO {FTS_TABLE} (rowid, {", ".join(SEARCH_FIELDS)}) VALUES (%s, %s, %s, %s, %s)',
+            [[job.pk] + [getattr(job, field) for field in SEARCH_FIELDS] for job in jobs]
+        )
+
+
+def unindex_job_text(job_id, using='default'):
+    connection = connections[using]
+    if connection.vendor != 'sqlite':
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(f'DELETE FROM {FTS_TABLE} WHERE rowid = %s', [job_id])
+
+
+def rebuild_search_index(using='default'):
+    """Repopulate the SQLite FTS table from jobs_job (after bulk loads or restores)."""
+    connection = connections[using]
+    if connection.vendor != 'sqlite':
+        return
+    with connection.cursor() as cursor:
+        cursor.execute(f'DELETE FROM {FTS_TABLE}')
+        cursor.execute(
+            f'INSERT INTO {FTS_TABLE} (rowid, {", ".join(SEARCH_FIELDS)}) '
+            f'SELECT id, {", ".join(SEARCH_FIELDS)} FROM jobs_job'
+        )
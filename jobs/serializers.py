@@ -1,6 +1,9 @@
 # jobs/serializers.py
+from django.core.exceptions import ObjectDoesNotExist
 from rest_framework import serializers
 from .models import Job
+from applications.counters import COUNTER_FIELDS
+from matching.skills import canonicalize
 
 
 class SimpleUserSerializer(serializers.Serializer):
@@ -13,16 +16,54 @@ class SimpleUserSerializer(serializers.Serializer):
 class JobSerializer(serializers.ModelSerializer):
     created_by = SimpleUserSerializer(read_only=True)
     created_by_id = serializers.IntegerField(write_only=True, required=False)
+    application_counts = serializers.SerializerMethodField()
     
     class Meta:
         model = Job
         fields = [
             'id', 'title', 'description', 'category',
-            'required_skills', 'salary_range', 'location',
+            'required_skills', 'salary_range', 'salary_min', 'salary_max',
+            'salary_currency', 'location',
             'job_type', 'created_by', 'created_by_id',
-            'is_active', 'created_at', 'updated_at'
+            'is_active', 'application_counts', 'created_at', 'updated_at'
         ]
-        read_only_fields = ['created_at', 'updated_at']
+        read_only_fields = ['salary_min', 'salary_max', 'salary_currency', 'created_at', 'updated_at']
+    
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        # Counts are private to the job's owner and admins; everything else can be cached publicly
+        if not self.can_see_applications(instance):
+            data.pop('application_counts', None)
+        return data
+    
+    def can_see_applications(self, obj):
+        request = self.context.get('request')
+        user = getattr(request, 'user', None)
+        if user is None or not user.is_authenticated:
+            return False
+        return obj.created_by_id == user.id or user.role == 'admin' or user.is_staff
+    
+    def get_application_counts(self, obj):
+        if not self.can_see_applications(obj):
+            return None
+        # Denormalized counters; select_related('application_stats') avoids a query per job
+        try:
+            stats = obj.application_stats
+        except ObjectDoesNotExist:
+            stats = None
+        return {field: getattr(stats, field, 0) for field in COUNTER_FIELDS}
+    
+    def validate_required_skills(self, value):
+        if value is None:
+            return value
+        if not isinstance(value, list) or not all(isinstance(skill, str) for skill in value):
+            raise serializers.ValidationError("Required skills must be a list of strings.")
+        # The bulk importer canonicalizes accepted rows itself, inside its batch transaction
+        if not self.context.get('canonicalize_skills', True):
+            return value
+        # Map spellings and aliases ("python ", "Py") onto the canonical vocabulary
+        names, _ = canonicalize(value)
+        return names
     
     def create(self, validated_data):
         # Remove created_by_id if present
@@ -0,0 +1,98 @@
+# jobs/signals.py
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from users.models import User
+from .autocomplete import autocomplete, job_terms, user_terms
+from .cache import bump_catalogue_version
+from .models import Job
+from .search import index_job_text, unindex_job_text
+
+
+@receiver(post_save, sender=Job)
+@receiver(post_delete, sender=Job)
+def job_catalogue_changed(sender, raw=False, **kwargs):
+    """Invalidate everything derived from the job catalogue once the write commits."""
+    if raw:
+        return
+    transaction.on_commit(bump_catalogue_version)
+
+
+@receiver(post_save, sender=User)
+def job_author_changed(sender, instance, raw=False, update_fields=None, **kwargs):
+    """Jobs embed their author's public profile, so edits to it also change the catalogue."""
+    if raw or instance.role not in ('recruiter', 'admin'):
+        return
+    if update_fields is not None and not {'email', 'full_name', 'role', 'image_url'} & set(update_fields):
+        return
+    transaction.on_commit(bump_catalogue_version)
+
+
+@receiver(post_save, sender=Job)
+def sync_job_search_index(sender, instance, raw=False, using='default', update_fields=None, **kwargs):
+    """Keep the full-text index in step with the searchable columns."""
+    if update_fields is not None and not {'title', 'description', 'category', 'location'} & set(update_fields):
+        return
+    index_job_text(instance, using=using)
+
+
+@receiver(post_delete, sender=Job)
+def remove_job_from_search_index(sender, instance, using='default', **kwargs):
+    unindex_job_text(instance.pk, using=using)
+
+
+JOB_TERM_FIELDS = ('is_active', 'required_skills', 'category', 'location')
+USER_TERM_FIELDS = ('role', 'is_active', 'skills')
+
+
+def _terms_changed(update_fields, fields):
+    return update_fields is None or bool(set(fields) & set(update_fields))
+
+
+@receiver(pre_save, sender=Job)
+def remember_job_terms(sender, instance, raw=False, update_fields=None, **kwargs):
+    """Snapshot the stored values so the autocomplete index can drop them after the save."""
+    instance._autocomplete_terms = {}
+    if raw or not autocomplete.is_built or instance.pk is None:
+        return
+    if _terms_changed(update_fields, JOB_TERM_FIELDS):
+        instance._autocomplete_terms = job_terms(
+            Job.objects.filter(pk=instance.pk).values(*JOB_TERM_FIELDS).first()
+        )
+
+
+@receiver(post_save, sender=Job)
+def update_job_autocomplete(sender, instance, raw=False, update_fields=None, **kwargs):
+    if raw or not autocomplete.is_built or not _terms_changed(update_fields, JOB_TERM_FIELDS):
+        return
+    old = getattr(instance, '_autocomplete_terms', {})
+    new = job_terms({field: getattr(instance, field) for field in JOB_TERM_FIELDS})
+    transaction.on_commit(lambda: autocomplete.replace(old, new))
+
+
+@receiver(post_delete, sender=Job)
+def remove_job_from_autocomplete(sender, instance, **kwargs):
+    if autocomplete.is_built:
+        old = job_terms({field: getattr(instance, field) for field in JOB_TERM_FIELDS})
+        transaction.on_commit(lambda: autocomplete.replace(old, {}))
+
+
+@receiver(pre_save, sender=User)
+def remember_user_terms(sender, instance, raw=False, update_fields=None, **kwargs):
+    instance._autocomplete_terms = {}
+    if raw or not autocomplete.is_built or instance.pk is None:
+        return
+    if _terms_changed(update_fields, USER_TERM_FIELDS):
+        instance._autocomplete_terms = user_terms(
+            User.objects.filter(pk=instance.pk).values(*USER_TERM_FIELDS).first()
+        )
+
+
+@receiver(post_save, sender=User)
+def update_user_autocomplete(sender, instance, raw=False, update_fields=None, **kwargs):
+    if raw or not autocomplete.is_built or not _terms_changed(update_fields, USER_TERM_FIELDS):
+        return
+    old = getattr(instance, '_autocomplete_terms', {})
+    new = user_terms({field: getattr(instance, field) for field in USER_TERM_FIELDS})
+    transaction.on_commit(lambda: autocomplete.replace(old, new))
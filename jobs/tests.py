@@ -1,6 +1,658 @@
-# tests.py in each app
-from django.test import TestCase
+# jobs/tests.py
+import base64
+import io
+import json
+from unittest import mock, skipUnless
+
+from django.core.cache import cache
+from django.db import connection
+from django.test import SimpleTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from rest_framework.test import APITestCase
-from rest_framework import status
-from django.urls import reverse
-from .models import YourModel
\ No newline at end of file
+
+from afriremotely.testing import QueryCountAssertionsMixin, QueryPlanAssertionsMixin
+from matching.cache import match_cache
+from matching.models import Skill
+from matching.skills import registry
+from matching.stats import skill_weights
+from users.models import User
+from .autocomplete import PrefixIndex, autocomplete
+from .bulk import EXPORT_FIELDS, JobImporter
+from .models import Job
+from .salary import MAX_SALARY, parse_salary_range
+from .search import FTS_TABLE, SEARCH_FIELDS, search_jobs
+
+
+@override_settings(BACKGROUND_TASKS_EAGER=True)
+class JobTestCase(APITestCase):
+    def setUp(self):
+        # Fixture skills are cached as committed below, then rolled back with the test
+        registry.clear()
+        match_cache.clear()
+        cache.clear()
+        autocomplete.clear()
+        skill_weights.clear()
+        self.recruiter = User.objects.create_user(
+            email='recruiter@example.com', password='testpass123',
+            full_name='Recruiter', role='recruiter'
+        )
+        # Fixtures behave as committed data, so the registry caches their skills
+        with self.captureOnCommitCallbacks(execute=True):
+            self.jobs = self.create_fixture_jobs()
+
+    def create_fixture_jobs(self):
+        return [
+            self.create_job(title='Backend Engineer', category='Engineering', location='Lagos',
+                            job_type='remote', salary_range='$3,000 - $5,000', required_skills=['Python', 'Django']),
+            self.create_job(title='Product Designer', category='Design', location='Nairobi',
+                            job_type='contract', salary_range='2000', required_skills=['Figma']),
+            self.create_job(title='Data Analyst', category='Data', location='Accra',
+                            job_type='full-time', salary_range='Negotiable', required_skills=['SQL', 'Python']),
+        ]
+
+    def create_job(self, **fields):
+        defaults = {
+            'created_by': self.recruiter,
+            'title': 'Job',
+            'description': 'Description',
+            'category': 'Engineering',
+            'required_skills': [],
+            'salary_range': '1000',
+            'location': 'Remote',
+            'job_type': 'remote',
+        }
+        defaults.update(fields)
+        return Job.objects.create(**defaults)
+
+
+class JobListingQueryPlanTests(QueryPlanAssertionsMixin, JobTestCase):
+    """Listing endpoints must be served by an index, never a full scan of jobs_job."""
+
+    def assertIndexed(self, url, exempt=()):
+        with self.assertNoFullTableScan(exempt=exempt):
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return response
+
+    def test_list(self):
+        self.assertIndexed('/api/jobs/jobs/')
+
+    def test_index_walks_count_as_full_scans(self):
+        walk = ['SCAN jobs_job USING INDEX jobs_job_created_45443d_idx']
+        self.assertEqual(self.full_scans(walk, 'SELECT * FROM jobs_job WHERE salary_min >= 1 LIMIT 11'), walk)
+        self.assertEqual(self.full_scans(walk, 'SELECT * FROM jobs_job ORDER BY created_at'), walk)
+        self.assertEqual(self.full_scans(walk, 'SELECT * FROM jobs_job ORDER BY created_at LIMIT 11'), [])
+        self.assertEqual(self.full_scans(['SEARCH jobs_job USING INDEX jobs_job_salary_min (salary_min>?)'],
+                                         'SELECT * FROM jobs_job WHERE salary_min >= 1'), [])
+
+    def test_list_filtered_by_job_type(self):
+        response = self.assertIndexed('/api/jobs/jobs/?job_type=remote')
+        self.assertEqual([job['title'] for job in response.data['results']], ['Backend Engineer'])
+
+    def test_list_filtered_by_salary(self):
+        for url, column, titles in (('/api/jobs/jobs/?min_salary=2500', 'salary_min', ['Backend Engineer']),
+                                    ('/api/jobs/jobs/?max_salary=2500', 'salary_max', ['Product Designer'])):
+            with self.assertNoFullTableScan() as queries:
+                response = self.client.get(url)
+            self.assertEqual([job['title'] for job in response.data['results']], titles)
+            # A range search of the salary index, not a walk of the created_at index
+            plan = self.explain(queries.captured_queries[0]['sql'])
+            self.assertTrue(plan[0].startswith(f'SEARCH jobs_job USING INDEX jobs_job_{column}'), plan)
+
+    def test_salary_filter_out_of_range(self):
+        response = self.client.get('/api/jobs/jobs/?min_salary=99999999999999999999')
+        self.assertEqual(response.status_code, 400)
+
+    def test_list_ordered(self):
+        self.assertIndexed('/api/jobs/jobs/?ordering=created_at')
+        self.assertIndexed('/api/jobs/jobs/?ordering=-salary_range')
+
+    def test_my_jobs(self):
+        self.client.force_authenticate(self.recruiter)
+        response = self.assertIndexed('/api/jobs/jobs/my_jobs/')
+        self.assertEqual(len(response.data['results']), 3)
+
+    def test_filter_by_type(self):
+        self.assertIndexed('/api/jobs/jobs/type/contract/')
+
+    def test_filter_by_location_and_category(self):
+        # Substring matches (icontains) can never search an index: known exceptions, named per query
+        location, category = '"jobs_job"."location" LIKE', '"jobs_job"."category" LIKE'
+        self.assertIndexed('/api/jobs/jobs/location/lagos/', exempt=[location])
+        self.assertIndexed('/api/jobs/jobs/category/design/', exempt=[category])
+        self.assertIndexed('/api/jobs/jobs/?location=lagos&category=engineering', exempt=[location])
+        with self.assertRaises(AssertionError):
+            self.assertIndexed('/api/jobs/jobs/location/lagos/')
+        # An exemption for one filter does not cover another
+        with self.assertRaises(AssertionError):
+            self.assertIndexed('/api/jobs/jobs/category/design/', exempt=[location])
+        # Nor outlives the scan it was written for
+        with self.assertRaises(AssertionError):
+            self.assertIndexed('/api/jobs/jobs/type/contract/', exempt=[location])
+
+    def test_deep_page(self):
+        first = self.client.get('/api/jobs/jobs/?page_size=1')
+        with self.assertNoFullTableScan() as queries:
+            self.client.get(first.data['next'])
+        # The cursor seeks into the (created_at, id) index instead of walking it from the top
+        plan = self.explain(queries.captured_queries[0]['sql'])
+        self.assertTrue(plan[0].startswith('SEARCH jobs_job USING INDEX jobs_job_created_45443d_idx'), plan)
+
+    def test_keyword_search(self):
+        response = self.assertIndexed('/api/jobs/jobs/search_keyword/?keyword=designer')
+        self.assertEqual([job['title'] for job in response.data['results']], ['Product Designer'])
+
+
+class SalaryParserTests(SimpleTestCase):
+    def test_ranges_and_currencies(self):
+        self.assertEqual(parse_salary_range('$1,000 - $2,000'), (1000, 2000, 'USD'))
+        self.assertEqual(parse_salary_range('50k-70k USD'), (50000, 70000, 'USD'))
+        self.assertEqual(parse_salary_range('₦500000'), (500000, 500000, 'NGN'))
+        self.assertEqual(parse_salary_range('KSh 2m - 1.5m'), (1500000, 2000000, 'KES'))
+        self.assertEqual(parse_salary_range('GH₵ 3,500 monthly'), (3500, 3500, 'GHS'))
+
+    def test_unparseable(self):
+        self.assertEqual(parse_salary_range('Negotiable'), (None, None, ''))
+        self.assertEqual(parse_salary_range(''), (None, None, ''))
+        self.assertEqual(parse_salary_range(None), (None, None, ''))
+
+    def test_amounts_beyond_the_column_are_ignored(self):
+        self.assertEqual(parse_salary_range('$99999999999999999999'), (None, None, 'USD'))
+        self.assertEqual(parse_salary_range('9999999999999m'), (None, None, ''))
+        self.assertEqual(parse_salary_range(f'{MAX_SALARY}'), (MAX_SALARY, MAX_SALARY, ''))
+        self.assertEqual(parse_salary_range('$1,000 - $99999999999999999999'), (1000, 1000, 'USD'))
+
+
+class JobSalaryTests(JobTestCase):
+    def test_salary_beyond_the_column_is_stored_as_null(self):
+        self.client.force_authenticate(self.recruiter)
+        response = self.client.post('/api/jobs/jobs/', {
+            'title': 'Typo', 'description': 'Description', 'category': 'Engineering',
+            'required_skills': ['Python'], 'salary_range': '$99999999999999999999',
+            'location': 'Lagos', 'job_type': 'remote',
+        }, format='json')
+        self.assertEqual(response.status_code, 201)
+        job = Job.objects.get(title='Typo')
+        self.assertEqual((job.salary_min, job.salary_max, job.salary_currency), (None, None, 'USD'))
+
+
+class JobKeysetPaginationTests(JobTestCase):
+    def walk(self, url):
+        titles = []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            self.assertNotIn('count', response.data)
+            titles += [job['title'] for job in response.data['results']]
+            url = response.data['next']
+        return titles
+
+    def test_default_order_is_newest_first(self):
+        self.assertEqual(
+            self.walk('/api/jobs/jobs/?page_size=1'),
+            ['Data Analyst', 'Product Designer', 'Backend Engineer']
+        )
+
+    def test_pages_by_salary_including_unparsed_salaries(self):
+        titles = self.walk('/api/jobs/jobs/?page_size=1&ordering=salary_range')
+        self.assertEqual(sorted(titles), sorted(job.title for job in self.jobs))
+        self.assertLess(titles.index('Product Designer'), titles.index('Backend Engineer'))
+
+        descending = self.walk('/api/jobs/jobs/?page_size=1&ordering=-salary_range')
+        self.assertEqual(sorted(descending), sorted(titles))
+        self.assertLess(descending.index('Backend Engineer'), descending.index('Product Designer'))
+
+    def test_filter_endpoints_are_paginated(self):
+        for _ in range(3):
+            self.create_job(title='Remote Engineer', job_type='remote')
+        response = self.client.get('/api/jobs/jobs/type/remote/?page_size=2')
+        self.assertEqual(len(response.data['results']), 2)
+        self.assertEqual(len(self.walk('/api/jobs/jobs/type/remote/?page_size=2')), 4)
+
+    def test_page_size_is_capped(self):
+        for _ in range(60):
+            self.create_job()
+        response = self.client.get('/api/jobs/jobs/?page_size=1000')
+        self.assertEqual(len(response.data['results']), 50)
+
+    def test_invalid_cursor(self):
+        response = self.client.get('/api/jobs/jobs/?cursor=not-a-cursor')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.data, {'error': 'Invalid cursor'})
+
+    def test_cursor_of_the_wrong_shape(self):
+        # Valid base64 JSON that is not a [scalar, int] pair, or a position of the wrong type
+        for raw in ('[[1],5]', '[{"a":1},5]', '["2024-01-01T00:00:00",[5]]', '["x","5"]', '[1,5]', '[1]', '{}', '5'):
+            cursor = base64.urlsafe_b64encode(raw.encode()).decode()
+            response = self.client.get('/api/jobs/jobs/', {'cursor': cursor})
+            self.assertEqual(response.status_code, 400, raw)
+            self.assertEqual(response.data, {'error': 'Invalid cursor'})
+
+
+class JobQueryCountTests(QueryCountAssertionsMixin, JobTestCase):
+    """A page of jobs and their recruiters loads in one query, however many rows it holds."""
+
+    def setUp(self):
+        super().setUp()
+        for index in range(10):
+            recruiter = User.objects.create_user(
+                email=f'recruiter{index}@example.com', password=None,
+                full_name=f'Recruiter {index}', role='recruiter'
+            )
+            self.create_job(created_by=recruiter)
+
+    def test_list(self):
+        response = self.assertRequestQueries(1, '/api/jobs/jobs/')
+        self.assertEqual(len(response.data['results']), 10)
+
+    def test_filtered_listing(self):
+        self.assertRequestQueries(1, '/api/jobs/jobs/type/remote/')
+
+    def test_my_jobs(self):
+        self.client.force_authenticate(self.recruiter)
+        self.assertRequestQueries(1, '/api/jobs/jobs/my_jobs/')
+
+    def test_counters_are_joined_only_for_viewers_who_see_them(self):
+        seeker = User.objects.create_user(email='seeker@example.com', password=None,
+                                          full_name='Seeker', role='job_seeker')
+        admin = User.objects.create_user(email='admin@example.com', password=None,
+                                         full_name='Admin', role='admin')
+        for user, joined in ((None, False), (seeker, False), (self.recruiter, True), (admin, True)):
+            self.client.force_authenticate(user)
+            with CaptureQueriesContext(connection) as queries:
+                self.client.get('/api/jobs/jobs/')
+            self.assertEqual(len(queries), 1)
+            self.assertEqual('applications_jobapplicationstats' in queries[0]['sql'], joined)
+
+
+class JobResponseCacheTests(QueryCountAssertionsMixin, JobTestCase):
+    def test_repeat_anonymous_list_is_served_from_cache(self):
+        first = self.client.get('/api/jobs/jobs/?job_type=remote&page_size=5')
+        # Same parameters in another order, plus an empty one, hit the same entry
+        second = self.assertRequestQueries(0, '/api/jobs/jobs/?page_size=5&category=&job_type=remote')
+        self.assertEqual(second.data, first.data)
+        self.assertEqual(second['ETag'], first['ETag'])
+
+    def test_if_none_match_returns_304(self):
+        etag = self.client.get('/api/jobs/jobs/')['ETag']
+        response = self.assertRequestQueries(0, '/api/jobs/jobs/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b'')
+        self.assertEqual(response['ETag'], etag)
+
+    def test_job_write_changes_etag(self):
+        etag = self.client.get('/api/jobs/jobs/')['ETag']
+        with self.captureOnCommitCallbacks(execute=True):
+            self.create_job(title='Site Reliability Engineer')
+        response = self.client.get('/api/jobs/jobs/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+        self.assertEqual(response.data['results'][0]['title'], 'Site Reliability Engineer')
+
+    def test_recruiter_profile_edit_changes_etag(self):
+        etag = self.client.get(f'/api/jobs/jobs/{self.jobs[0].id}/')['ETag']
+        with self.captureOnCommitCallbacks(execute=True):
+            self.recruiter.full_name = 'Renamed Recruiter'
+            self.recruiter.save()
+        response = self.client.get(f'/api/jobs/jobs/{self.jobs[0].id}/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['created_by']['full_name'], 'Renamed Recruiter')
+
+    def test_detail_last_modified(self):
+        url = f'/api/jobs/jobs/{self.jobs[0].id}/'
+        response = self.client.get(url)
+        self.assertIn('Last-Modified', response)
+        response = self.assertRequestQueries(0, url, HTTP_IF_MODIFIED_SINCE=response['Last-Modified'])
+        self.assertEqual(response.status_code, 304)
+
+    def test_missing_job_is_not_cached(self):
+        self.assertEqual(self.client.get('/api/jobs/jobs/999999/').status_code, 404)
+        self.assertEqual(self.client.get('/api/jobs/jobs/999999/').status_code, 404)
+
+    def test_authenticated_reads_bypass_cache(self):
+        self.client.force_authenticate(self.recruiter)
+        response = self.client.get('/api/jobs/jobs/')
+        self.assertNotIn('ETag', response)
+
+
+class JobFacetTests(QueryCountAssertionsMixin, JobTestCase):
+    def setUp(self):
+        super().setUp()
+        self.create_job(title='Frontend Engineer', category='Engineering', location='Lagos', job_type='remote')
+
+    def test_counts_in_one_query(self):
+        response = self.assertRequestQueries(1, '/api/jobs/jobs/facets/')
+        self.assertEqual(response.data['total'], 4)
+        self.assertEqual(response.data['job_type'][0], {'value': 'remote', 'count': 2})
+        self.assertEqual(response.data['category'][0], {'value': 'Engineering', 'count': 2})
+        self.assertEqual(response.data['location'][0], {'value': 'Lagos', 'count': 2})
+        self.assertEqual(sum(facet['count'] for facet in response.data['location']), 4)
+
+    def test_counts_follow_filters(self):
+        response = self.client.get('/api/jobs/jobs/facets/?location=lagos&min_salary=2500')
+        self.assertEqual(response.data['total'], 1)
+        self.assertEqual(response.data['category'], [{'value': 'Engineering', 'count': 1}])
+
+    def test_counts_follow_keyword_search(self):
+        for url in ('/api/jobs/jobs/facets/?keyword=engineer', '/api/jobs/jobs/facets/?search=engineer'):
+            response = self.client.get(url)
+            self.assertEqual(response.data['total'], 2)
+            self.assertEqual(response.data['job_type'], [{'value': 'remote', 'count': 2}])
+
+    def test_counts_are_cached_per_filter_combination(self):
+        self.client.get('/api/jobs/jobs/facets/?job_type=remote')
+        response = self.assertRequestQueries(0, '/api/jobs/jobs/facets/?job_type=remote')
+        self.assertEqual(response.data['total'], 2)
+        self.assertRequestQueries(1, '/api/jobs/jobs/facets/?job_type=contract')
+
+
+class JobSkillFilterTests(QueryPlanAssertionsMixin, JobTestCase):
+    watched_tables = ('jobs_job', 'matching_jobskill')
+
+    def setUp(self):
+        super().setUp()
+        self.create_job(title='Java Developer', required_skills=['Java'])
+        self.create_job(title='Frontend Developer', required_skills=['JavaScript', 'Python'])
+
+    def titles(self, url):
+        with self.assertNoFullTableScan():
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return sorted(job['title'] for job in response.data['results'])
+
+    def test_whole_skill_match(self):
+        self.assertEqual(self.titles('/api/jobs/jobs/skills/java/'), ['Java Developer'])
+
+    def test_any_skill(self):
+        self.assertEqual(
+            self.titles('/api/jobs/jobs/skills/django,figma/'),
+            ['Backend Engineer', 'Product Designer']
+        )
+
+    def test_all_skills(self):
+        self.assertEqual(
+            self.titles('/api/jobs/jobs/skills/python,sql/?match=all'),
+            ['Data Analyst']
+        )
+        self.assertEqual(self.titles('/api/jobs/jobs/skills/python,cobol/?match=all'), [])
+
+    def test_list_skill_filter(self):
+        self.assertEqual(
+            self.titles('/api/jobs/jobs/?skills=python&skills_match=any'),
+            ['Backend Engineer', 'Data Analyst', 'Frontend Developer']
+        )
+        self.assertEqual(
+            self.titles('/api/jobs/jobs/?skills=Python,JavaScript&skills_match=all'),
+            ['Frontend Developer']
+        )
+
+    def test_invalid_match_mode(self):
+        response = self.client.get('/api/jobs/jobs/skills/python/?match=some')
+        self.assertEqual(response.status_code, 400)
+
+
+class JobFullTextSearchTests(JobTestCase):
+    url = '/api/jobs/jobs/search_keyword/'
+
+    def search(self, keyword, **params):
+        return [job['title'] for job in self.client.get(self.url, {'keyword': keyword, **params}).data['results']]
+
+    def indexed(self, job):
+        with connection.cursor() as cursor:
+            cursor.execute(f'SELECT {", ".join(SEARCH_FIELDS)} FROM {FTS_TABLE} WHERE rowid = %s', [job.pk])
+            return cursor.fetchone()
+
+    def test_every_word_must_match(self):
+        self.assertEqual(self.search('engineer lagos'), ['Backend Engineer'])
+        self.assertEqual(self.search('lagos, ENGINEER!'), ['Backend Engineer'])
+        self.assertEqual(self.search('engineer nairobi'), [])
+
+    def test_best_match_first(self):
+        self.create_job(title='Rust Developer', description='Rust services and Rust tooling')
+        self.create_job(title='Platform Engineer', description='Mostly Go, some Rust, plenty of on-call ' * 5)
+        # The newer job would lead on created_at; bm25 ranks the denser match first
+        self.assertEqual(self.search('rust'), ['Rust Developer', 'Platform Engineer'])
+
+    def test_pages_through_equal_ranks(self):
+        jobs = [self.create_job(title='Golang Developer') for _ in range(5)]
+        seen = []
+        response = self.client.get(self.url, {'keyword': 'golang', 'page_size': 2})
+        while True:
+            seen += [job['id'] for job in response.data['results']]
+            if not response.data['next']:
+                break
+            response = self.client.get(response.data['next'])
+        self.assertEqual(seen, sorted((job.id for job in jobs), reverse=True))
+
+    def test_index_follows_updates_and_deletes(self):
+        job = self.jobs[1]
+        job.title = 'Brand Illustrator'
+        job.save()
+        self.assertEqual(self.indexed(job)[0], 'Brand Illustrator')
+        self.assertEqual(self.search('illustrator'), ['Brand Illustrator'])
+        self.assertEqual(self.search('designer'), [])
+
+        job.delete()
+        self.assertIsNone(self.indexed(job))
+        self.assertEqual(self.search('illustrator'), [])
+
+    def test_bulk_imported_jobs_are_indexed(self):
+        JobImporter(self.recruiter).run([
+            (1, {'title': 'Site Reliability Engineer', 'description': 'Pager duty', 'category': 'Ops',
+                 'required_skills': [], 'salary_range': '1', 'location': 'Kigali', 'job_type': 'remote'}, None),
+        ])
+        job = Job.objects.get(title='Site Reliability Engineer')
+        self.assertEqual(self.indexed(job), ('Site Reliability Engineer', 'Pager duty', 'Ops', 'Kigali'))
+        self.assertEqual(self.search('reliability kigali'), ['Site Reliability Engineer'])
+
+
+@skipUnless(connection.vendor == 'postgresql', 'the GIN search index only exists on PostgreSQL')
+class PostgresSearchIndexTests(JobTestCase):
+    def test_search_uses_the_gin_index(self):
+        queryset = search_jobs(Job.objects.all(), 'backend engineer')
+        self.assertEqual([job.title for job in queryset], ['Backend Engineer'])
+        with connection.cursor() as cursor:
+            # Three rows are cheaper to scan; make the planner show whether the index applies at all
+            cursor.execute('SET LOCAL enable_seqscan = off')
+        self.assertIn('jobs_job_search_gin', queryset.explain())
+
+
+class AutocompleteTests(QueryCountAssertionsMixin, JobTestCase):
+    url = '/api/jobs/autocomplete/'
+
+    def test_skills_ranked_by_popularity(self):
+        User.objects.create_user(
+            email='seeker@example.com', password=None, full_name='Seeker',
+            role='job_seeker', skills=['Figma', 'Fortran']
+        )
+        response = self.client.get(self.url, {'q': 'f', 'field': 'skills'})
+        self.assertEqual(response.data['skills'], [
+            {'value': 'Figma', 'count': 2},
+            {'value': 'Fortran', 'count': 1},
+        ])
+
+    def test_all_fields_case_insensitive(self):
+        self.create_job(location='lagos')
+        response = self.client.get(self.url, {'q': 'LA'})
+        self.assertEqual(response.data['locations'], [{'value': 'Lagos', 'count': 2}])
+        self.assertEqual(response.data['categories'], [])
+        self.assertEqual(self.client.get(self.url, {'q': 'des'}).data['categories'],
+                         [{'value': 'Design', 'count': 1}])
+
+    def test_writes_update_index_in_place(self):
+        self.client.get(self.url, {'q': 'a'})
+        with self.captureOnCommitCallbacks(execute=True):
+            self.create_job(location='Abuja', required_skills=['Go'])
+            job = self.jobs[2]
+            job.location = 'Kumasi'
+            job.save()
+            self.jobs[1].delete()
+
+        response = self.assertRequestQueries(0, self.url, data={'q': 'a'})
+        self.assertEqual(response.data['locations'], [{'value': 'Abuja', 'count': 1}])
+        self.assertEqual(self.client.get(self.url, {'q': 'go'}).data['skills'], [{'value': 'Go', 'count': 1}])
+        self.assertEqual(self.client.get(self.url, {'q': 'fig'}).data['skills'], [])
+
+    def test_inactive_jobs_are_not_suggested(self):
+        self.client.get(self.url, {'q': 'n'})
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.force_authenticate(self.recruiter)
+            self.client.patch(f'/api/jobs/jobs/{self.jobs[1].id}/toggle_active/')
+        self.assertEqual(self.client.get(self.url, {'q': 'nai'}).data['locations'], [])
+
+    def test_stale_index_is_rebuilt_once_in_the_background(self):
+        self.client.get(self.url, {'q': 'l'})
+        # A write from another process only reaches this one through a rebuild
+        Job.objects.filter(pk=self.jobs[0].pk).update(location='Lusaka')
+        autocomplete._built_at -= autocomplete.max_age + 1
+
+        queued = []
+        with mock.patch('jobs.autocomplete.run_in_background', lambda *call: queued.append(call)):
+            for _ in range(3):
+                response = self.assertRequestQueries(0, self.url, data={'q': 'l'})
+                self.assertEqual(response.data['locations'], [{'value': 'Lagos', 'count': 1}])
+        self.assertEqual(len(queued), 1)
+
+        queued[0][0]()
+        self.assertEqual(self.client.get(self.url, {'q': 'l'}).data['locations'],
+                         [{'value': 'Lusaka', 'count': 1}])
+
+    def test_writes_during_a_rebuild_are_replayed(self):
+        self.client.get(self.url, {'q': 'a'})
+        build = autocomplete._build
+
+        def build_racing_a_write():
+            indexes = build()
+            autocomplete.replace({}, {'locations': ['Abuja']})
+            return indexes
+
+        with mock.patch.object(autocomplete, '_build', build_racing_a_write):
+            autocomplete.rebuild()
+        self.assertEqual(self.client.get(self.url, {'q': 'ab'}).data['locations'],
+                         [{'value': 'Abuja', 'count': 1}])
+
+    def test_validation(self):
+        self.assertEqual(self.client.get(self.url).status_code, 400)
+        self.assertEqual(self.client.get(self.url, {'q': 'a', 'field': 'titles'}).status_code, 400)
+
+    def test_prefix_index_is_bounded(self):
+        index = PrefixIndex(max_entries=2)
+        index.adjust('Python', 3)
+        index.adjust('Perl', 1)
+        index.adjust('PHP', 2)
+        self.assertEqual(len(index), 2)
+        self.assertEqual([s['value'] for s in index.suggest('p', 10)], ['Python', 'PHP'])
+
+
+class JobBulkImportExportTests(JobTestCase):
+    def setUp(self):
+        super().setUp()
+        self.admin = User.objects.create_user(
+            email='admin@example.com', password=None, full_name='Admin',
+            role='admin', is_staff=True
+        )
+        self.client.force_authenticate(self.admin)
+
+    def upload(self, name, content, **params):
+        from django.core.files.uploadedfile import SimpleUploadedFile
+        url = '/api/users/admin/jobs/import/'
+        if params:
+            url += '?' + '&'.join(f'{key}={value}' for key, value in params.items())
+        return self.client.post(url, {'file': SimpleUploadedFile(name, content.encode())}, format='multipart')
+
+    def test_csv_import(self):
+        content = (
+            'title,description,category,required_skills,salary_range,location,job_type,created_by_id\n'
+            f'Go Developer,Build services,Engineering,"Go, Kubernetes","$4,000",Kigali,remote,{self.recruiter.id}\n'
+            'Bad Type,Nope,Engineering,Go,1000,Kigali,freelance,\n'
+            'Support Lead,Help customers,Support,"[""Zendesk""]",Negotiable,Cairo,full-time,\n'
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.upload('jobs.csv', content)
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data['created'], 2)
+        self.assertEqual(response.data['failed'], 1)
+        self.assertEqual(response.data['errors'][0]['row'], 3)
+        self.assertIn('job_type', response.data['errors'][0]['errors'])
+
+        job = Job.objects.get(title='Go Developer')
+        self.assertEqual(job.created_by, self.recruiter)
+        self.assertEqual(job.salary_min, 4000)
+        self.assertEqual(job.skill_index.count(), 2)
+        self.assertEqual(Job.objects.get(title='Support Lead').created_by, self.admin)
+
+        # The imported jobs are searchable, filterable and counted like saved ones
+        self.client.force_authenticate(None)
+        self.assertEqual(self.client.get('/api/jobs/jobs/search_keyword/?keyword=services').data['results'][0]['title'],
+                         'Go Developer')
+        self.assertEqual(len(self.client.get('/api/jobs/jobs/skills/kubernetes/').data['results']), 1)
+        self.assertEqual(Skill.objects.get(key='go').active_job_count, 1)
+
+    def test_jsonl_import_reports_bad_lines(self):
+        content = '\n'.join([
+            json.dumps({'title': 'Analyst', 'description': 'Numbers', 'category': 'Data',
+                        'required_skills': ['SQL'], 'salary_range': '2000', 'location': 'Accra',
+                        'job_type': 'contract'}),
+            '{not json',
+            json.dumps({'title': 'Orphan', 'description': 'x', 'category': 'Data', 'required_skills': [],
+                        'salary_range': '1', 'location': 'Accra', 'job_type': 'contract',
+                        'created_by_id': 999999}),
+        ])
+        response = self.upload('jobs.jsonl', content)
+        self.assertEqual(response.data['created'], 1)
+        self.assertEqual([error['row'] for error in response.data['errors']], [2, 3])
+        self.assertEqual(response.data['errors'][1]['errors'], {'created_by_id': ['User not found.']})
+
+    def test_only_imported_rows_add_skills(self):
+        row = {'description': 'd', 'category': 'Ops', 'salary_range': '1', 'location': 'Kigali', 'job_type': 'remote'}
+        JobImporter(self.recruiter).run([
+            (1, {**row, 'title': 'Rejected', 'required_skills': ['Elixir'], 'job_type': 'freelance'}, None),
+            (2, {**row, 'title': 'Accepted', 'required_skills': ['python ', 'Kubernetes']}, None),
+        ])
+        self.assertFalse(Skill.objects.filter(key='elixir').exists())
+        job = Job.objects.get(title='Accepted')
+        self.assertEqual(job.required_skills, ['Python', 'Kubernetes'])
+        self.assertEqual(job.skill_ids, [Skill.objects.get(key=key).id for key in ('python', 'kubernetes')])
+
+        # A batch that fails to insert takes its new skills with it
+        with mock.patch.object(Job.objects, 'bulk_create', side_effect=RuntimeError):
+            with self.assertRaises(RuntimeError):
+                JobImporter(self.recruiter).run([(1, {**row, 'title': 'Lost', 'required_skills': ['Terraform']}, None)])
+        self.assertFalse(Skill.objects.filter(key='terraform').exists())
+
+    def test_import_requires_admin(self):
+        self.client.force_authenticate(self.recruiter)
+        self.assertEqual(self.upload('jobs.csv', 'title\n').status_code, 403)
+
+    def test_command_imports_in_batches(self):
+        from django.core.management import call_command
+        import tempfile
+        rows = [json.dumps({'title': f'Job {i}', 'description': 'd', 'category': 'Data',
+                            'required_skills': ['SQL'], 'salary_range': '100', 'location': 'Accra',
+                            'job_type': 'remote'}) for i in range(5)]
+        with tempfile.NamedTemporaryFile('w', suffix='.jsonl', delete=False) as stream:
+            stream.write('\n'.join(rows))
+        call_command('import_jobs', stream.name, created_by=self.recruiter.email, batch_size=2,
+                     stdout=io.StringIO(), stderr=io.StringIO())
+        self.assertEqual(Job.objects.filter(title__startswith='Job ').count(), 5)
+        self.assertEqual(Skill.objects.get(key='sql').active_job_count, 6)
+
+    def test_streaming_export_round_trips(self):
+        response = self.client.get('/api/users/admin/jobs/export/?file_type=csv')
+        self.assertTrue(response.streaming)
+        content = b''.join(response.streaming_content).decode()
+        self.assertEqual(content.splitlines()[0].split(','), EXPORT_FIELDS)
+        self.assertEqual(len(content.splitlines()), 4)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.upload('jobs.csv', content)
+        self.assertEqual(response.data['created'], 3)
+        self.assertEqual(
+            sorted(Job.objects.filter(title='Backend Engineer').values_list('required_skills', flat=True)),
+            [['Python', 'Django'], ['Python', 'Django']]
+        )
+
+        response = self.client.get('/api/users/admin/jobs/export/?file_type=jsonl')
+        lines = b''.join(response.streaming_content).decode().splitlines()
+        self.assertEqual(len(lines), 6)
+        self.assertEqual(json.loads(lines[0])['title'], 'Backend Engineer')
@@ -1,13 +1,14 @@
 # jobs/urls.py
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from .views import JobViewSet
+from .views import JobViewSet, autocomplete_suggestions
 
 router = DefaultRouter()
 router.register(r'jobs', JobViewSet, basename='job')
 
 urlpatterns = [
     path('', include(router.urls)),
+    path('autocomplete/', autocomplete_suggestions, name='job-autocomplete'),
     
     # Specific filter endpoints
     path('jobs/search/', JobViewSet.as_view({'get': 'search_keyword'}), name='job-search-keyword'),
@@ -1,21 +1,103 @@
 from rest_framework import viewsets, status, filters
-from rest_framework.decorators import action
+from rest_framework.decorators import action, api_view, permission_classes
 from rest_framework.response import Response
-from rest_framework.permissions import IsAuthenticatedOrReadOnly
+from rest_framework.permissions import AllowAny, IsAuthenticatedOrReadOnly
 from django_filters.rest_framework import DjangoFilterBackend
+from django.conf import settings
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import http_date
+from .autocomplete import FIELDS as AUTOCOMPLETE_FIELDS, autocomplete
+from .cache import catalogue_version, get_cached_response, response_cache_key, response_etag, set_cached_response
+from .facets import facet_counts
 from .models import Job
 from .serializers import JobSerializer
-from .filters import JobFilter
-from django.db.models import Q
+from .filters import SKILL_MATCH_MODES, JobFilter, JobOrderingFilter, filter_by_skills
+from .pagination import KeysetPagination
+from .search import search_jobs
+
+AUTOCOMPLETE_LIMIT = 10
+MAX_AUTOCOMPLETE_LIMIT = 25
+
+
+class JobSearchFilter(filters.SearchFilter):
+    """``?search=`` backed by the full-text index, ranked by relevance."""
+
+    def filter_queryset(self, request, queryset, view):
+        query = request.query_params.get(self.search_param, '')
+        if not query.strip():
+            return queryset
+        return search_jobs(queryset, query)
+
 
 class JobViewSet(viewsets.ModelViewSet):
-    queryset = Job.objects.all()
+    # created_by is in every serialized job; join it
+    queryset = Job.objects.select_related('created_by').order_by('-created_at', '-id')
     serializer_class = JobSerializer
     permission_classes = [IsAuthenticatedOrReadOnly]
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    filter_backends = [DjangoFilterBackend, JobSearchFilter, JobOrderingFilter]
     filterset_class = JobFilter
     search_fields = ['title', 'description', 'category', 'location']
-    ordering_fields = ['created_at', 'salary_range']
+    ordering_fields = ['created_at', 'salary_range', 'salary_min', 'salary_max']
+    pagination_class = KeysetPagination
+    
+    def get_queryset(self):
+        queryset = super().get_queryset()
+        # Application counters are serialized for the job's owner and admins only;
+        # anonymous and job seeker listings never read them, so skip the join there
+        user = self.request.user
+        if user.is_authenticated and (user.role != 'job_seeker' or user.is_staff):
+            queryset = queryset.select_related('application_stats')
+        return queryset
+    
+    def list(self, request, *args, **kwargs):
+        if request.user.is_authenticated:
+            return super().list(request, *args, **kwargs)
+        return self.cached_response(
+            request, lambda: (super(JobViewSet, self).list(request, *args, **kwargs).data, None)
+        )
+    
+    def retrieve(self, request, *args, **kwargs):
+        if request.user.is_authenticated:
+            return super().retrieve(request, *args, **kwargs)
+        
+        def build():
+            job = self.get_object()
+            return self.get_serializer(job).data, int(job.updated_at.timestamp())
+        return self.cached_response(request, build)
+    
+    def cached_response(self, request, build):
+        """Serve an anonymous read from the response cache, answering conditional GETs with 304.
+
+        ``build`` returns ``(data, last_modified)`` and only runs on a cache miss.
+        """
+        cache_key = response_cache_key(request, catalogue_version())
+        etag = response_etag(cache_key)
+        
+        # A matching If-None-Match is answered before touching the cache or the database
+        not_modified = get_conditional_response(request, etag=etag)
+        if not_modified is None:
+            cached = get_cached_response(cache_key)
+            if cached is None:
+                cached = build()
+                set_cached_response(cache_key, *cached)
+            data, last_modified = cached
+            not_modified = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        else:
+            last_modified = None
+        
+        response = not_modified if not_modified is not None else Response(data)
+        response['ETag'] = etag
+        if last_modified is not None:
+            response['Last-Modified'] = http_date(last_modified)
+        patch_cache_control(response, public=True, no_cache=True)
+        patch_vary_headers(response, ['Authorization'])
+        return response
+    
+    def paginated_response(self, queryset):
+        # Every listing is keyset-paginated; none may return an unbounded result set
+        page = self.paginate_queryset(queryset)
+        serializer = self.get_serializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
     
     def perform_create(self, serializer):
         serializer.save(created_by=self.request.user)
@@ -35,7 +117,10 @@ class JobViewSet(viewsets.ModelViewSet):
         location = request.query_params.get('location')
         job_type = request.query_params.get('job_type')
         category = request.query_params.get('category')
+        keyword = request.query_params.get('keyword')
         
+        if keyword:
+            queryset = search_jobs(queryset, keyword)
         if location:
             queryset = queryset.filter(location__icontains=location)
         if job_type:
@@ -43,24 +128,33 @@ class JobViewSet(viewsets.ModelViewSet):
         if category:
             queryset = queryset.filter(category__icontains=category)
         
-        page = self.paginate_queryset(queryset)
-        if page is not None:
-            serializer = self.get_serializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
+        return self.paginated_response(queryset)
+    
+    @action(detail=False, methods=['get'])
+    def facets(self, request):
+        """GET /jobs/facets/ - Job counts per job_type, category and location for the given filters"""
+        timeout = settings.JOB_FACETS_CACHE_TIMEOUT
+        cache_key = response_cache_key(request, catalogue_version())
+        cached = get_cached_response(cache_key) if timeout else None
+        if cached is not None:
+            return Response(cached[0])
         
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data)
+        # Same filters as the list (JobFilter and ?search=) plus search_keyword's ?keyword=
+        queryset = self.filter_queryset(self.get_queryset())
+        keyword = request.query_params.get('keyword')
+        if keyword:
+            queryset = search_jobs(queryset, keyword)
+        
+        facets = facet_counts(queryset)
+        if timeout:
+            set_cached_response(cache_key, facets, timeout=timeout)
+        return Response(facets)
     
     @action(detail=False, methods=['get'])
     def my_jobs(self, request):
-        jobs = Job.objects.filter(created_by=request.user)
-        page = self.paginate_queryset(jobs)
-        if page is not None:
-            serializer = self.get_serializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
-        
-        serializer = self.get_serializer(jobs, many=True)
-        return Response(serializer.data)
+        jobs = self.get_queryset().filter(created_by=request.user)
+        return self.paginated_response(jobs)
+
     @action(detail=False, methods=['get'])
     def filter_by_location(self, request, location=None):
         """GET /jobs/location/{location}"""
@@ -68,8 +162,7 @@ class JobViewSet(viewsets.ModelViewSet):
             location = request.query_params.get('location', '')
         
         queryset = self.get_queryset().filter(location__icontains=location)
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data)
+        return self.paginated_response(queryset)
 
     @action(detail=False, methods=['get'])
     def filter_by_type(self, request, job_type=None):
@@ -84,22 +177,23 @@ class JobViewSet(viewsets.ModelViewSet):
             )
         
         queryset = self.get_queryset().filter(job_type=job_type)
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data)
+        return self.paginated_response(queryset)
 
     @action(detail=False, methods=['get'])
     def filter_by_skills(self, request, skill=None):
-        """GET /jobs/skills/{skill}"""
+        """GET /jobs/skills/{skill}[,{skill}...]?match=any|all"""
         if not skill:
             skill = request.query_params.get('skill', '')
         
-        # Search in required_skills JSON field
-        queryset = self.get_queryset().filter(
-            Q(required_skills__contains=[skill]) | 
-            Q(required_skills__icontains=skill)
-        )
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data)
+        match = request.query_params.get('match', 'any')
+        if match not in SKILL_MATCH_MODES:
+            return Response(
+                {'error': f'Invalid match mode. Must be one of: {", ".join(SKILL_MATCH_MODES)}'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        queryset = filter_by_skills(self.get_queryset(), skill.split(','), match)
+        return self.paginated_response(queryset)
 
     @action(detail=False, methods=['get'])
     def filter_by_category(self, request, category=None):
@@ -108,12 +202,11 @@ class JobViewSet(viewsets.ModelViewSet):
             category = request.query_params.get('category', '')
         
         queryset = self.get_queryset().filter(category__icontains=category)
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data)
+        return self.paginated_response(queryset)
 
     @action(detail=False, methods=['get'])
     def search_keyword(self, request):
-        """GET /jobs/search?keyword=..."""
+        """GET /jobs/search?keyword=... - Full-text search, best match first"""
         keyword = request.query_params.get('keyword', '')
         
         if not keyword:
@@ -122,17 +215,36 @@ class JobViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        queryset = self.get_queryset().filter(
-            Q(title__icontains=keyword) |
-            Q(description__icontains=keyword) |
-            Q(category__icontains=keyword) |
-            Q(location__icontains=keyword)
-        )
-        
-        page = self.paginate_queryset(queryset)
-        if page is not None:
-            serializer = self.get_serializer(page, many=True)
-            return self.get_paginated_response(serializer.data)
+        # Every word must match; results come back ranked by relevance
+        queryset = search_jobs(self.get_queryset(), keyword)
         
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(serializer.data)
\ No newline at end of file
+        return self.paginated_response(queryset)
+
+
+@api_view(['GET'])
+@permission_classes([AllowAny])
+def autocomplete_suggestions(request):
+    """GET /jobs/autocomplete/?q=...&field=skills|categories|locations - Prefix suggestions, most popular first"""
+    prefix = request.query_params.get('q', '').strip()
+    field = request.query_params.get('field')
+    
+    if not prefix:
+        return Response(
+            {'error': 'q parameter is required'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    if field is not None and field not in AUTOCOMPLETE_FIELDS:
+        return Response(
+            {'error': f'Invalid field. Must be one of: {", ".join(AUTOCOMPLETE_FIELDS)}'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    
+    try:
+        limit = int(request.query_params.get('limit', AUTOCOMPLETE_LIMIT))
+    except ValueError:
+        limit = AUTOCOMPLETE_LIMIT
+    limit = min(max(limit, 1), MAX_AUTOCOMPLETE_LIMIT)
+    
+    fields = [field] if field else AUTOCOMPLETE_FIELDS
+    suggestions = {name: autocomplete.suggest(name, prefix, limit) for name in fields}
+    return Response({'query': prefix, **suggestions})
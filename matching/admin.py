@@ -1,3 +1,17 @@
+# matching/admin.py
 from django.contrib import admin
+from .models import Skill, SkillAlias
 
-# Register your models here.
+
+class SkillAliasInline(admin.TabularInline):
+    model = SkillAlias
+    extra = 1
+
+
+class SkillAdmin(admin.ModelAdmin):
+    list_display = ('name', 'key')
+    search_fields = ('name', 'key')
+    inlines = [SkillAliasInline]
+
+
+admin.site.register(Skill, SkillAdmin)
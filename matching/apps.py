@@ -3,4 +3,7 @@ from django.apps import AppConfig
 
 class MatchingConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
-    name = 'matching'
\ No newline at end of file
+    name = 'matching'
+
+    def ready(self):
+        from . import signals  # noqa: F401
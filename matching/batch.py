@@ -0,0 +1,62 @@
+# matching/batch.py
+import numpy as np
+from scipy import sparse
+
+from .ranking import MIN_MATCH_PERCENTAGE
+
+
+def skill_matrix(rows, n_skills):
+    """Build a binary CSR matrix with one row per skill-id list."""
+    indptr = [0]
+    indices = []
+    for skill_ids in rows:
+        unique_ids = sorted(set(skill_ids or []))
+        indices.extend(unique_ids)
+        indptr.append(len(indices))
+    data = np.ones(len(indices), dtype=np.int32)
+    return sparse.csr_matrix(
+        (data, np.asarray(indices, dtype=np.int64), np.asarray(indptr, dtype=np.int64)),
+        shape=(len(rows), n_skills),
+    )
+
+
+class BatchScorer:
+    """Score many seekers against the whole active catalogue with sparse products.
+
+    Percentages match ``jobs_for_me``: shared skills / job skills * 100, keeping
+    matches at or above ``min_percentage``.
+    """
+
+    def __init__(self, job_ids, job_skill_rows, min_percentage=MIN_MATCH_PERCENTAGE):
+        self.job_ids = np.asarray(job_ids, dtype=np.int64)
+        self.min_percentage = min_percentage
+        self.n_skills = 1 + max(
+            (max(row) for row in job_skill_rows if row), default=0
+        )
+        self.jobs_t = skill_matrix(job_skill_rows, self.n_skills).T.tocsr()
+        self.job_sizes = np.asarray(self.jobs_t.sum(axis=0)).ravel()
+
+    def score(self, user_skill_rows, top_n=10):
+        """Return, per seeker row, a list of ``(job_id, match_score)`` best first."""
+        # Skills no active job asks for cannot contribute to a match
+        trimmed = [[i for i in row or [] if i < self.n_skills] for row in user_skill_rows]
+        users = skill_matrix(trimmed, self.n_skills)
+        overlap = (users @ self.jobs_t).tocsr()
+        overlap.sort_indices()
+
+        sizes = self.job_sizes[overlap.indices]
+        keep = overlap.data * 100 >= self.min_percentage * sizes
+        scores = np.zeros(overlap.data.shape, dtype=np.float64)
+        scores[keep] = overlap.data[keep] / sizes[keep] * 100
+
+        results = []
+        for row in range(overlap.shape[0]):
+            start, end = overlap.indptr[row], overlap.indptr[row + 1]
+            row_keep = keep[start:end]
+            row_scores = scores[start:end][row_keep]
+            row_jobs = self.job_ids[overlap.indices[start:end][row_keep]]
+            order = np.lexsort((row_jobs, -row_scores))[:top_n]
+            results.append([
+                (int(row_jobs[i]), float(row_scores[i])) for i in order
+            ])
+        return results
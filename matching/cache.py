@@ -0,0 +1,76 @@
+# matching/cache.py
+import threading
+from collections import OrderedDict
+
+from django.conf import settings
+
+
+class MatchCache:
+    """Bounded LRU of jobs-for-me rankings, one entry per seeker.
+
+    Each entry remembers the seeker's skill ids and the job-catalogue version it
+    was computed against, so a skills edit or any job write turns it into a miss.
+    An entry holds one ``Ranking`` per scoring mode; every page and cursor is a
+    slice of it, so deeper pages are never re-scored. Rankings keep the best
+    ``max_ranked`` matches; only cursors past those are scored again.
+    """
+
+    def __init__(self, max_entries, max_ranked=1000):
+        self.max_entries = max_entries
+        self.max_ranked = max_ranked
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, user_id, skills_key, version, scoring):
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None or entry[0] != skills_key or entry[1] != version or scoring not in entry[2]:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(user_id)
+            self.hits += 1
+            return entry[2][scoring]
+
+    def set(self, user_id, skills_key, version, scoring, ranking):
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None or entry[0] != skills_key or entry[1] != version:
+                entry = (skills_key, version, {})
+                self._entries[user_id] = entry
+            entry[2][scoring] = ranking
+            self._entries.move_to_end(user_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, user_id):
+        with self._lock:
+            if self._entries.pop(user_id, None) is not None:
+                self.invalidations += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._entries),
+                'max_entries': self.max_entries,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0,
+                'evictions': self.evictions,
+                'invalidations': self.invalidations,
+            }
+
+
+match_cache = MatchCache(
+    getattr(settings, 'MATCH_CACHE_MAX_ENTRIES', 10000),
+    max_ranked=getattr(settings, 'MATCH_CACHE_MAX_RANKED', 1000),
+)
@@ -0,0 +1,115 @@
+# matching/index.py
+from .models import JobSkill, UserSkill
+from .stats import adjust_active_counts, adjust_active_total
+
+
+def is_indexed_seeker(user):
+    return user.role == 'job_seeker' and user.is_active
+
+
+def index_job(job):
+    """Bring the JobSkill posting lists for a single job up to date."""
+    wanted = set(job.skill_ids or [])
+    existing = dict(
+        JobSkill.objects.filter(job=job).values_list('skill_id', 'is_active')
+    )
+
+    stale = set(existing) - wanted
+    if stale:
+        JobSkill.objects.filter(job=job, skill_id__in=stale).delete()
+
+    missing = wanted - set(existing)
+    if missing:
+        JobSkill.objects.bulk_create([
+            JobSkill(job=job, skill_id=skill_id, is_active=job.is_active)
+            for skill_id in missing
+        ])
+
+    if any(existing[skill_id] != job.is_active for skill_id in wanted & set(existing)):
+        JobSkill.objects.filter(job=job).update(is_active=job.is_active)
+
+    # Keep the per-skill active job counts in step with the index
+    was_active = {skill_id for skill_id, active in existing.items() if active}
+    now_active = wanted if job.is_active else set()
+    adjust_active_counts(now_active - was_active, was_active - now_active)
+    adjust_active_total(bool(now_active) - bool(was_active))
+
+
+def unindex_job(job):
+    """Release a job's active skill counts before its index rows are deleted."""
+    active = set(
+        JobSkill.objects.filter(job=job, is_active=True).values_list('skill_id', flat=True)
+    )
+    adjust_active_counts(set(), active)
+    adjust_active_total(-bool(active))
+
+
+def rebuild_index(jobs, batch_size=1000):
+    """Rebuild the index for an iterable of jobs in batches.
+
+    Skill counts and the active-job total are not adjusted; call ``stats.refresh_skill_stats`` afterwards.
+    """
+    rows = []
+    job_ids = []
+    for job in jobs:
+        job_ids.append(job.id)
+        rows.extend(
+            JobSkill(job_id=job.id, skill_id=skill_id, is_active=job.is_active)
+            for skill_id in set(job.skill_ids or [])
+        )
+        if len(job_ids) >= batch_size:
+            _replace(job_ids, rows, batch_size)
+            job_ids, rows = [], []
+    if job_ids:
+        _replace(job_ids, rows, batch_size)
+
+
+def _replace(job_ids, rows, batch_size):
+    JobSkill.objects.filter(job_id__in=job_ids).delete()
+    JobSkill.objects.bulk_create(rows, batch_size=batch_size)
+
+
+def index_user(user):
+    """Bring the UserSkill posting lists for a single user up to date."""
+    wanted = set(user.skill_ids or [])
+    is_seeker = is_indexed_seeker(user)
+    existing = dict(
+        UserSkill.objects.filter(user=user).values_list('skill_id', 'is_seeker')
+    )
+
+    stale = set(existing) - wanted
+    if stale:
+        UserSkill.objects.filter(user=user, skill_id__in=stale).delete()
+
+    missing = wanted - set(existing)
+    if missing:
+        UserSkill.objects.bulk_create([
+            UserSkill(user=user, skill_id=skill_id, is_seeker=is_seeker)
+            for skill_id in missing
+        ])
+
+    if any(existing[skill_id] != is_seeker for skill_id in wanted & set(existing)):
+        UserSkill.objects.filter(user=user).update(is_seeker=is_seeker)
+
+
+def rebuild_user_index(users, batch_size=1000):
+    """Rebuild the seeker index for an iterable of users in batches."""
+    rows = []
+    user_ids = []
+    for user in users:
+        user_ids.append(user.id)
+        is_seeker = is_indexed_seeker(user)
+        rows.extend(
+            UserSkill(user_id=user.id, skill_id=skill_id, is_seeker=is_seeker)
+            for skill_id in set(user.skill_ids or [])
+        )
+        if len(user_ids) >= batch_size:
+            _replace_users(user_ids, rows, batch_size)
+            user_ids, rows = [], []
+    if user_ids:
+        _replace_users(user_ids, rows, batch_size)
+
+
+def _replace_users(user_ids, rows, batch_size):
+    UserSkill.objects.filter(user_id__in=user_ids).delete()
+    UserSkill.objects.bulk_create(rows, batch_size=batch_size)
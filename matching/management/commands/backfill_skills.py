@@ -0,0 +1,60 @@
+# matching/management/commands/backfill_skills.py
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from jobs.models import Job
+from users.models import User
+from matching.index import rebuild_index, rebuild_user_index
+from matching.skills import canonicalize
+from matching.stats import rebuild_weekly_demand, refresh_skill_stats
+
+
+class Command(BaseCommand):
+    help = 'Convert free-form User.skills and Job.required_skills to the canonical skill vocabulary'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=1000)
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+
+        users = self._backfill(User.objects.only('id', 'skills'), 'skills', batch_size)
+        self.stdout.write(f'Canonicalized skills for {users} users')
+
+        jobs = self._backfill(Job.objects.only('id', 'required_skills'), 'required_skills', batch_size)
+        self.stdout.write(f'Canonicalized skills for {jobs} jobs')
+
+        rebuild_index(Job.objects.only('id', 'skill_ids', 'is_active').iterator(), batch_size=batch_size)
+        refresh_skill_stats()
+        self.stdout.write(self.style.SUCCESS('Rebuilt the job skill index'))
+
+        weeks = rebuild_weekly_demand(batch_size=batch_size)
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt {weeks} weekly skill demand rows'))
+
+        rebuild_user_index(
+            User.objects.only('id', 'skill_ids', 'role', 'is_active').iterator(),
+            batch_size=batch_size
+        )
+        self.stdout.write(self.style.SUCCESS('Rebuilt the seeker skill index'))
+
+    def _backfill(self, queryset, field, batch_size):
+        model = queryset.model
+        total = 0
+        batch = []
+        for obj in queryset.iterator(chunk_size=batch_size):
+            names, skill_ids = canonicalize(getattr(obj, field))
+            setattr(obj, field, names)
+            obj.skill_ids = skill_ids
+            batch.append(obj)
+            if len(batch) >= batch_size:
+                total += self._flush(model, batch, field)
+                batch = []
+        if batch:
+            total += self._flush(model, batch, field)
+        return total
+
+    def _flush(self, model, batch, field):
+        # bulk_update skips the pre_save/post_save hooks; the index is rebuilt afterwards
+        with transaction.atomic():
+            model.objects.bulk_update(batch, [field, 'skill_ids'])
+        return len(batch)
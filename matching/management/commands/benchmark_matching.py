@@ -0,0 +1,134 @@
+# matching/management/commands/benchmark_matching.py
+import json
+import math
+import random
+import statistics
+import time
+import tracemalloc
+
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test.utils import CaptureQueriesContext, setup_test_environment, teardown_test_environment
+from rest_framework.test import APIClient
+
+from jobs.models import Job
+from users.models import User
+from matching.cache import match_cache
+from matching.skills import registry
+from matching.synthetic import CatalogueGenerator
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(pct / 100 * len(ordered)) - 1)]
+
+
+class Command(BaseCommand):
+    help = (
+        'Benchmark the matching endpoints against synthetic catalogues of several sizes. '
+        'Runs in a throwaway test database; the configured database is not touched.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000, 100000],
+                            help='Catalogue sizes (number of jobs) to benchmark')
+        parser.add_argument('--seekers', type=int, default=1000)
+        parser.add_argument('--skills', type=int, default=2000, help='Vocabulary size')
+        parser.add_argument('--requests', type=int, default=50, help='Timed requests per endpoint')
+        parser.add_argument('--seed', type=int, default=42)
+        parser.add_argument('--warm', action='store_true',
+                            help='Keep the jobs-for-me cache between requests (default measures cold requests)')
+        parser.add_argument('--json', dest='json_path', help='Also write the results to this JSON file')
+
+    def handle(self, *args, **options):
+        setup_test_environment()
+        old_name = connection.creation.create_test_db(verbosity=0, autoclobber=True, serialize=False)
+        results = []
+        try:
+            for size in options['sizes']:
+                results.extend(self._run_size(size, options))
+                call_command('flush', interactive=False, verbosity=0)
+                registry.clear()
+                match_cache.clear()
+        finally:
+            connection.creation.destroy_test_db(old_name, verbosity=0)
+            teardown_test_environment()
+
+        if options['json_path']:
+            with open(options['json_path'], 'w') as fh:
+                json.dump(results, fh, indent=2)
+            self.stdout.write(f"Wrote {options['json_path']}")
+
+    def _run_size(self, size, options):
+        started = time.perf_counter()
+        generator = CatalogueGenerator(seed=options['seed'], n_skills=options['skills'])
+        recruiters, seekers, active_jobs = generator.generate(size, options['seekers'])
+        self.stdout.write(
+            f'\n{size} jobs ({len(active_jobs)} active), {len(seekers)} seekers, '
+            f'{options["skills"]} skills generated in {time.perf_counter() - started:.1f}s'
+        )
+
+        rng = random.Random(options['seed'])
+        seeker_sample = [rng.choice(seekers) for _ in range(options['requests'])]
+        job_sample = [rng.choice(active_jobs) for _ in range(options['requests'])]
+        owners = dict(Job.objects.filter(id__in=job_sample).values_list('id', 'created_by_id'))
+        users = User.objects.in_bulk(set(seeker_sample) | set(owners.values()))
+
+        endpoints = [
+            ('jobs-for-me', [(users[s], '/api/match/jobs-for-me/') for s in seeker_sample]),
+            ('jobs-for-me?scoring=idf', [(users[s], '/api/match/jobs-for-me/?scoring=idf') for s in seeker_sample]),
+            ('skill-analysis', [(users[s], '/api/match/skill-analysis/') for s in seeker_sample]),
+            ('candidates-for-job', [
+                (users[owners[j]], f'/api/match/candidates-for-job/{j}/') for j in job_sample
+            ]),
+        ]
+
+        self.stdout.write(f"{'endpoint':<28}{'p50 ms':>10}{'p99 ms':>10}{'queries':>10}{'peak KiB':>12}")
+        results = []
+        for name, calls in endpoints:
+            row = self._measure(calls, warm=options['warm'])
+            row.update({'size': size, 'endpoint': name})
+            results.append(row)
+            self.stdout.write(
+                f"{name:<28}{row['p50_ms']:>10.2f}{row['p99_ms']:>10.2f}"
+                f"{row['queries']:>10}{row['peak_kib']:>12.1f}"
+            )
+        return results
+
+    def _measure(self, calls, warm):
+        client = APIClient()
+        timings = []
+        query_counts = []
+        for user, url in calls:
+            if not warm:
+                match_cache.clear()
+            client.force_authenticate(user)
+            with CaptureQueriesContext(connection) as queries:
+                started = time.perf_counter()
+                response = client.get(url)
+                timings.append((time.perf_counter() - started) * 1000)
+            if response.status_code != 200:
+                raise RuntimeError(f'{url} returned {response.status_code}: {response.data}')
+            query_counts.append(len(queries))
+
+        # Memory is sampled in a separate pass; tracemalloc skews the timings
+        peak = 0
+        for user, url in calls[:5]:
+            if not warm:
+                match_cache.clear()
+            client.force_authenticate(user)
+            tracemalloc.start()
+            client.get(url)
+            peak = max(peak, tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+
+        return {
+            'requests': len(calls),
+            'p50_ms': round(percentile(timings, 50), 3),
+            'p99_ms': round(percentile(timings, 99), 3),
+            'mean_ms': round(statistics.fmean(timings), 3),
+            'queries': int(statistics.median(query_counts)),
+            'peak_kib': round(peak / 1024, 1),
+        }
@@ -0,0 +1,68 @@
+# matching/management/commands/compute_matches.py
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from jobs.models import Job
+from users.models import User
+from matching.batch import BatchScorer
+from matching.models import JobMatch
+
+
+class Command(BaseCommand):
+    help = 'Score every job seeker against every active job and store the top-N matches per seeker'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--top', type=int, default=10, help='Matches to keep per seeker')
+        parser.add_argument('--chunk-size', type=int, default=2000, help='Seekers scored per batch')
+
+    def handle(self, *args, **options):
+        top_n = options['top']
+        chunk_size = options['chunk_size']
+        computed_at = timezone.now()
+
+        jobs = list(
+            Job.objects.filter(is_active=True).exclude(skill_ids=[]).values_list('id', 'skill_ids')
+        )
+        scorer = BatchScorer([job_id for job_id, _ in jobs], [skill_ids for _, skill_ids in jobs])
+        self.stdout.write(f'Loaded {len(jobs)} active jobs')
+
+        seekers = User.objects.filter(role='job_seeker', is_active=True)
+        # Drop matches for users who are no longer active seekers
+        JobMatch.objects.exclude(user__in=seekers).delete()
+
+        total_seekers = 0
+        total_matches = 0
+        chunk = []
+        for row in seekers.values_list('id', 'skill_ids').order_by('id').iterator(chunk_size=chunk_size):
+            chunk.append(row)
+            if len(chunk) >= chunk_size:
+                total_matches += self._write(scorer, chunk, top_n, computed_at)
+                total_seekers += len(chunk)
+                chunk = []
+        if chunk:
+            total_matches += self._write(scorer, chunk, top_n, computed_at)
+            total_seekers += len(chunk)
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Stored {total_matches} matches for {total_seekers} seekers'
+        ))
+
+    def _write(self, scorer, chunk, top_n, computed_at):
+        user_ids = [user_id for user_id, _ in chunk]
+        ranked = scorer.score([skill_ids for _, skill_ids in chunk], top_n=top_n)
+        rows = [
+            JobMatch(
+                user_id=user_id,
+                job_id=job_id,
+                match_score=round(score, 2),
+                rank=rank,
+                computed_at=computed_at,
+            )
+            for user_id, matches in zip(user_ids, ranked)
+            for rank, (job_id, score) in enumerate(matches, start=1)
+        ]
+        with transaction.atomic():
+            JobMatch.objects.filter(user_id__in=user_ids).delete()
+            JobMatch.objects.bulk_create(rows, batch_size=1000)
+        return len(rows)
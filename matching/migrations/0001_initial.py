@@ -0,0 +1,29 @@
+# Generated by Django 5.2.8 on 2026-10-18 14:52
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('jobs', '0003_alter_job_id'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JobSkill',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('skill', models.CharField(max_length=255)),
+                ('is_active', models.BooleanField(default=True)),
+                ('job', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='skill_index', to='jobs.job')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['skill', 'is_active'], name='matching_jo_skill_b234bd_idx')],
+                'unique_together': {('job', 'skill')},
+            },
+        ),
+    ]
@@ -0,0 +1,26 @@
+from django.db import migrations
+
+
+def backfill_job_skill_index(apps, schema_editor):
+    Job = apps.get_model('jobs', 'Job')
+    JobSkill = apps.get_model('matching', 'JobSkill')
+
+    rows = []
+    for job in Job.objects.only('id', 'required_skills', 'is_active').iterator():
+        skills = job.required_skills if isinstance(job.required_skills, list) else []
+        rows.extend(
+            JobSkill(job_id=job.id, skill=skill, is_active=job.is_active)
+            for skill in {s for s in skills if isinstance(s, str) and s}
+        )
+    JobSkill.objects.bulk_create(rows, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('matching', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_job_skill_index, migrations.RunPython.noop),
+    ]
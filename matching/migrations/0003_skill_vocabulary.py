@@ -0,0 +1,157 @@
+import re
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+DEFAULT_ALIASES = {
+    'Python': ['py', 'python3'],
+    'JavaScript': ['js', 'javascript es6', 'es6'],
+    'TypeScript': ['ts'],
+    'Go': ['golang'],
+    'Node.js': ['node', 'nodejs', 'node js'],
+    'React': ['reactjs', 'react.js', 'react js'],
+    'PostgreSQL': ['postgres', 'psql'],
+    'Kubernetes': ['k8s'],
+    'Machine Learning': ['ml'],
+    'Amazon Web Services': ['aws'],
+}
+
+
+_WHITESPACE = re.compile(r'\s+')
+
+
+class Vocabulary:
+    """Frozen copy of matching.skills.canonicalize that works on the historical models."""
+
+    def __init__(self, apps):
+        self.Skill = apps.get_model('matching', 'Skill')
+        self.skills = {key: (skill_id, name) for key, skill_id, name in
+                       self.Skill.objects.values_list('key', 'id', 'name')}
+        aliases = apps.get_model('matching', 'SkillAlias').objects.values_list('alias', 'skill_id', 'skill__name')
+        for alias, skill_id, name in aliases:
+            self.skills.setdefault(alias, (skill_id, name))
+
+    def canonicalize(self, names):
+        canonical, skill_ids = [], []
+        for name in names if isinstance(names, list) else []:
+            display = _WHITESPACE.sub(' ', name).strip() if isinstance(name, str) else ''
+            if not display:
+                continue
+            key = display.casefold()
+            if key not in self.skills:
+                skill = self.Skill.objects.create(key=key, name=display)
+                self.skills[key] = (skill.id, skill.name)
+            skill_id, canonical_name = self.skills[key]
+            if skill_id not in skill_ids:
+                skill_ids.append(skill_id)
+                canonical.append(canonical_name)
+        return canonical, skill_ids
+
+
+def canonicalize_skills(apps, schema_editor):
+    """Convert free-form Job.required_skills and User.skills to canonical names plus skill ids."""
+    vocabulary = Vocabulary(apps)
+    for model_name, field in (('jobs.Job', 'required_skills'), ('users.User', 'skills')):
+        model = apps.get_model(model_name)
+        batch = []
+        for obj in model.objects.only('id', field).iterator(chunk_size=1000):
+            names, obj.skill_ids = vocabulary.canonicalize(getattr(obj, field))
+            setattr(obj, field, names)
+            batch.append(obj)
+            if len(batch) >= 1000:
+                model.objects.bulk_update(batch, [field, 'skill_ids'])
+                batch = []
+        model.objects.bulk_update(batch, [field, 'skill_ids'])
+
+
+def clear_job_skill_index(apps, schema_editor):
+    # Rows are keyed by raw strings; rebuild_job_skill_index refills them with skill ids below
+    apps.get_model('matching', 'JobSkill').objects.all().delete()
+
+
+def rebuild_job_skill_index(apps, schema_editor):
+    Job = apps.get_model('jobs', 'Job')
+    JobSkill = apps.get_model('matching', 'JobSkill')
+
+    rows = []
+    for job_id, skill_ids, is_active in Job.objects.values_list('id', 'skill_ids', 'is_active').iterator():
+        rows.extend(
+            JobSkill(job_id=job_id, skill_id=skill_id, is_active=is_active)
+            for skill_id in set(skill_ids or [])
+        )
+    JobSkill.objects.bulk_create(rows, batch_size=1000)
+
+
+def seed_aliases(apps, schema_editor):
+    Skill = apps.get_model('matching', 'Skill')
+    SkillAlias = apps.get_model('matching', 'SkillAlias')
+
+    for name, aliases in DEFAULT_ALIASES.items():
+        skill, _ = Skill.objects.get_or_create(key=name.casefold(), defaults={'name': name})
+        for alias in aliases:
+            SkillAlias.objects.get_or_create(alias=alias, defaults={'skill': skill})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0004_job_skill_ids'),
+        ('matching', '0002_backfill_job_skill_index'),
+        ('users', '0005_user_skill_ids'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Skill',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=255)),
+                ('key', models.CharField(max_length=255, unique=True)),
+            ],
+            options={
+                'ordering': ['name'],
+            },
+        ),
+        migrations.CreateModel(
+            name='SkillAlias',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('alias', models.CharField(max_length=255, unique=True)),
+                ('skill', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='aliases', to='matching.skill')),
+            ],
+            options={
+                'verbose_name_plural': 'Skill aliases',
+            },
+        ),
+        migrations.RunPython(seed_aliases, migrations.RunPython.noop),
+        migrations.RunPython(canonicalize_skills, migrations.RunPython.noop),
+        migrations.RunPython(clear_job_skill_index, migrations.RunPython.noop),
+        migrations.AlterUniqueTogether(
+            name='jobskill',
+            unique_together=set(),
+        ),
+        migrations.RemoveIndex(
+            model_name='jobskill',
+            name='matching_jo_skill_b234bd_idx',
+        ),
+        migrations.RemoveField(
+            model_name='jobskill',
+            name='skill',
+        ),
+        migrations.AddField(
+            model_name='jobskill',
+            name='skill',
+            field=models.ForeignKey(default=0, on_delete=django.db.models.deletion.CASCADE, related_name='job_index', to='matching.skill'),
+            preserve_default=False,
+        ),
+        migrations.AlterUniqueTogether(
+            name='jobskill',
+            unique_together={('job', 'skill')},
+        ),
+        migrations.AddIndex(
+            model_name='jobskill',
+            index=models.Index(fields=['skill', 'is_active'], name='matching_jo_skill_i_ce3746_idx'),
+        ),
+        migrations.RunPython(rebuild_job_skill_index, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 5.2.8 on 2026-10-18 14:55
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def backfill_user_skill_index(apps, schema_editor):
+    User = apps.get_model('users', 'User')
+    UserSkill = apps.get_model('matching', 'UserSkill')
+
+    rows = []
+    for user in User.objects.only('id', 'skill_ids', 'role', 'is_active').iterator():
+        is_seeker = user.role == 'job_seeker' and user.is_active
+        rows.extend(
+            UserSkill(user_id=user.id, skill_id=skill_id, is_seeker=is_seeker)
+            for skill_id in set(user.skill_ids or [])
+        )
+    UserSkill.objects.bulk_create(rows, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('matching', '0003_skill_vocabulary'),
+        ('users', '0005_user_skill_ids'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserSkill',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('is_seeker', models.BooleanField(default=True)),
+                ('skill', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='user_index', to='matching.skill')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='skill_index', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['skill', 'is_seeker', 'user'], name='matching_us_skill_i_645622_idx')],
+                'unique_together': {('user', 'skill')},
+            },
+        ),
+        migrations.RunPython(backfill_user_skill_index, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.8 on 2026-10-18 14:58
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def count_active_jobs(apps, schema_editor):
+    Skill = apps.get_model('matching', 'Skill')
+    JobSkill = apps.get_model('matching', 'JobSkill')
+
+    counts = JobSkill.objects.filter(is_active=True).values('skill_id').annotate(n=Count('job_id'))
+    for row in counts:
+        Skill.objects.filter(id=row['skill_id']).update(active_job_count=row['n'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('matching', '0005_job_match'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='skill',
+            name='active_job_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.RunPython(count_active_jobs, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,54 @@
+# Generated by Django 5.2.8 on 2026-10-18 14:59
+
+import django.db.models.deletion
+from collections import Counter
+from datetime import timedelta
+
+from django.db import migrations, models
+
+
+def backfill_weekly_demand(apps, schema_editor):
+    Job = apps.get_model('jobs', 'Job')
+    SkillWeeklyDemand = apps.get_model('matching', 'SkillWeeklyDemand')
+
+    counts = Counter()
+    for created_at, skill_ids in Job.objects.values_list('created_at', 'skill_ids').iterator():
+        day = created_at.date()
+        week_start = day - timedelta(days=day.weekday())
+        for skill_id in set(skill_ids or []):
+            counts[(skill_id, week_start)] += 1
+
+    SkillWeeklyDemand.objects.bulk_create([
+        SkillWeeklyDemand(skill_id=skill_id, week_start=week_start, jobs_posted=n)
+        for (skill_id, week_start), n in counts.items()
+    ], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0004_job_skill_ids'),
+        ('matching', '0006_skill_active_job_count'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='skill',
+            name='active_job_count',
+            field=models.IntegerField(db_index=True, default=0),
+        ),
+        migrations.CreateModel(
+            name='SkillWeeklyDemand',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('week_start', models.DateField()),
+                ('jobs_posted', models.IntegerField(default=0)),
+                ('skill', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='weekly_demand', to='matching.skill')),
+            ],
+            options={
+                'ordering': ['skill', 'week_start'],
+                'unique_together': {('skill', 'week_start')},
+            },
+        ),
+        migrations.RunPython(backfill_weekly_demand, migrations.RunPython.noop),
+    ]
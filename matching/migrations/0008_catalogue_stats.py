@@ -0,0 +1,32 @@
+# Generated by Django 5.2.8 on 2026-10-18 16:20
+
+from django.db import migrations, models
+
+
+def count_active_jobs(apps, schema_editor):
+    CatalogueStats = apps.get_model('matching', 'CatalogueStats')
+    JobSkill = apps.get_model('matching', 'JobSkill')
+
+    active_jobs = JobSkill.objects.filter(is_active=True).values('job_id').distinct().count()
+    CatalogueStats.objects.update_or_create(pk=1, defaults={'active_jobs': active_jobs})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('matching', '0007_skill_weekly_demand'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CatalogueStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('active_jobs', models.IntegerField(default=0)),
+            ],
+            options={
+                'verbose_name_plural': 'Catalogue stats',
+            },
+        ),
+        migrations.RunPython(count_active_jobs, migrations.RunPython.noop),
+    ]
@@ -1,3 +1,113 @@
+# matching/models.py
 from django.db import models
 
-# Create your models here.
+
+class Skill(models.Model):
+    """Canonical skill vocabulary; ``key`` is the normalized form used for lookups."""
+    name = models.CharField(max_length=255)
+    key = models.CharField(max_length=255, unique=True)
+    # Number of active jobs requiring this skill, maintained by matching.index
+    active_job_count = models.IntegerField(default=0, db_index=True)
+
+    class Meta:
+        ordering = ['name']
+
+    def clean(self):
+        from .skills import normalize_skill
+
+        self.key = normalize_skill(self.key or '')
+
+    def __str__(self):
+        return self.name
+
+
+class SkillAlias(models.Model):
+    """Alternative spelling (normalized) that resolves to a canonical skill."""
+    alias = models.CharField(max_length=255, unique=True)
+    skill = models.ForeignKey(Skill, on_delete=models.CASCADE, related_name='aliases')
+
+    class Meta:
+        verbose_name_plural = 'Skill aliases'
+
+    def clean(self):
+        from .skills import normalize_skill
+
+        # Normalize before the form's uniqueness check runs
+        self.alias = normalize_skill(self.alias or '')
+
+    def __str__(self):
+        return f"{self.alias} → {self.skill.name}"
+
+
+class CatalogueStats(models.Model):
+    """Single row of catalogue-wide totals, maintained by matching.index with the skill counts."""
+    # Active jobs requiring at least one skill (the N in idf)
+    active_jobs = models.IntegerField(default=0)
+
+    class Meta:
+        verbose_name_plural = 'Catalogue stats'
+
+    def __str__(self):
+        return f"{self.active_jobs} active jobs"
+
+
+class SkillWeeklyDemand(models.Model):
+    """Jobs posted per skill per week (weeks start on Monday), maintained on job creation."""
+    skill = models.ForeignKey(Skill, on_delete=models.CASCADE, related_name='weekly_demand')
+    week_start = models.DateField()
+    jobs_posted = models.IntegerField(default=0)
+
+    class Meta:
+        unique_together = ['skill', 'week_start']
+        ordering = ['skill', 'week_start']
+
+    def __str__(self):
+        return f"{self.skill_id} @ {self.week_start}: {self.jobs_posted}"
+
+
+class JobSkill(models.Model):
+    """Inverted index row: one per (job, skill) pair, kept in sync with Job.skill_ids."""
+    job = models.ForeignKey('jobs.Job', on_delete=models.CASCADE, related_name='skill_index')
+    skill = models.ForeignKey(Skill, on_delete=models.CASCADE, related_name='job_index')
+    is_active = models.BooleanField(default=True)
+
+    class Meta:
+        unique_together = ['job', 'skill']
+        indexes = [
+            models.Index(fields=['skill', 'is_active']),
+        ]
+
+    def __str__(self):
+        return f"skill {self.skill_id} → job {self.job_id}"
+
+
+class UserSkill(models.Model):
+    """Inverted index row: one per (user, skill) pair, kept in sync with User.skill_ids."""
+    user = models.ForeignKey('users.User', on_delete=models.CASCADE, related_name='skill_index')
+    skill = models.ForeignKey(Skill, on_delete=models.CASCADE, related_name='user_index')
+    is_seeker = models.BooleanField(default=True)
+
+    class Meta:
+        unique_together = ['user', 'skill']
+        indexes = [
+            models.Index(fields=['skill', 'is_seeker', 'user']),
+        ]
+
+    def __str__(self):
+        return f"skill {self.skill_id} → user {self.user_id}"
+
+
+class JobMatch(models.Model):
+    """Precomputed top-N job matches per seeker, written by ``manage.py compute_matches``."""
+    user = models.ForeignKey('users.User', on_delete=models.CASCADE, related_name='job_matches')
+    job = models.ForeignKey('jobs.Job', on_delete=models.CASCADE, related_name='seeker_matches')
+    match_score = models.FloatField()
+    rank = models.PositiveSmallIntegerField()
+    computed_at = models.DateTimeField()
+
+    class Meta:
+        unique_together = ['user', 'job']
+        ordering = ['user', 'rank']
+
+    def __str__(self):
+        return f"user {self.user_id} → job {self.job_id} ({self.match_score:.2f}%)"
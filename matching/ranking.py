@@ -0,0 +1,82 @@
+# matching/ranking.py
+import base64
+import heapq
+from bisect import bisect_right
+
+# Jobs and candidates below this match percentage are not suggested
+MIN_MATCH_PERCENTAGE = 30
+
+
+def encode_cursor(score, object_id):
+    """Opaque cursor pointing just past ``(score, object_id)`` in ranked order."""
+    raw = f"{score!r}:{object_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def decode_cursor(value):
+    """Inverse of ``encode_cursor``; raises ValueError for anything malformed."""
+    try:
+        raw = base64.urlsafe_b64decode(value.encode()).decode()
+        score, object_id = raw.split(':')
+        return float(score), int(object_id)
+    except (UnicodeError, ValueError, TypeError) as exc:
+        raise ValueError('Invalid cursor') from exc
+
+
+def ranked_page(scored, page_size, after=None):
+    """Select one page of ``(score, object_id, extra)`` items, best score first.
+
+    Items are streamed through a heap of ``page_size + 1`` entries, so memory is
+    O(page_size) however many items match. Ties are broken by ascending id and
+    ``after`` is a decoded cursor. Returns ``(page, total, has_more)`` where
+    ``total`` counts every item, including those before the cursor.
+    """
+    total = 0
+
+    def remaining():
+        nonlocal total
+        for item in scored:
+            total += 1
+            if after is None or (-item[0], item[1]) > (-after[0], after[1]):
+                yield item
+
+    best = heapq.nsmallest(page_size + 1, remaining(), key=lambda item: (-item[0], item[1]))
+    return best[:page_size], total, len(best) > page_size
+
+
+def _rank_key(item):
+    return -item[0], item[1]
+
+
+class Ranking:
+    """Scored ``(score, object_id)`` pairs in rank order, computed once and sliced per cursor.
+
+    ``items`` holds at most the best ``limit`` results; ``total`` counts every
+    match. A cursor past the stored prefix gets no page, so the caller can fall
+    back to ``ranked_page``.
+    """
+
+    def __init__(self, items, total):
+        self.items = items
+        self.total = total
+
+    @classmethod
+    def build(cls, scored, limit):
+        """Rank an iterable of ``(score, object_id, ...)`` items, keeping the best ``limit``."""
+        total = 0
+
+        def counted():
+            nonlocal total
+            for item in scored:
+                total += 1
+                yield item[0], item[1]
+
+        return cls(heapq.nsmallest(limit, counted(), key=_rank_key), total)
+
+    def page(self, page_size, after=None):
+        """Return ``(page, has_more)`` after the decoded cursor, or None past the stored prefix."""
+        start = 0 if after is None else bisect_right(self.items, _rank_key(after), key=_rank_key)
+        end = start + page_size
+        if end > len(self.items) and len(self.items) < self.total:
+            return None
+        return self.items[start:end], end < self.total
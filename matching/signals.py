@@ -0,0 +1,83 @@
+# matching/signals.py
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+
+from jobs.models import Job
+from users.models import User
+from .index import index_job, index_user, unindex_job
+from .models import Skill, SkillAlias
+from .skills import bump_vocabulary_version, canonicalize, normalize_skill, registry
+from .stats import record_job_posted
+
+
+def _skills_changed(update_fields, field):
+    return update_fields is None or field in update_fields
+
+
+@receiver(pre_save, sender=User)
+def intern_user_skills(sender, instance, raw=False, update_fields=None, **kwargs):
+    """Store the seeker's skills as canonical names plus interned skill ids."""
+    if raw or not _skills_changed(update_fields, 'skills'):
+        return
+    instance.skills, instance.skill_ids = canonicalize(instance.skills)
+
+
+@receiver(pre_save, sender=Job)
+def intern_job_skills(sender, instance, raw=False, update_fields=None, **kwargs):
+    """Store the job's required skills as canonical names plus interned skill ids."""
+    if raw or not _skills_changed(update_fields, 'required_skills'):
+        return
+    instance.required_skills, instance.skill_ids = canonicalize(instance.required_skills)
+
+
+@receiver(post_save, sender=Job)
+def sync_job_skill_index(sender, instance, created=False, raw=False, **kwargs):
+    """Keep the skill → job inverted index current on job create/update/toggle."""
+    if raw:
+        return
+    index_job(instance)
+    if created:
+        record_job_posted(instance)
+
+
+@receiver(pre_delete, sender=Job)
+def release_job_skill_counts(sender, instance, **kwargs):
+    unindex_job(instance)
+
+
+@receiver(post_save, sender=User)
+def sync_user_skill_index(sender, instance, raw=False, update_fields=None, **kwargs):
+    """Keep the skill → seeker index current when skills, role or activity change."""
+    if raw:
+        return
+    if update_fields is not None and not {'skills', 'role', 'is_active'} & set(update_fields):
+        return
+    index_user(instance)
+
+
+@receiver(post_save, sender=Skill)
+@receiver(post_delete, sender=Skill)
+@receiver(post_save, sender=SkillAlias)
+@receiver(post_delete, sender=SkillAlias)
+def reset_skill_registry(sender, created=False, **kwargs):
+    """Drop cached lookups in every process when the vocabulary is edited.
+
+    Newly created skills need no reset; the registry caches them on commit.
+    """
+    if sender is Skill and created:
+        return
+    registry.clear()
+    transaction.on_commit(bump_vocabulary_version)
+
+
+@receiver(pre_save, sender=Skill)
+@receiver(pre_save, sender=SkillAlias)
+def normalize_vocabulary_keys(sender, instance, raw=False, **kwargs):
+    """Store lookup keys normalized however they were typed (e.g. in the admin)."""
+    if raw:
+        return
+    if sender is Skill:
+        instance.key = normalize_skill(instance.key)
+    else:
+        instance.alias = normalize_skill(instance.alias)
@@ -0,0 +1,160 @@
+# matching/skills.py
+import re
+import threading
+
+from django.core.cache import cache
+from django.db import transaction
+
+from .models import Skill, SkillAlias
+
+_WHITESPACE = re.compile(r'\s+')
+
+
+def clean_skill(name):
+    """Collapse internal whitespace and strip the ends, keeping the original casing."""
+    return _WHITESPACE.sub(' ', name).strip()
+
+
+def normalize_skill(name):
+    """Return the lookup key for a skill name ("  Python " -> "python")."""
+    return clean_skill(name).casefold()
+
+
+VOCABULARY_VERSION_KEY = 'matching:vocabulary-version'
+
+
+def vocabulary_version():
+    """Return the skill-vocabulary version shared by every process; it changes on each edit."""
+    version = cache.get(VOCABULARY_VERSION_KEY)
+    if version is None:
+        cache.add(VOCABULARY_VERSION_KEY, 1, timeout=None)
+        version = cache.get(VOCABULARY_VERSION_KEY, 1)
+    return version
+
+
+def bump_vocabulary_version():
+    try:
+        return cache.incr(VOCABULARY_VERSION_KEY)
+    except ValueError:
+        cache.add(VOCABULARY_VERSION_KEY, 1, timeout=None)
+        return cache.incr(VOCABULARY_VERSION_KEY)
+
+
+class SkillRegistry:
+    """Process-wide cache of the canonical skill vocabulary.
+
+    Lookups are only cached once the transaction that read or created them
+    commits, so a rolled-back skill id is never handed out again. Admin edits
+    bump ``vocabulary_version``, which drops the maps in every process.
+    """
+
+    def __init__(self):
+        self._ids = {}
+        self._names = {}
+        self._version = None
+        self._lock = threading.Lock()
+
+    def clear(self):
+        with self._lock:
+            self._ids.clear()
+            self._names.clear()
+            self._version = None
+
+    def resolve(self, names, create=True):
+        """Map raw skill names to ``(id, canonical name)`` pairs, deduplicated, in order.
+
+        Unknown skills are added to the vocabulary unless ``create`` is False,
+        in which case they are dropped.
+        """
+        self._sync()
+        cleaned = []
+        for name in names or []:
+            if isinstance(name, str) and clean_skill(name):
+                cleaned.append((normalize_skill(name), clean_skill(name)))
+
+        found = {}
+        for key, _ in cleaned:
+            skill_id = self._ids.get(key)
+            if skill_id is not None and skill_id in self._names:
+                found[key] = (skill_id, self._names[skill_id])
+
+        missing = {key for key, _ in cleaned} - set(found)
+        if missing:
+            loaded = self._load(missing)
+            if create:
+                for key, display in cleaned:
+                    if key not in found and key not in loaded:
+                        loaded[key] = self._create(key, display)
+            self._remember(loaded)
+            found.update(loaded)
+
+        resolved = []
+        seen = set()
+        for key, _ in cleaned:
+            entry = found.get(key)
+            if entry is not None and entry[0] not in seen:
+                seen.add(entry[0])
+                resolved.append(entry)
+        return resolved
+
+    def names(self, skill_ids):
+        """Return canonical names for skill ids, in the given order."""
+        self._sync()
+        names = {skill_id: self._names[skill_id] for skill_id in skill_ids if skill_id in self._names}
+        missing = [skill_id for skill_id in skill_ids if skill_id not in names]
+        if missing:
+            loaded = dict(Skill.objects.filter(id__in=missing).values_list('id', 'name'))
+            self._remember({}, loaded)
+            names.update(loaded)
+        return [names[skill_id] for skill_id in skill_ids if skill_id in names]
+
+    def _sync(self):
+        version = vocabulary_version()
+        if version != self._version:
+            with self._lock:
+                self._ids.clear()
+                self._names.clear()
+                self._version = version
+
+    def _load(self, keys):
+        found = {}
+        for key, skill_id, name in Skill.objects.filter(key__in=keys).values_list('key', 'id', 'name'):
+            found[key] = (skill_id, name)
+        aliases = SkillAlias.objects.filter(alias__in=keys - set(found)).values_list(
+            'alias', 'skill_id', 'skill__name'
+        )
+        for alias, skill_id, name in aliases:
+            found[alias] = (skill_id, name)
+        return found
+
+    def _create(self, key, display):
+        skill, _ = Skill.objects.get_or_create(key=key, defaults={'name': display})
+        return skill.id, skill.name
+
+    def _remember(self, found, names=None):
+        """Cache ``{key: (id, name)}`` lookups once the current transaction commits.
+
+        Runs immediately outside a transaction. Rows read or created inside one
+        may vanish with a rollback, and on_commit drops the callback with them.
+        """
+        version = self._version
+        names = dict(names or {})
+        names.update(found.values())
+
+        def publish():
+            with self._lock:
+                if self._version != version:
+                    return
+                for key, (skill_id, _) in found.items():
+                    self._ids[key] = skill_id
+                self._names.update(names)
+        transaction.on_commit(publish)
+
+
+registry = SkillRegistry()
+
+
+def canonicalize(names, create=True):
+    """Return ``(canonical_names, skill_ids)`` for a list of raw skill names."""
+    resolved = registry.resolve(names, create=create)
+    return [name for _, name in resolved], [skill_id for skill_id, _ in resolved]
@@ -0,0 +1,191 @@
+# matching/stats.py
+import math
+import threading
+from collections import Counter, defaultdict
+from datetime import timedelta
+
+from django.db import transaction
+from django.db.models import Count, F
+from django.utils import timezone
+
+from afriremotely.background import run_in_background
+from jobs.cache import catalogue_version
+from .models import CatalogueStats, JobSkill, Skill, SkillWeeklyDemand
+
+
+def adjust_active_counts(added, removed):
+    """Apply +1/-1 to Skill.active_job_count for skills entering/leaving an active job."""
+    if added:
+        Skill.objects.filter(id__in=added).update(active_job_count=F('active_job_count') + 1)
+    if removed:
+        Skill.objects.filter(id__in=removed).update(active_job_count=F('active_job_count') - 1)
+
+
+def _count_active_jobs():
+    return JobSkill.objects.filter(is_active=True).values('job_id').distinct().count()
+
+
+def adjust_active_total(delta):
+    """Apply an increment to the number of active jobs requiring at least one skill."""
+    if not delta:
+        return
+    if not CatalogueStats.objects.filter(pk=1).update(active_jobs=F('active_jobs') + delta):
+        # No row yet (e.g. a flushed database): count once from the index, which already has the change
+        CatalogueStats.objects.get_or_create(pk=1, defaults={'active_jobs': _count_active_jobs()})
+
+
+def add_active_counts(counts):
+    """Apply a ``{skill_id: n}`` mapping of increments to Skill.active_job_count."""
+    by_increment = defaultdict(list)
+    for skill_id, n in counts.items():
+        by_increment[n].append(skill_id)
+    for n, skill_ids in by_increment.items():
+        Skill.objects.filter(id__in=skill_ids).update(active_job_count=F('active_job_count') + n)
+
+
+def week_start(value):
+    """Monday of the week containing a date or datetime."""
+    day = timezone.localdate(value) if hasattr(value, 'hour') else value
+    return day - timedelta(days=day.weekday())
+
+
+def record_job_posted(job):
+    """Count a newly posted job towards this week's demand for each of its skills."""
+    skill_ids = set(job.skill_ids or [])
+    if not skill_ids:
+        return
+    week = week_start(job.created_at or timezone.now())
+    SkillWeeklyDemand.objects.bulk_create(
+        [SkillWeeklyDemand(skill_id=skill_id, week_start=week) for skill_id in skill_ids],
+        ignore_conflicts=True,
+    )
+    SkillWeeklyDemand.objects.filter(skill_id__in=skill_ids, week_start=week).update(
+        jobs_posted=F('jobs_posted') + 1
+    )
+
+
+def record_jobs_posted(jobs):
+    """Batch form of ``record_job_posted`` for jobs created with ``bulk_create``."""
+    weekly = Counter()
+    for job in jobs:
+        week = week_start(job.created_at or timezone.now())
+        for skill_id in set(job.skill_ids or []):
+            weekly[(skill_id, week)] += 1
+    if not weekly:
+        return
+    SkillWeeklyDemand.objects.bulk_create(
+        [SkillWeeklyDemand(skill_id=skill_id, week_start=week) for skill_id, week in weekly],
+        ignore_conflicts=True,
+    )
+    by_increment = defaultdict(lambda: defaultdict(list))
+    for (skill_id, week), n in weekly.items():
+        by_increment[week][n].append(skill_id)
+    for week, increments in by_increment.items():
+        for n, skill_ids in increments.items():
+            SkillWeeklyDemand.objects.filter(skill_id__in=skill_ids, week_start=week).update(
+                jobs_posted=F('jobs_posted') + n
+            )
+
+
+def rebuild_weekly_demand(batch_size=1000):
+    """Recount every SkillWeeklyDemand row from Job.skill_ids (used after bulk rebuilds)."""
+    from jobs.models import Job
+
+    weekly = Counter()
+    for created_at, skill_ids in Job.objects.values_list('created_at', 'skill_ids').iterator(chunk_size=batch_size):
+        week = week_start(created_at)
+        for skill_id in set(skill_ids or []):
+            weekly[(skill_id, week)] += 1
+    with transaction.atomic():
+        SkillWeeklyDemand.objects.all().delete()
+        SkillWeeklyDemand.objects.bulk_create([
+            SkillWeeklyDemand(skill_id=skill_id, week_start=week, jobs_posted=n)
+            for (skill_id, week), n in weekly.items()
+        ], batch_size=batch_size)
+    return len(weekly)
+
+
+def refresh_skill_stats():
+    """Recompute every Skill.active_job_count and the active-job total from the index.
+
+    Used after bulk rebuilds.
+    """
+    counts = dict(
+        JobSkill.objects.filter(is_active=True)
+        .values('skill_id')
+        .annotate(n=Count('job_id'))
+        .values_list('skill_id', 'n')
+    )
+    Skill.objects.exclude(id__in=counts).exclude(active_job_count=0).update(active_job_count=0)
+    for skill_id, n in counts.items():
+        Skill.objects.filter(id=skill_id).update(active_job_count=n)
+    CatalogueStats.objects.update_or_create(pk=1, defaults={'active_jobs': _count_active_jobs()})
+
+
+def active_job_total():
+    """Number of active jobs requiring at least one skill, as maintained by ``adjust_active_total``."""
+    return CatalogueStats.objects.filter(pk=1).values_list('active_jobs', flat=True).first() or 0
+
+
+class IdfWeights:
+    """Immutable snapshot of skill weights; unknown skills weigh as if no job required them.
+
+    ``version`` is the catalogue version the weights were loaded for.
+    """
+
+    def __init__(self, weights, default, version):
+        self._weights = weights
+        self.default = default
+        self.version = version
+
+    def weight(self, skill_id):
+        return self._weights.get(skill_id, self.default)
+
+
+class SkillWeights:
+    """Inverse-document-frequency weights over active jobs, refreshed per catalogue version.
+
+    idf(skill) = ln((N + 1) / (df + 1)) + 1, where N is the number of active
+    jobs requiring any skill and df the number requiring this one. Only the
+    first lookup loads them in the request; after a catalogue change the old
+    weights keep being served while a single background refresh reloads them.
+    """
+
+    def __init__(self):
+        self._version = None
+        self._weights = None
+        self._refreshing = threading.Lock()
+
+    def current(self):
+        version = catalogue_version()
+        if self._weights is None:
+            self.refresh(version)
+        elif version != self._version and self._refreshing.acquire(blocking=False):
+            run_in_background(self._refresh_once, version)
+        return self._weights
+
+    def refresh(self, version=None):
+        # Read the version first, so writes made during the load trigger another refresh
+        version = catalogue_version() if version is None else version
+        total = active_job_total()
+        weights = {
+            skill_id: math.log((total + 1) / (df + 1)) + 1
+            for skill_id, df in Skill.objects.filter(active_job_count__gt=0)
+            .values_list('id', 'active_job_count')
+            .iterator()
+        }
+        self._weights = IdfWeights(weights, math.log(total + 1) + 1, version)
+        self._version = version
+
+    def clear(self):
+        self._weights = None
+        self._version = None
+
+    def _refresh_once(self, version):
+        try:
+            self.refresh(version)
+        finally:
+            self._refreshing.release()
+
+
+skill_weights = SkillWeights()
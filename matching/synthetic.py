@@ -0,0 +1,109 @@
+# matching/synthetic.py
+import itertools
+import random
+
+from django.contrib.auth.hashers import make_password
+
+from jobs.cache import bump_catalogue_version
+from jobs.models import Job
+from users.models import User
+from .index import rebuild_index, rebuild_user_index
+from .models import Skill
+from .stats import rebuild_weekly_demand, refresh_skill_stats
+
+CATEGORIES = ['Engineering', 'Design', 'Marketing', 'Sales', 'Support', 'Data', 'Product', 'Finance']
+LOCATIONS = ['Remote', 'Lagos', 'Nairobi', 'Accra', 'Cape Town', 'Kigali', 'Cairo', 'Casablanca']
+
+
+class CatalogueGenerator:
+    """Deterministic users/jobs/skills for benchmarks.
+
+    Skill popularity follows a Zipf-like law (weight of rank k is 1 / k**s), so
+    a handful of skills appear in most postings and a long tail in very few.
+    The same seed always yields the same catalogue.
+    """
+
+    def __init__(self, seed=42, n_skills=2000, zipf_s=1.1, batch_size=5000):
+        self.rng = random.Random(seed)
+        self.n_skills = n_skills
+        self.batch_size = batch_size
+        self.cum_weights = list(itertools.accumulate(
+            1 / rank ** zipf_s for rank in range(1, n_skills + 1)
+        ))
+        self.skills = []
+
+    def sample_skills(self, low, high):
+        """Draw a set of between ``low`` and ``high`` distinct skills, Zipf-weighted."""
+        wanted = self.rng.randint(low, high)
+        picked = {}
+        while len(picked) < wanted:
+            for skill in self.rng.choices(self.skills, cum_weights=self.cum_weights, k=wanted - len(picked)):
+                picked[skill.id] = skill
+        return list(picked.values())
+
+    def create_skills(self):
+        Skill.objects.bulk_create(
+            [Skill(name=f'Skill {i:05d}', key=f'skill {i:05d}') for i in range(self.n_skills)],
+            batch_size=self.batch_size,
+            ignore_conflicts=True,
+        )
+        by_key = {skill.key: skill for skill in Skill.objects.filter(key__startswith='skill ')}
+        self.skills = [by_key[f'skill {i:05d}'] for i in range(self.n_skills)]
+        return self.skills
+
+    def create_users(self, n_seekers, n_recruiters=10, prefix='bench'):
+        password = make_password(None)
+        users = []
+        for i in range(n_recruiters):
+            users.append(User(email=f'{prefix}-recruiter-{i}@example.com', full_name=f'Recruiter {i}',
+                              role='recruiter', is_verified=True, password=password))
+        for i in range(n_seekers):
+            skills = self.sample_skills(2, 10)
+            users.append(User(email=f'{prefix}-seeker-{i}@example.com', full_name=f'Seeker {i}',
+                              role='job_seeker', password=password,
+                              skills=[s.name for s in skills], skill_ids=[s.id for s in skills]))
+        User.objects.bulk_create(users, batch_size=self.batch_size)
+        rebuild_user_index(
+            User.objects.filter(email__startswith=f'{prefix}-').only('id', 'skill_ids', 'role', 'is_active').iterator(),
+            batch_size=self.batch_size,
+        )
+        recruiters = list(User.objects.filter(email__startswith=f'{prefix}-recruiter-'))
+        seekers = list(User.objects.filter(email__startswith=f'{prefix}-seeker-').values_list('id', flat=True))
+        return recruiters, seekers
+
+    def create_jobs(self, n_jobs, recruiters, active_ratio=0.9):
+        created = 0
+        while created < n_jobs:
+            batch = []
+            for i in range(created, min(created + self.batch_size, n_jobs)):
+                skills = self.sample_skills(3, 8)
+                batch.append(Job(
+                    created_by=self.rng.choice(recruiters),
+                    title=f'Job {i}',
+                    description=f'Synthetic posting {i}',
+                    category=self.rng.choice(CATEGORIES),
+                    required_skills=[s.name for s in skills],
+                    skill_ids=[s.id for s in skills],
+                    salary_range=f'{self.rng.randrange(1000, 10000, 500)}',
+                    location=self.rng.choice(LOCATIONS),
+                    job_type=self.rng.choice(Job.JOB_TYPES)[0],
+                    is_active=self.rng.random() < active_ratio,
+                ))
+            Job.objects.bulk_create(batch)
+            created += len(batch)
+
+        jobs = Job.objects.only('id', 'skill_ids', 'is_active', 'created_at')
+        rebuild_index(jobs.iterator(), batch_size=self.batch_size)
+        refresh_skill_stats()
+
+        rebuild_weekly_demand(batch_size=self.batch_size)
+        return list(Job.objects.filter(is_active=True).values_list('id', flat=True))
+
+    def generate(self, n_jobs, n_seekers):
+        """Create a full catalogue; returns ``(recruiters, seeker_ids, active_job_ids)``."""
+        self.create_skills()
+        recruiters, seekers = self.create_users(n_seekers)
+        active_jobs = self.create_jobs(n_jobs, recruiters)
+        # Bulk inserts skip the Job signals, so invalidate catalogue-derived caches here
+        bump_catalogue_version()
+        return recruiters, seekers, active_jobs
@@ -1,3 +1,522 @@
-from django.test import TestCase
+# matching/tests.py
+import io
+import math
+from datetime import timedelta
+from unittest import mock
 
-# Create your tests here.
+from django.core.management import call_command
+from django.db import transaction
+from django.utils import timezone
+
+from jobs.models import Job
+from jobs.tests import JobTestCase
+from afriremotely.testing import QueryCountAssertionsMixin, QueryPlanAssertionsMixin
+from users.models import User
+from .batch import BatchScorer
+from .cache import MatchCache, match_cache
+from .ranking import Ranking, encode_cursor
+from .models import CatalogueStats, JobMatch, JobSkill, Skill, SkillAlias, SkillWeeklyDemand, UserSkill
+from .skills import bump_vocabulary_version, canonicalize
+from .stats import refresh_skill_stats, skill_weights, week_start
+from .synthetic import CatalogueGenerator
+
+
+class JobsForMeQueryPlanTests(QueryPlanAssertionsMixin, JobTestCase):
+    watched_tables = ('jobs_job', 'matching_jobskill', 'matching_userskill')
+
+    def test_jobs_for_me(self):
+        seeker = User.objects.create_user(
+            email='seeker@example.com', password='testpass123',
+            full_name='Seeker', role='job_seeker', skills=['python']
+        )
+        self.client.force_authenticate(seeker)
+        with self.assertNoFullTableScan():
+            response = self.client.get('/api/match/jobs-for-me/')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['total_matches_found'], 2)
+
+
+class JobsForMeQueryCountTests(QueryCountAssertionsMixin, JobTestCase):
+    def test_jobs_for_me(self):
+        for index in range(10):
+            recruiter = User.objects.create_user(
+                email=f'recruiter{index}@example.com', password=None,
+                full_name=f'Recruiter {index}', role='recruiter'
+            )
+            self.create_job(created_by=recruiter, required_skills=['Python'])
+        seeker = User.objects.create_user(
+            email='seeker@example.com', password=None,
+            full_name='Seeker', role='job_seeker', skills=['python']
+        )
+        self.client.force_authenticate(seeker)
+        response = self.assertRequestQueries(2, '/api/match/jobs-for-me/')
+        self.assertEqual(len(response.data['suggested_jobs']), 10)
+
+
+class Rollback(Exception):
+    pass
+
+
+class SkillVocabularyTests(JobTestCase):
+    def test_spellings_and_aliases_share_one_skill(self):
+        names, skill_ids = canonicalize(['  python ', 'Py', 'PYTHON3', 'Django', 'django'])
+        self.assertEqual(names, ['Python', 'Django'])
+        self.assertEqual(skill_ids, list(Skill.objects.filter(key__in=['python', 'django'])
+                                         .order_by('-key').values_list('id', flat=True)))
+
+    def test_unknown_skills_are_created_unless_lookup_only(self):
+        self.assertEqual(canonicalize(['Elixir'], create=False), ([], []))
+        self.assertFalse(Skill.objects.filter(key='elixir').exists())
+        names, skill_ids = canonicalize(['Elixir'])
+        self.assertEqual(names, ['Elixir'])
+        self.assertEqual(Skill.objects.get(key='elixir').id, skill_ids[0])
+
+    def test_job_and_seeker_skills_are_interned(self):
+        job = self.create_job(required_skills=['golang', 'K8s'])
+        self.assertEqual(job.required_skills, ['Go', 'Kubernetes'])
+        seeker = User.objects.create_user(email='seeker@example.com', password=None, full_name='Seeker',
+                                          role='job_seeker', skills=['GO '])
+        self.assertEqual(seeker.skill_ids, job.skill_ids[:1])
+
+    def test_rolled_back_skill_ids_are_not_cached(self):
+        try:
+            with transaction.atomic():
+                self.create_job(required_skills=['Zyxskill'])
+                raise Rollback
+        except Rollback:
+            pass
+        self.assertFalse(Skill.objects.filter(key='zyxskill').exists())
+
+        job = self.create_job(required_skills=['Zyxskill'])
+        self.assertEqual(Skill.objects.get(key='zyxskill').id, job.skill_ids[0])
+        self.assertTrue(JobSkill.objects.filter(job=job, skill_id=job.skill_ids[0]).exists())
+
+    def test_committed_lookups_are_cached(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.create_job(required_skills=['Haskell'])
+        with self.assertNumQueries(0):
+            self.assertEqual(canonicalize(['haskell'])[0], ['Haskell'])
+
+    def test_edits_from_another_process_reset_the_registry(self):
+        rust = Skill.objects.create(key='rust', name='Rust')
+        with self.captureOnCommitCallbacks(execute=True):
+            canonicalize(['py'])
+        # Another process repoints the alias and bumps the shared version
+        SkillAlias.objects.filter(alias='py').update(skill=rust)
+        self.assertEqual(canonicalize(['py'])[0], ['Python'])
+        bump_vocabulary_version()
+        self.assertEqual(canonicalize(['py'])[0], ['Rust'])
+
+    def test_aliases_are_normalized_however_they_are_entered(self):
+        python = Skill.objects.get(key='python')
+        alias = SkillAlias(alias='  Py  Lang ', skill=python)
+        alias.full_clean()
+        self.assertEqual(alias.alias, 'py lang')
+        SkillAlias.objects.create(alias='CPython', skill=python)
+        self.assertTrue(SkillAlias.objects.filter(alias='cpython').exists())
+        alias.save()
+        self.assertEqual(canonicalize(['PY LANG', 'cpython'])[0], ['Python'])
+
+    def test_backfill_converts_free_form_skills(self):
+        job = self.jobs[0]
+        seeker = User.objects.create_user(email='seeker@example.com', password=None,
+                                          full_name='Seeker', role='job_seeker')
+        # Rows written before the vocabulary existed: raw strings and no index
+        Job.objects.filter(pk=job.pk).update(required_skills=[' py', 'Golang', 'golang'], skill_ids=[])
+        User.objects.filter(pk=seeker.pk).update(skills=['GO'], skill_ids=[])
+        JobSkill.objects.all().delete()
+        UserSkill.objects.all().delete()
+
+        call_command('backfill_skills', stdout=io.StringIO())
+
+        job.refresh_from_db()
+        seeker.refresh_from_db()
+        go = Skill.objects.get(key='go')
+        self.assertEqual(job.required_skills, ['Python', 'Go'])
+        self.assertEqual(seeker.skill_ids, [go.id])
+        self.assertEqual(set(JobSkill.objects.filter(job=job).values_list('skill_id', flat=True)),
+                         set(job.skill_ids))
+        self.assertTrue(UserSkill.objects.filter(user=seeker, skill=go).exists())
+        self.assertEqual(Skill.objects.get(key='python').active_job_count, 2)
+
+
+class MatchCacheTests(JobTestCase):
+    url = '/api/match/jobs-for-me/'
+
+    def setUp(self):
+        super().setUp()
+        self.seeker = User.objects.create_user(email='seeker@example.com', password=None,
+                                               full_name='Seeker', role='job_seeker', skills=['Python'])
+
+    def suggested(self):
+        self.client.force_authenticate(self.seeker)
+        response = self.client.get(self.url)
+        return sorted(job['title'] for job in response.data['suggested_jobs'])
+
+    def as_recruiter(self, method, url, data=None):
+        self.client.force_authenticate(self.recruiter)
+        # The catalogue version moves when the write commits
+        with self.captureOnCommitCallbacks(execute=True):
+            response = getattr(self.client, method)(url, data, format='json')
+        self.assertLess(response.status_code, 300)
+
+    def test_repeat_request_is_served_from_cache(self):
+        hits = match_cache.stats()['hits']
+        self.assertEqual(self.suggested(), ['Backend Engineer', 'Data Analyst'])
+        # Only the page's job rows are read; nothing is scored again
+        with self.assertNumQueries(1):
+            self.suggested()
+        self.assertEqual(match_cache.stats()['hits'], hits + 1)
+
+    def test_skills_update_invalidates_the_seeker(self):
+        self.suggested()
+        invalidations = match_cache.stats()['invalidations']
+        self.client.force_authenticate(self.seeker)
+        self.client.put('/api/users/me/update/', {'skills': ['Figma']}, format='json')
+        self.assertEqual(match_cache.stats()['invalidations'], invalidations + 1)
+        self.seeker.refresh_from_db()
+        self.assertEqual(self.suggested(), ['Product Designer'])
+
+    def test_job_writes_invalidate_every_seeker(self):
+        self.suggested()
+        self.as_recruiter('post', '/api/jobs/jobs/', {
+            'title': 'ML Engineer', 'description': 'Models', 'category': 'Engineering',
+            'required_skills': ['Python'], 'salary_range': '4000', 'location': 'Remote', 'job_type': 'remote',
+        })
+        self.assertEqual(self.suggested(), ['Backend Engineer', 'Data Analyst', 'ML Engineer'])
+
+        self.as_recruiter('patch', f'/api/jobs/jobs/{self.jobs[0].id}/', {'required_skills': ['Rust']})
+        self.assertEqual(self.suggested(), ['Data Analyst', 'ML Engineer'])
+
+        self.as_recruiter('patch', f'/api/jobs/jobs/{self.jobs[2].id}/toggle_active/')
+        self.assertEqual(self.suggested(), ['ML Engineer'])
+
+        ml_job = Job.objects.get(title='ML Engineer')
+        self.as_recruiter('delete', f'/api/jobs/jobs/{ml_job.id}/')
+        self.assertEqual(self.suggested(), [])
+
+    def test_least_recently_used_seeker_is_evicted(self):
+        cache = MatchCache(max_entries=2)
+        cache.set(1, (1,), 1, 'percentage', 'one')
+        cache.set(2, (1,), 1, 'percentage', 'two')
+        self.assertEqual(cache.get(1, (1,), 1, 'percentage'), 'one')
+        cache.set(3, (1,), 1, 'percentage', 'three')
+
+        self.assertIsNone(cache.get(2, (1,), 1, 'percentage'))
+        self.assertEqual(cache.get(1, (1,), 1, 'percentage'), 'one')
+        self.assertEqual(cache.get(3, (1,), 1, 'percentage'), 'three')
+        self.assertEqual(cache.stats()['evictions'], 1)
+        self.assertEqual(cache.stats()['size'], 2)
+
+    def test_stale_skills_or_version_miss(self):
+        cache = MatchCache(max_entries=2)
+        cache.set(1, (1, 2), 1, 'percentage', 'cached')
+        self.assertIsNone(cache.get(1, (1, 3), 1, 'percentage'))
+        self.assertIsNone(cache.get(1, (1, 2), 2, 'percentage'))
+        self.assertIsNone(cache.get(1, (1, 2), 1, 'idf'))
+        self.assertEqual(cache.get(1, (1, 2), 1, 'percentage'), 'cached')
+
+
+class CandidatesForJobTests(QueryCountAssertionsMixin, JobTestCase):
+    def setUp(self):
+        super().setUp()
+        self.job = self.jobs[0]  # Python, Django
+        self.url = f'/api/match/candidates-for-job/{self.job.id}/'
+        seekers = [
+            ('both', ['Django', 'Python'], True),
+            ('python', ['python', 'Figma'], True),
+            ('django', ['Django'], True),
+            ('designer', ['Figma'], True),
+            ('inactive', ['Python', 'Django'], False),
+        ]
+        self.seekers = {}
+        for name, skills, is_active in seekers:
+            self.seekers[name] = User.objects.create_user(
+                email=f'{name}@example.com', password=None, full_name=name.title(),
+                role='job_seeker', skills=skills, is_active=is_active
+            )
+        # Recruiters are never candidates, whatever their skills
+        User.objects.create_user(email='other@example.com', password=None, full_name='Other',
+                                 role='recruiter', skills=['Python', 'Django'])
+        self.client.force_authenticate(self.recruiter)
+
+    def test_ranked_by_overlap_then_user_id(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data['count'], 3)
+        results = response.data['results']
+        self.assertEqual([row['email'] for row in results],
+                         ['both@example.com', 'python@example.com', 'django@example.com'])
+        self.assertEqual([row['match_score'] for row in results], [100.0, 50.0, 50.0])
+        self.assertEqual(results[1]['matching_skills'], ['Python'])
+        self.assertEqual(results[1]['missing_skills'], ['Django'])
+
+    def test_pagination(self):
+        first = self.client.get(self.url, {'page_size': 2})
+        self.assertEqual([row['email'] for row in first.data['results']],
+                         ['both@example.com', 'python@example.com'])
+        self.assertIsNotNone(first.data['next'])
+        second = self.client.get(first.data['next'])
+        self.assertEqual([row['email'] for row in second.data['results']], ['django@example.com'])
+        self.assertIsNone(second.data['next'])
+
+    def test_only_the_page_is_loaded(self):
+        # job, ranked count, ranked page, page users
+        self.assertRequestQueries(4, self.url, data={'page_size': 1})
+
+    def test_permissions(self):
+        other = User.objects.get(email='other@example.com')
+        self.client.force_authenticate(other)
+        self.assertEqual(self.client.get(self.url).status_code, 403)
+        admin = User.objects.create_user(email='admin@example.com', password=None,
+                                         full_name='Admin', role='admin')
+        self.client.force_authenticate(admin)
+        self.assertEqual(self.client.get(self.url).data['count'], 3)
+
+    def test_job_without_skills(self):
+        job = self.create_job(required_skills=[])
+        response = self.client.get(f'/api/match/candidates-for-job/{job.id}/')
+        self.assertEqual(response.data['results'], [])
+
+
+class BatchScorerTests(JobTestCase):
+    def create_fixture_jobs(self):
+        # The synthetic generator expects an empty catalogue
+        return []
+
+    def setUp(self):
+        super().setUp()
+        generator = CatalogueGenerator(seed=7, n_skills=30)
+        generator.create_skills()
+        recruiters, self.seeker_ids = generator.create_users(30, n_recruiters=3)
+        generator.create_jobs(150, recruiters)
+        self.jobs_for_scorer = list(
+            Job.objects.filter(is_active=True).exclude(skill_ids=[]).values_list('id', 'skill_ids')
+        )
+
+    def test_top_ten_matches_jobs_for_me(self):
+        scorer = BatchScorer([job_id for job_id, _ in self.jobs_for_scorer],
+                             [skill_ids for _, skill_ids in self.jobs_for_scorer])
+        seekers = list(User.objects.filter(id__in=self.seeker_ids).order_by('id'))
+        batch = scorer.score([seeker.skill_ids for seeker in seekers], top_n=10)
+
+        compared = 0
+        for seeker, expected in zip(seekers, batch):
+            self.client.force_authenticate(seeker)
+            response = self.client.get('/api/match/jobs-for-me/', {'page_size': 10})
+            online = [(job['id'], job['match_score']) for job in response.data['suggested_jobs']]
+            self.assertEqual(online, [(job_id, round(score, 2)) for job_id, score in expected],
+                             f'seeker {seeker.id}')
+            compared += bool(online)
+        # The catalogue is dense enough that most seekers have matches to compare
+        self.assertGreater(compared, 20)
+
+    def test_compute_matches_stores_the_same_ranking(self):
+        call_command('compute_matches', '--top', '5', '--chunk-size', '7', stdout=io.StringIO())
+        seeker = User.objects.filter(id__in=self.seeker_ids).order_by('id').first()
+        self.client.force_authenticate(seeker)
+        response = self.client.get('/api/match/jobs-for-me/', {'page_size': 5})
+        stored = list(JobMatch.objects.filter(user=seeker).order_by('rank').values_list('job_id', 'match_score'))
+        self.assertEqual(stored, [(job['id'], job['match_score']) for job in response.data['suggested_jobs']])
+
+
+class JobsForMeCursorTests(QueryCountAssertionsMixin, JobTestCase):
+    url = '/api/match/jobs-for-me/'
+
+    def setUp(self):
+        super().setUp()
+        # Scores: 100 (x3, a tie), 50 (x3, a tie), 33.33; plus one job below the floor
+        for index, skills in enumerate([['Python'], ['Python'], ['Python'],
+                                        ['Python', 'Rust'], ['Go', 'Python'], ['Python', 'Figma'],
+                                        ['Python', 'Rust', 'Go'], ['Python', 'Rust', 'Go', 'Figma']]):
+            self.create_job(title=f'Match {index}', required_skills=skills)
+        self.seeker = User.objects.create_user(email='seeker@example.com', password=None,
+                                               full_name='Seeker', role='job_seeker', skills=['Python'])
+        self.client.force_authenticate(self.seeker)
+
+    def walk(self, page_size):
+        results = []
+        response = self.client.get(self.url, {'page_size': page_size})
+        while True:
+            results.extend((job['id'], job['match_score']) for job in response.data['suggested_jobs'])
+            if not response.data['next']:
+                return results, response.data['total_matches_found']
+            response = self.client.get(response.data['next'])
+
+    def test_cursor_pages_follow_one_ranking(self):
+        everything, total = self.walk(50)
+        self.assertEqual(total, 9)
+        self.assertEqual(len(everything), 9)
+        scores = [score for _, score in everything]
+        self.assertEqual(scores, sorted(scores, reverse=True))
+        # Ties are ordered by ascending job id
+        for (id_a, score_a), (id_b, score_b) in zip(everything, everything[1:]):
+            if score_a == score_b:
+                self.assertLess(id_a, id_b)
+        for page_size in (1, 2, 4):
+            self.assertEqual(self.walk(page_size), (everything, 9))
+
+    def test_deeper_pages_are_not_rescored(self):
+        first = self.client.get(self.url, {'page_size': 2})
+        misses = match_cache.stats()['misses']
+        # Only the page's job rows: the cached ranking is sliced for the cursor
+        self.assertRequestQueries(1, first.data['next'])
+        self.assertEqual(match_cache.stats()['misses'], misses)
+
+    def test_cursors_past_the_cached_prefix_are_scored_on_demand(self):
+        everything, _ = self.walk(50)
+        match_cache.clear()
+        original = match_cache.max_ranked
+        match_cache.max_ranked = 3
+        try:
+            self.assertEqual(self.walk(2), (everything, 9))
+        finally:
+            match_cache.max_ranked = original
+
+    def test_invalid_cursor(self):
+        for cursor in ('not-base64!', 'Zm9v', encode_cursor('x', 1)):
+            response = self.client.get(self.url, {'cursor': cursor})
+            self.assertEqual(response.status_code, 400)
+            self.assertEqual(response.data, {'error': 'Invalid cursor'})
+
+
+class RankingTests(JobTestCase):
+    def test_page_slices_after_the_cursor(self):
+        ranking = Ranking.build([(50.0, 4), (100.0, 2), (50.0, 3), (100.0, 1), (40.0, 9)], limit=10)
+        self.assertEqual(ranking.items, [(100.0, 1), (100.0, 2), (50.0, 3), (50.0, 4), (40.0, 9)])
+        self.assertEqual(ranking.page(2), ([(100.0, 1), (100.0, 2)], True))
+        self.assertEqual(ranking.page(2, after=(100.0, 2)), ([(50.0, 3), (50.0, 4)], True))
+        self.assertEqual(ranking.page(2, after=(50.0, 4)), ([(40.0, 9)], False))
+
+    def test_truncated_ranking_defers_past_its_prefix(self):
+        ranking = Ranking.build([(float(score), score) for score in range(10)], limit=4)
+        self.assertEqual(ranking.total, 10)
+        self.assertEqual(ranking.page(4), ([(9.0, 9), (8.0, 8), (7.0, 7), (6.0, 6)], True))
+        self.assertIsNone(ranking.page(2, after=(7.0, 7)))
+
+
+def idf(total, df):
+    return math.log((total + 1) / (df + 1)) + 1
+
+
+class IdfScoringTests(JobTestCase):
+    url = '/api/match/jobs-for-me/?scoring=idf'
+
+    def setUp(self):
+        super().setUp()
+        self.seeker = User.objects.create_user(email='seeker@example.com', password=None,
+                                               full_name='Seeker', role='job_seeker', skills=['Django'])
+        self.client.force_authenticate(self.seeker)
+
+    def scores(self):
+        response = self.client.get(self.url)
+        return {job['title']: job['match_score'] for job in response.data['suggested_jobs']}
+
+    def test_rare_skills_weigh_more(self):
+        # Three active jobs; Python is required by two of them, Django by one
+        django, python = idf(3, 1), idf(3, 2)
+        self.assertEqual(self.scores(), {'Backend Engineer': round(django / (django + python) * 100, 2)})
+        percentage = self.client.get('/api/match/jobs-for-me/')
+        self.assertEqual(percentage.data['suggested_jobs'][0]['match_score'], 50.0)
+
+    def test_active_job_total_is_maintained_incrementally(self):
+        def total():
+            return CatalogueStats.objects.get(pk=1).active_jobs
+
+        self.assertEqual(total(), 3)
+        job = self.create_job(required_skills=['Go'])
+        self.create_job(required_skills=[])
+        self.assertEqual(total(), 4)
+        job.is_active = False
+        job.save()
+        self.assertEqual(total(), 3)
+        job.is_active = True
+        job.save()
+        self.jobs[0].delete()
+        self.assertEqual(total(), 3)
+        refresh_skill_stats()
+        self.assertEqual(total(), 3)
+
+    def test_weights_refresh_outside_the_request(self):
+        self.scores()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.create_job(title='Django Developer', required_skills=['Django'])
+
+        queued = []
+        with mock.patch('matching.stats.run_in_background', lambda *call: queued.append(call)):
+            with self.assertNumQueries(2):
+                stale = self.scores()
+            self.scores()
+        # The old weights are served and only one refresh is started
+        self.assertEqual(stale['Backend Engineer'], round(idf(3, 1) / (idf(3, 1) + idf(3, 2)) * 100, 2))
+        self.assertEqual(len(queued), 1)
+
+        func, version = queued[0]
+        func(version)
+        self.assertEqual(skill_weights.current().version, version)
+        self.assertEqual(self.scores(), {'Django Developer': 100.0, 'Backend Engineer': 50.0})
+
+
+class SkillAnalysisTests(QueryCountAssertionsMixin, JobTestCase):
+    url = '/api/match/skill-analysis/'
+
+    def setUp(self):
+        super().setUp()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.seeker = User.objects.create_user(email='seeker@example.com', password=None,
+                                                   full_name='Seeker', role='job_seeker', skills=['python', 'Golang'])
+        self.client.force_authenticate(self.seeker)
+
+    def weekly(self, response, skill):
+        demand = next(row for row in response.data['skill_demand'] if row['skill'] == skill)
+        return {row['week_start']: row['jobs_posted'] for row in demand['weekly_postings'] if row['jobs_posted']}
+
+    def test_demand_trends_and_gaps(self):
+        response = self.assertRequestQueries(3, self.url, data={'weeks': 2})
+        this_week = week_start(timezone.now())
+        self.assertEqual(response.data['skills'], ['Python', 'Go'])
+        self.assertEqual(
+            [(row['skill'], row['active_jobs'], len(row['weekly_postings'])) for row in response.data['skill_demand']],
+            [('Python', 2, 2), ('Go', 0, 2)]
+        )
+        self.assertEqual(self.weekly(response, 'Python'), {this_week: 2})
+        self.assertEqual(response.data['top_missing_skills'], [
+            {'skill': 'Django', 'active_jobs': 1},
+            {'skill': 'Figma', 'active_jobs': 1},
+            {'skill': 'SQL', 'active_jobs': 1},
+        ])
+
+    def test_counts_follow_job_writes(self):
+        job = self.create_job(required_skills=['Go'])
+        self.jobs[0].is_active = False
+        self.jobs[0].save()
+        response = self.client.get(self.url)
+        demand = {row['skill']: row['active_jobs'] for row in response.data['skill_demand']}
+        self.assertEqual(demand, {'Python': 1, 'Go': 1})
+        # Deactivated jobs still count as posted that week
+        self.assertEqual(self.weekly(response, 'Go'), {week_start(job.created_at): 1})
+        self.assertEqual(sum(self.weekly(response, 'Python').values()), 2)
+
+    def test_backfill_rebuilds_weekly_demand(self):
+        weeks_ago = timezone.now() - timedelta(weeks=3)
+        Job.objects.filter(pk=self.jobs[2].pk).update(created_at=weeks_ago)
+        SkillWeeklyDemand.objects.all().delete()
+        SkillWeeklyDemand.objects.create(skill=Skill.objects.get(key='go'), week_start=week_start(weeks_ago),
+                                         jobs_posted=5)
+
+        call_command('backfill_skills', stdout=io.StringIO())
+
+        response = self.client.get(self.url)
+        self.assertEqual(self.weekly(response, 'Python'), {
+            week_start(weeks_ago): 1,
+            week_start(timezone.now()): 1,
+        })
+        self.assertEqual(self.weekly(response, 'Go'), {})
+
+    def test_seekers_only(self):
+        self.client.force_authenticate(self.recruiter)
+        self.assertEqual(self.client.get(self.url).status_code, 403)
+        self.client.force_authenticate(User.objects.create_user(
+            email='empty@example.com', password=None, full_name='Empty', role='job_seeker'
+        ))
+        self.assertEqual(self.client.get(self.url).data['skills_count'], 0)
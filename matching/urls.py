@@ -1,8 +1,10 @@
 # matching/urls.py
 from django.urls import path
-from .views import jobs_for_me, skill_analysis
+from .views import jobs_for_me, candidates_for_job, skill_analysis, cache_stats
 
 urlpatterns = [
     path('jobs-for-me/', jobs_for_me, name='jobs-for-me'),
+    path('candidates-for-job/<int:job_id>/', candidates_for_job, name='candidates-for-job'),
     path('skill-analysis/', skill_analysis, name='skill-analysis'),
+    path('cache-stats/', cache_stats, name='match-cache-stats'),
 ]
\ No newline at end of file
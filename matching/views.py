@@ -2,13 +2,50 @@
 from rest_framework import permissions, status
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.response import Response
-from django.db.models import Q
+from rest_framework.pagination import PageNumberPagination
+from rest_framework.utils.urls import replace_query_param
+from django.db.models import Q, Count
+from django.shortcuts import get_object_or_404
+from django.utils import timezone
+from datetime import timedelta
+
+from jobs.cache import catalogue_version
+from .cache import match_cache
+from .models import JobSkill, Skill, SkillWeeklyDemand, UserSkill
+from .ranking import MIN_MATCH_PERCENTAGE, Ranking, decode_cursor, encode_cursor, ranked_page
+from .skills import canonicalize, registry
+from .stats import skill_weights, week_start
+
+MAX_SUGGESTIONS_PAGE_SIZE = 50
+SCORING_MODES = ('percentage', 'idf')
+MAX_TREND_WEEKS = 26
+MISSING_SKILLS_LIMIT = 10
 
 # Import locally to avoid circular imports
 def get_job_serializer():
     from jobs.serializers import JobSerializer
     return JobSerializer
 
+def get_user_serializer():
+    from users.serializers import UserListSerializer
+    return UserListSerializer
+
+
+def _int_param(request, name, default, maximum):
+    """Read a positive integer query parameter, clamped to ``maximum``."""
+    try:
+        value = int(request.query_params.get(name, default))
+    except ValueError:
+        return default
+    return min(max(value, 1), maximum)
+
+
+class CandidatePagination(PageNumberPagination):
+    page_size = 20
+    page_size_query_param = 'page_size'
+    max_page_size = 100
+
+
 @api_view(['GET'])
 @permission_classes([permissions.IsAuthenticated])
 def jobs_for_me(request):
@@ -30,60 +67,168 @@ def jobs_for_me(request):
             'suggested_jobs': []
         })
     
-    # Get all active jobs
-    jobs = Job.objects.filter(is_active=True)
-    
-    # Score jobs based on skill match
-    scored_jobs = []
-    for job in jobs:
-        job_skills = job.required_skills or []
-        
-        # Calculate match score
-        if job_skills:
-            # Convert to sets for comparison
-            user_skill_set = set(user_skills)
-            job_skill_set = set(job_skills)
-            
-            # Calculate matching skills
-            matching_skills = user_skill_set.intersection(job_skill_set)
-            
-            # Calculate match percentage
-            if job_skill_set:
-                match_percentage = (len(matching_skills) / len(job_skill_set)) * 100
+    page_size = _int_param(request, 'page_size', default=10, maximum=MAX_SUGGESTIONS_PAGE_SIZE)
+    try:
+        after = decode_cursor(request.query_params['cursor']) if 'cursor' in request.query_params else None
+    except ValueError:
+        return Response(
+            {'error': 'Invalid cursor'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    
+    # 'percentage' is the share of the job's skills the seeker has; 'idf' weights
+    # each skill by how rare it is across active jobs
+    scoring = request.query_params.get('scoring', 'percentage')
+    if scoring not in SCORING_MODES:
+        return Response(
+            {'error': f'Invalid scoring mode. Must be one of: {", ".join(SCORING_MODES)}'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    
+    user_skill_ids = user.skill_ids or canonicalize(user_skills, create=False)[1]
+    
+    user_skill_set = frozenset(user_skill_ids)
+    
+    # Only active jobs that share at least one skill with the seeker are scored
+    candidates = Job.objects.filter(
+        id__in=JobSkill.objects.filter(
+            skill_id__in=user_skill_ids,
+            is_active=True
+        ).values('job_id')
+    ).values_list('id', 'skill_ids')
+    
+    weights = skill_weights.current() if scoring == 'idf' else None
+    
+    def score_candidates():
+        for job_id, job_skill_ids in candidates.iterator():
+            if not job_skill_ids:
+                continue
+            # Shared skills are hash lookups into the seeker's skill-id set
+            if weights is None:
+                matched = sum(1 for i in job_skill_ids if i in user_skill_set)
+                match_percentage = (matched / len(job_skill_ids)) * 100
             else:
-                match_percentage = 0
+                matched = sum(weights.weight(i) for i in job_skill_ids if i in user_skill_set)
+                match_percentage = matched / sum(weights.weight(i) for i in job_skill_ids) * 100
             
             # Only include jobs with at least 30% match
-            if match_percentage >= 30:
-                scored_jobs.append({
-                    'job': job,
-                    'match_score': match_percentage,
-                    'matching_skills': list(matching_skills),
-                    'missing_skills': list(job_skill_set - user_skill_set)
-                })
+            if match_percentage >= MIN_MATCH_PERCENTAGE:
+                yield match_percentage, job_id
+    
+    # Score once per seeker and catalogue version; every cursor slices the cached ranking
+    skills_key = tuple(user_skill_ids)
+    version = catalogue_version()
+    if weights is not None:
+        # Weights may lag the catalogue while they refresh; rank again once they catch up
+        version = (version, weights.version)
+    ranking = match_cache.get(user.id, skills_key, version, scoring)
+    if ranking is None:
+        ranking = Ranking.build(score_candidates(), match_cache.max_ranked)
+        match_cache.set(user.id, skills_key, version, scoring, ranking)
     
-    # Sort by match score (highest first)
-    scored_jobs.sort(key=lambda x: x['match_score'], reverse=True)
+    sliced = ranking.page(page_size, after)
+    if sliced is not None:
+        page, has_more = sliced
+        total = ranking.total
+    else:
+        # Past the cached prefix: keep only the requested page in memory
+        page, total, has_more = ranked_page(score_candidates(), page_size, after)
     
     # Prepare response
     JobSerializer = get_job_serializer()
+    jobs = Job.objects.select_related('created_by').in_bulk([job_id for _, job_id in page])
     result = []
-    for scored_job in scored_jobs[:10]:  # Return top 10 matches
-        job_data = JobSerializer(scored_job['job']).data
-        job_data['match_score'] = round(scored_job['match_score'], 2)
-        job_data['matching_skills'] = scored_job['matching_skills']
-        job_data['missing_skills'] = scored_job['missing_skills']
+    for match_percentage, job_id in page:
+        job = jobs.get(job_id)
+        if job is None:
+            # Deleted since the ranking was cached; the version bump on commit drops it
+            continue
+        job_data = JobSerializer(job).data
+        job_data['match_score'] = round(match_percentage, 2)
+        job_data['matching_skills'] = registry.names(
+            [i for i in job.skill_ids if i in user_skill_set]
+        )
+        job_data['missing_skills'] = registry.names(
+            [i for i in job.skill_ids if i not in user_skill_set]
+        )
         result.append(job_data)
     
-    return Response({
+    next_cursor = encode_cursor(page[-1][0], page[-1][1]) if has_more else None
+    payload = {
         'user_skills': user_skills,
-        'total_matches_found': len(scored_jobs),
+        'total_matches_found': total,
+        'scoring': scoring,
+        'next_cursor': next_cursor,
+        'next': (
+            replace_query_param(request.build_absolute_uri(), 'cursor', next_cursor)
+            if next_cursor else None
+        ),
         'suggested_jobs': result
-    })
+    }
+    return Response(payload)
+
+
+@api_view(['GET'])
+@permission_classes([permissions.IsAuthenticated])
+def candidates_for_job(request, job_id):
+    """GET /match/candidates-for-job/{job_id} - Rank job seekers against a job"""
+    from jobs.models import Job
+    from users.models import User
+    
+    job = get_object_or_404(Job, id=job_id)
+    
+    if job.created_by_id != request.user.id and request.user.role != 'admin':
+        return Response(
+            {'error': 'Permission denied'},
+            status=status.HTTP_403_FORBIDDEN
+        )
+    
+    job_skill_ids = job.skill_ids or []
+    if not job_skill_ids:
+        return Response({
+            'message': 'Add required skills to this job to get candidate matches',
+            'count': 0,
+            'results': []
+        })
+    
+    # Same floor as jobs-for-me, expressed as a minimum number of shared skills
+    min_overlap = -(-MIN_MATCH_PERCENTAGE * len(job_skill_ids) // 100)
+    
+    # Rank seekers by overlap straight from the skill index; only the page is loaded
+    ranked = (
+        UserSkill.objects
+        .filter(skill_id__in=job_skill_ids, is_seeker=True)
+        .values('user_id')
+        .annotate(overlap=Count('skill_id'))
+        .filter(overlap__gte=min_overlap)
+        .order_by('-overlap', 'user_id')
+    )
+    
+    paginator = CandidatePagination()
+    page = paginator.paginate_queryset(ranked, request)
+    candidates = User.objects.in_bulk([row['user_id'] for row in page])
+    
+    UserListSerializer = get_user_serializer()
+    result = []
+    for row in page:
+        candidate = candidates[row['user_id']]
+        candidate_skill_set = frozenset(candidate.skill_ids or [])
+        candidate_data = UserListSerializer(candidate).data
+        candidate_data['match_score'] = round(row['overlap'] / len(job_skill_ids) * 100, 2)
+        candidate_data['matching_skills'] = registry.names(
+            [i for i in job_skill_ids if i in candidate_skill_set]
+        )
+        candidate_data['missing_skills'] = registry.names(
+            [i for i in job_skill_ids if i not in candidate_skill_set]
+        )
+        result.append(candidate_data)
+    
+    return paginator.get_paginated_response(result)
+
 @api_view(['GET'])
 @permission_classes([permissions.IsAuthenticated])
 def skill_analysis(request):
-    """GET /match/skill-analysis - Analyze user's skills"""
+    """GET /match/skill-analysis - Market demand for the user's skills and gaps"""
 
     user = request.user
 
@@ -102,8 +247,58 @@ def skill_analysis(request):
             'skills': []
         })
 
+    weeks = _int_param(request, 'weeks', default=8, maximum=MAX_TREND_WEEKS)
+    user_skill_ids = user.skill_ids or canonicalize(user_skills, create=False)[1]
+    
+    # Everything below reads the maintained aggregates; the Job table is never scanned
+    demand = dict(
+        Skill.objects.filter(id__in=user_skill_ids).order_by().values_list('id', 'active_job_count')
+    )
+    
+    first_week = week_start(timezone.now()) - timedelta(weeks=weeks - 1)
+    trend_weeks = [first_week + timedelta(weeks=i) for i in range(weeks)]
+    trends = {skill_id: dict.fromkeys(trend_weeks, 0) for skill_id in user_skill_ids}
+    weekly_rows = SkillWeeklyDemand.objects.filter(
+        skill_id__in=user_skill_ids,
+        week_start__gte=first_week
+    ).order_by().values_list('skill_id', 'week_start', 'jobs_posted')
+    for skill_id, week, jobs_posted in weekly_rows:
+        trends[skill_id][week] = jobs_posted
+    
+    skill_demand = []
+    for skill_id, name in zip(user_skill_ids, registry.names(user_skill_ids)):
+        skill_demand.append({
+            'skill': name,
+            'active_jobs': demand.get(skill_id, 0),
+            'weekly_postings': [
+                {'week_start': week, 'jobs_posted': count}
+                for week, count in trends[skill_id].items()
+            ]
+        })
+    
+    missing = (
+        Skill.objects
+        .filter(active_job_count__gt=0)
+        .exclude(id__in=user_skill_ids)
+        .order_by('-active_job_count', 'name')
+        .values_list('name', 'active_job_count')[:MISSING_SKILLS_LIMIT]
+    )
+    
     return Response({
         'skills_count': len(user_skills),
         'skills': user_skills,
+        'skill_demand': skill_demand,
+        'top_missing_skills': [
+            {'skill': name, 'active_jobs': active_jobs}
+            for name, active_jobs in missing
+        ],
+        'weeks': weeks,
         'analysis': 'Skills successfully analyzed'
     })
+
+
+@api_view(['GET'])
+@permission_classes([permissions.IsAdminUser])
+def cache_stats(request):
+    """GET /match/cache-stats - Hit/miss counters for the jobs-for-me cache"""
+    return Response(match_cache.stats())
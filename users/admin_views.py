@@ -1,10 +1,14 @@
 # users/admin_views.py
 from rest_framework import permissions, status
-from rest_framework.decorators import api_view, permission_classes
+from rest_framework.decorators import api_view, parser_classes, permission_classes
+from rest_framework.parsers import MultiPartParser
 from rest_framework.response import Response
+from django.http import StreamingHttpResponse
 from django.shortcuts import get_object_or_404
 from .models import User
+from jobs.bulk import FILE_TYPES, export_rows, file_type_for, import_jobs, text_stream
 from jobs.models import Job
+from afriremotely.streaming import CONTENT_TYPES
 
 
 def get_job_serializer():
@@ -73,7 +77,7 @@ def admin_create_job(request):
             )
         
         job = serializer.save(created_by=created_by)
-        return Response(JobSerializer(job).data, status=status.HTTP_201_CREATED)
+        return Response(JobSerializer(job, context={'request': request}).data, status=status.HTTP_201_CREATED)
     return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 @api_view(['DELETE'])
@@ -90,4 +94,45 @@ def admin_delete_job(request, id):
     job.delete()
     return Response({
         'message': f'Job "{job.title}" has been deleted'
-    })
\ No newline at end of file
+    })
+
+@api_view(['POST'])
+@permission_classes([permissions.IsAdminUser])
+@parser_classes([MultiPartParser])
+def admin_import_jobs(request):
+    """POST /admin/jobs/import/ - Bulk-create jobs from an uploaded CSV or JSON Lines file"""
+    upload = request.FILES.get('file')
+    if upload is None:
+        return Response(
+            {'error': 'file is required'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    
+    file_type = request.query_params.get('file_type') or file_type_for(upload.name)
+    if file_type not in FILE_TYPES:
+        return Response(
+            {'error': f'Invalid file_type. Must be one of: {", ".join(FILE_TYPES)}'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    
+    # Rows are validated and inserted batch by batch; rows without a created_by_id belong to the admin
+    report = import_jobs(text_stream(upload.file), file_type, created_by=request.user)
+    return Response(
+        report,
+        status=status.HTTP_201_CREATED if report['created'] else status.HTTP_400_BAD_REQUEST
+    )
+
+@api_view(['GET'])
+@permission_classes([permissions.IsAdminUser])
+def admin_export_jobs(request):
+    """GET /admin/jobs/export/?file_type=csv|jsonl - Stream the whole job catalogue"""
+    file_type = request.query_params.get('file_type', 'csv')
+    if file_type not in FILE_TYPES:
+        return Response(
+            {'error': f'Invalid file_type. Must be one of: {", ".join(FILE_TYPES)}'},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    
+    response = StreamingHttpResponse(export_rows(file_type), content_type=CONTENT_TYPES[file_type])
+    response['Content-Disposition'] = f'attachment; filename="jobs.{file_type}"'
+    return response
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.8 on 2026-10-18 14:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0004_alter_user_options'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='skill_ids',
+            field=models.JSONField(blank=True, default=list, editable=False),
+        ),
+    ]
@@ -37,6 +37,7 @@ class User(AbstractBaseUser, PermissionsMixin):  # Add PermissionsMixin
     role = models.CharField(max_length=20, choices=ROLE_CHOICES, default="job_seeker")
     bio = models.TextField(blank=True, null=True)
     skills = models.JSONField(default=list, blank=True)
+    skill_ids = models.JSONField(default=list, blank=True, editable=False)
     portfolio_links = models.JSONField(default=list, blank=True)
     image_url = models.URLField(blank=True, null=True)
     is_verified = models.BooleanField(default=False)
@@ -4,6 +4,7 @@ from django.contrib.auth import get_user_model
 from django.contrib.auth.password_validation import validate_password
 from rest_framework_simplejwt.tokens import RefreshToken
 from .models import User
+from matching.skills import canonicalize
 
 class UserRegistrationSerializer(serializers.ModelSerializer):
     password = serializers.CharField(write_only=True, required=True, validators=[validate_password])
@@ -47,6 +48,13 @@ class UserUpdateSerializer(serializers.ModelSerializer):
     class Meta:
         model = User
         fields = ['full_name', 'bio', 'skills', 'portfolio_links', 'image_url']
+    
+    def validate_skills(self, value):
+        if not isinstance(value, list) or not all(isinstance(skill, str) for skill in value):
+            raise serializers.ValidationError("Skills must be a list of strings.")
+        # Map spellings and aliases ("python ", "Py") onto the canonical vocabulary
+        names, _ = canonicalize(value)
+        return names
         
     def update(self, instance, validated_data):
         # Handle skills and portfolio_links updates
@@ -37,6 +37,12 @@ urlpatterns = [
     path('admin/jobs/', 
          admin_views.admin_create_job, 
          name='admin-create-job'),
+    path('admin/jobs/import/', 
+         admin_views.admin_import_jobs, 
+         name='admin-import-jobs'),
+    path('admin/jobs/export/', 
+         admin_views.admin_export_jobs, 
+         name='admin-export-jobs'),
     path('admin/jobs/<int:id>/', 
          admin_views.admin_delete_job, 
          name='admin-delete-job'),
@@ -16,6 +16,7 @@ from .serializers import (
     UserUpdateSerializer,
     UserListSerializer
 )
+from matching.cache import match_cache
 
 class UserViewSet(viewsets.ModelViewSet):
     queryset = User.objects.all()
@@ -107,7 +108,10 @@ class UserProfileView(APIView):
     def put(self, request):
         serializer = UserUpdateSerializer(request.user, data=request.data, partial=True)
         if serializer.is_valid():
+            old_skill_ids = list(request.user.skill_ids or [])
             serializer.save()
+            if request.user.skill_ids != old_skill_ids:
+                match_cache.invalidate(request.user.id)
             return Response({
                 'message': 'Profile updated successfully',
                 'user': UserProfileSerializer(request.user).data